@@ -2,16 +2,178 @@
 # @Author: Eduardo Santos
 # @Date:   2023-04-06 14:55:17
 # @Last Modified by:   Rafael Direito
-# @Last Modified time: 2023-04-26 23:36:13
+# @Last Modified time: 2026-10-18 10:12:41
 
+import json
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait, \
+    FIRST_COMPLETED
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode
 import requests
+from requests.adapters import HTTPAdapter
 from helpers import constants as Constants
-from CICDManagerAPIClient.test_classes import Test
+from helpers.tracing import tracer
+from CICDManagerAPIClient.catalog_schema import validate_tests_payload, \
+    validate_testbeds_payload
+from CICDManagerAPIClient.exceptions import CICDManagerAPIError, \
+    CICDManagerConnectionError, CICDManagerTimeoutError, \
+    DeadlineExceededError, CICDManagerHTTPError, CICDManagerOfflineError
+from CICDManagerAPIClient.catalog_stream import iter_testbeds_with_tests, \
+    iter_testbed_tests, iter_catalog_tests
 
 
 class CICDManagerAPIClient:
-    def __init__(self):
+    '''
+    Client for the CI/CD Manager API.
+
+    All the requests go through a single pooled `requests.Session`, so the
+    TCP+TLS connections to the CI/CD Manager are kept alive and reused
+    between calls. The underlying urllib3 pool is thread-safe, which allows
+    one client to be shared by several concurrent workers.
+
+    GET requests are also memoized for the lifetime of the client (i.e., one
+    CLI invocation). Identical requests that are in-flight or already
+    completed are served from the same response, instead of being sent
+    again to the CI/CD Manager.
+
+    When a `CatalogCache` is given, responses are persisted on disk and
+    served from there while fresh. Stale responses are revalidated with
+    the CI/CD Manager through `If-None-Match`/`If-Modified-Since`. In
+    offline mode, only cached responses are served, regardless of their age.
+
+    Responses are checked against the catalog schema once, when fetched,
+    and the tests built while checking them are kept for the lifetime of
+    the client. Cached responses are marked as checked, and the
+    `/tests/all` catalog is then parsed incrementally, so only the tests of
+    the requested testbed are ever decoded.
+
+    Requests are bounded by connect and read timeouts, and by an optional
+    overall deadline, counted from the first request (so the time spent
+    answering prompts before it does not count). Failed requests are
+    retried with exponential backoff and full jitter, honoring the
+    Retry-After header of 429/503 responses. Responses asking to wait
+    longer than the maximum backoff are not retried. Optionally, a request
+    that did not answer after `hedge_after` seconds is hedged with a second
+    one, and the first response is used. Failures raise a
+    `CICDManagerAPIError`.
+    Timeouts must be positive: requests cannot wait for no time at all.
+    '''
+
+    def __init__(self, pool_connections=None, pool_maxsize=None, cache=None,
+                 offline=False, memoize=True, connect_timeout=None,
+                 read_timeout=None, deadline=None, retries=None,
+                 hedge_after=None):
         self.base_url = Constants.CI_CD_SERVICE_URL
+        self.pool_connections = pool_connections or \
+            Constants.CI_CD_SERVICE_POOL_CONNECTIONS
+        self.pool_maxsize = pool_maxsize or \
+            Constants.CI_CD_SERVICE_POOL_MAXSIZE
+        self._stats_lock = threading.Lock()
+        self._requests_made = 0
+        self._requests_coalesced = 0
+        self._memo_lock = threading.Lock()
+        self._memo = {}
+        # Tests built while validating the /tests/all responses
+        self._catalogs = {}
+        self.memoize = memoize
+        self.cache = cache
+        self.offline = offline
+        # Explicit zeros are not replaced by the defaults
+        self.connect_timeout = connect_timeout \
+            if connect_timeout is not None \
+            else Constants.CI_CD_SERVICE_CONNECT_TIMEOUT
+        self.read_timeout = read_timeout if read_timeout is not None \
+            else Constants.CI_CD_SERVICE_READ_TIMEOUT
+        if self.connect_timeout <= 0 or self.read_timeout <= 0:
+            raise ValueError(
+                "The connect and read timeouts must be positive, not " +
+                f"{self.connect_timeout} and {self.read_timeout}"
+            )
+        self.deadline = deadline
+        # When the deadline expires, set by the first request
+        self._deadline_at = None
+        self.retries = retries if retries is not None \
+            else Constants.CI_CD_SERVICE_RETRIES
+        self.hedge_after = hedge_after
+        self._requests_retried = 0
+        self._requests_hedged = 0
+        self._hedging_executor = None
+        self._random = random.Random()
+        self.session = self.__create_session()
+
+    def __create_session(self):
+        session = requests.Session()
+        # Block instead of discarding connections when all the pooled
+        # connections are in use, so they are always returned to the pool
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=True
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        '''
+        Closes all the pooled connections and persists the cache statistics.
+        '''
+        if self._hedging_executor is not None:
+            self._hedging_executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+        if self.cache is not None:
+            self.cache.flush_stats()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def connection_stats(self):
+        '''
+        Debug counters regarding the connection reuse.
+
+        Returns
+        -------
+            Dictionary with the number of requests made, the number of
+            connections opened to the CI/CD Manager and the number of
+            requests that reused an already opened connection.
+        '''
+        connections_opened = 0
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for pool_key in pools.keys():
+                pool = pools.get(pool_key)
+                if pool is not None:
+                    connections_opened += pool.num_connections
+
+        with self._stats_lock:
+            requests_made = self._requests_made
+            requests_coalesced = self._requests_coalesced
+            requests_retried = self._requests_retried
+            requests_hedged = self._requests_hedged
+
+        return {
+            "requests": requests_made,
+            "requests_coalesced": requests_coalesced,
+            "requests_retried": requests_retried,
+            "requests_hedged": requests_hedged,
+            "connections_opened": connections_opened,
+            "connections_reused": max(requests_made - connections_opened, 0)
+        }
+
+    def clear_memo(self):
+        '''
+        Forgets all the memoized responses.
+        '''
+        with self._memo_lock:
+            self._memo = {}
+            self._catalogs = {}
 
     def get_all_testbeds(self):
         '''
@@ -23,25 +185,50 @@ class CICDManagerAPIClient:
         '''
 
         # 1. List only the testbeds that have tests
-        response = self.__make_get_request(
-            Constants.CI_CD_SERVICE_URL +
-            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
-        )
-
-        response_data = response.json()["data"]
-        testbeds_with_tests = response_data["tests"].keys()
+        tests_body = self.get_raw_tests()
 
         # 2.Gather the testbeds description
-        response = self.__make_get_request(
-            Constants.CI_CD_SERVICE_URL +
-            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTBEDS.value
-        )
-        response_data = response.json()["data"]
+        testbeds_body = self.get_raw_testbeds()
+
+        return self.testbeds_with_tests(tests_body, testbeds_body)
 
+    def get_raw_tests(self):
+        '''
+        Retrieves the tests of all testbeds from the CI/CD Manager API,
+        without decoding them.
+
+        Returns
+        -------
+            Raw `/tests/all` response body.
+        '''
+        return self._memoized_get(self._all_tests_endpoint)
+
+    def get_raw_testbeds(self):
+        '''
+        Retrieves all testbeds from the CI/CD Manager API, without decoding
+        them.
+
+        Returns
+        -------
+            Raw testbeds response body.
+        '''
+        return self._memoized_get(self._all_testbeds_endpoint)
+
+    @staticmethod
+    def testbeds_with_tests(tests_body, testbeds_body):
+        '''
+        Joins the raw tests and testbeds responses (see `get_raw_tests` and
+        `get_raw_testbeds`).
+
+        Returns
+        -------
+            List of the testbeds that have tests.
+        '''
+        testbeds_with_tests = set(iter_testbeds_with_tests(tests_body))
         return [
             testbed
             for testbed
-            in response_data["testbeds"]
+            in json.loads(testbeds_body)["data"]["testbeds"]
             if testbed["id"] in testbeds_with_tests
         ]
 
@@ -53,26 +240,33 @@ class CICDManagerAPIClient:
         -------
             List of all tests.
         '''
-        path = Constants.ALL_TESTS_PATH
-        url = f"{self.base_url}/{path}"
+        tests_body = self._memoized_get(self._all_tests_endpoint)
+        return json.loads(tests_body)['data']['tests']
 
-        try:
-            response = requests.get(url)
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as errh:
-            print(f"HTTP Error: {errh}")
-            return None
-        except requests.exceptions.ConnectionError as errc:
-            print(f"Connection Error: {errc}")
-            return None
-        except requests.exceptions.Timeout as errt:
-            print(f"Timeout Error: {errt}")
-            return None
-        except requests.exceptions.RequestException as err:
-            print(f"Unknown Error: {err}")
-            return None
-        else:
-            return response.json()['data']['tests']
+    def get_catalog(self):
+        '''
+        Retrieves the tests of all testbeds from the CI/CD Manager API, in a
+        single pass over the catalog.
+
+        Returns
+        -------
+            Dictionary with the list of tests of each testbed.
+        '''
+        tests_body = self._memoized_get(self._all_tests_endpoint)
+
+        validated_catalog = self._validated_catalog(self._all_tests_endpoint)
+        if validated_catalog is not None:
+            return {
+                testbed: list(tests)
+                for testbed, tests
+                in validated_catalog.items()
+            }
+
+        catalog = {}
+        with tracer.span("parse catalog", "parsing"):
+            for testbed, test in iter_catalog_tests(tests_body):
+                catalog.setdefault(testbed, []).append(test)
+        return catalog
 
     def get_tests_per_testbed(self, testbed: str):
         '''
@@ -87,38 +281,351 @@ class CICDManagerAPIClient:
         -------
             List of all testbeds.
         '''
-        response = self.__make_get_request(
-            endpoint=Constants.CI_CD_SERVICE_URL +
-            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value,
-            params={"testbed": testbed}
+        # If the whole catalog was already requested or cached, it also holds
+        # this testbed's tests, so there is no need to request them again
+        if self._is_memoized(self._all_tests_endpoint) or (
+            self.cache is not None and self.cache.has_fresh_entry(
+                self._all_tests_endpoint,
+                ignore_ttl=self.offline
+            )
+        ):
+            params = None
+        else:
+            params = {"testbed": testbed}
+        tests_body = self._memoized_get(self._all_tests_endpoint, params)
+
+        validated_catalog = self._validated_catalog(
+            self._all_tests_endpoint, params
         )
+        if validated_catalog is not None:
+            return list(validated_catalog[testbed])
 
-        tests = []
-        for test_info in response.json()['data']['tests'][testbed].values():
-            t = Test()
-            t.load_from_dict(test_info)
-            tests.append(t)
+        with tracer.span("parse tests", "parsing", testbed=testbed):
+            return list(iter_testbed_tests(tests_body, testbed))
 
-        return tests
+    @property
+    def _all_tests_endpoint(self):
+        return Constants.CI_CD_SERVICE_URL + \
+            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+
+    @property
+    def _all_testbeds_endpoint(self):
+        return Constants.CI_CD_SERVICE_URL + \
+            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTBEDS.value
+
+    @staticmethod
+    def __memo_key(endpoint, params):
+        return (endpoint, tuple(sorted((params or {}).items())))
+
+    def _is_memoized(self, endpoint, params=None):
+        '''
+        Checks if a GET request is in-flight or was already completed.
+        '''
+        with self._memo_lock:
+            return self.__memo_key(endpoint, params) in self._memo
+
+    def _validated_catalog(self, endpoint, params=None):
+        with self._memo_lock:
+            return self._catalogs.get(self.__memo_key(endpoint, params))
+
+    def __validate(self, endpoint, params, body):
+        '''
+        Checks a response against the catalog schema, keeping the tests
+        built from `/tests/all` responses.
+
+        Raises
+        ------
+        CatalogValidationError
+            With all the errors found in the response.
+        '''
+        url = endpoint + "?" + urlencode(params) if params else endpoint
+        if endpoint == self._all_testbeds_endpoint:
+            with tracer.span("validate testbeds", "validation"):
+                validate_testbeds_payload(body, url)
+        elif endpoint == self._all_tests_endpoint:
+            with tracer.span("validate tests", "validation"):
+                catalog = validate_tests_payload(body, url)
+            if self.memoize:
+                with self._memo_lock:
+                    self._catalogs[self.__memo_key(endpoint, params)] = \
+                        catalog
+
+    def __validated_entry(self, endpoint, params, entry):
+        # Cached responses are validated once, and then marked as such
+        if not entry.validated:
+            self.__validate(endpoint, params, entry.body)
+            entry = self.cache.validated(entry)
+        return entry
+
+    def _memoized_get(self, endpoint, params=None):
+        '''
+        Performs a GET request and returns its raw body. Identical
+        requests are coalesced: if the same request is in-flight, the caller
+        waits for it, and if it was already completed, its response is
+        reused. Failed requests are not memoized.
+
+        Parameters
+        ----------
+        endpoint : str
+            Request URL
+        params : dict
+            Query parameters
+
+        Returns
+        -------
+            Raw response body.
+
+        Raises
+        ------
+        CICDManagerAPIError
+            If the request failed.
+        '''
+        if not self.memoize:
+            return self.__fetch(endpoint, params)
+
+        key = self.__memo_key(endpoint, params)
+        with self._memo_lock:
+            future = self._memo.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._memo[key] = future
+
+        if not is_owner:
+            with self._stats_lock:
+                self._requests_coalesced += 1
+            return future.result()
 
-    def __make_get_request(self, endpoint, params=None):
         try:
-            response = requests.get(
-                url=endpoint,
-                params=params
+            response_body = self.__fetch(endpoint, params)
+        except BaseException as e:
+            self.__forget(key, future)
+            future.set_exception(e)
+            raise
+
+        future.set_result(response_body)
+        return response_body
+
+    def __forget(self, key, future):
+        with self._memo_lock:
+            if self._memo.get(key) is future:
+                del self._memo[key]
+            self._catalogs.pop(key, None)
+
+    def __fetch(self, endpoint, params=None):
+        # 1. Serve the response from the cache, if it is still fresh
+        entry = None
+        if self.cache is not None:
+            entry = self.cache.get(endpoint, params)
+            if entry is not None and \
+                    (self.offline or entry.is_fresh(self.cache.ttl)):
+                self.cache.record("hits")
+                return self.__validated_entry(endpoint, params, entry).body
+
+        if self.offline:
+            raise CICDManagerOfflineError(
+                f"There is no cached response for {endpoint}, and the CLI " +
+                "is running in offline mode."
             )
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as errh:
-            print(f"HTTP Error: {errh}")
+
+        # 2. Otherwise, request it, revalidating the cached response
+        headers = {}
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        try:
+            response = self.__make_get_request(endpoint, params, headers)
+            not_modified = response.status_code == 304 and entry is not None
+            if not not_modified:
+                self.__validate(endpoint, params, response.content)
+        except CICDManagerAPIError as e:
+            # Rather serve stale data than nothing at all
+            if entry is None:
+                raise
+            self.cache.record("stale_served")
+            print(f"{e}\nServing the cached response for {endpoint}, " +
+                  f"from {int(entry.age)} seconds ago.")
+            return self.__validated_entry(endpoint, params, entry).body
+
+        if self.cache is None:
+            return response.content
+
+        if not_modified:
+            self.cache.record("revalidated")
+            if not entry.validated:
+                self.__validate(endpoint, params, entry.body)
+                entry.validated = True
+            entry = self.cache.revalidated(entry)
+        else:
+            self.cache.record("misses")
+            entry = self.cache.put(
+                endpoint,
+                params,
+                body=response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                validated=True
+            )
+        return entry.body
+
+    def _remaining_time(self):
+        if self.deadline is None:
             return None
-        except requests.exceptions.ConnectionError as errc:
-            print(f"Connection Error: {errc}")
+        with self._stats_lock:
+            if self._deadline_at is None:
+                self._deadline_at = time.monotonic() + self.deadline
+        remaining = self._deadline_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError(
+                "The deadline for the CI/CD Manager requests was exceeded."
+            )
+        return remaining
+
+    @staticmethod
+    def _parse_retry_after(retry_after):
+        # Retry-After is either a number of seconds or an HTTP date
+        if retry_after is None:
             return None
-        except requests.exceptions.Timeout as errt:
-            print(f"Timeout Error: {errt}")
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
             return None
+        return max(retry_at.timestamp() - time.time(), 0)
+
+    def _backoff(self, attempt):
+        # Exponential backoff with full jitter
+        return self._random.uniform(
+            0,
+            min(
+                Constants.CI_CD_SERVICE_BACKOFF_MAX,
+                Constants.CI_CD_SERVICE_BACKOFF_BASE * 2 ** attempt
+            )
+        )
+
+    def __make_get_request(self, endpoint, params=None, headers=None):
+        attempt = 0
+        while True:
+            remaining = self._remaining_time()
+            try:
+                return self.__attempt_get_request(
+                    endpoint, params, headers, remaining
+                )
+            except CICDManagerAPIError as e:
+                # Only transient errors are retried. Others (e.g., an
+                # invalid URL) would fail the same way every time
+                if isinstance(e, CICDManagerHTTPError):
+                    retryable = e.status_code in \
+                        Constants.CI_CD_SERVICE_RETRYABLE_STATUS
+                else:
+                    retryable = isinstance(
+                        e,
+                        (CICDManagerConnectionError, CICDManagerTimeoutError)
+                    ) and not isinstance(e, DeadlineExceededError)
+                if not retryable or attempt >= self.retries:
+                    raise
+
+                delay = e.retry_after \
+                    if getattr(e, "retry_after", None) is not None \
+                    else self._backoff(attempt)
+                remaining = self._remaining_time()
+                if remaining is not None and delay >= remaining:
+                    raise DeadlineExceededError(
+                        "The deadline for the CI/CD Manager requests would " +
+                        f"be exceeded before retrying: {e}"
+                    ) from e
+                # Retrying sooner than asked would most likely fail again,
+                # and waiting longer would block the CLI
+                if delay > Constants.CI_CD_SERVICE_BACKOFF_MAX:
+                    raise
+
+                with self._stats_lock:
+                    self._requests_retried += 1
+                time.sleep(delay)
+                attempt += 1
+
+    def __attempt_get_request(self, endpoint, params, headers, remaining):
+        timeout = (self.connect_timeout, self.read_timeout)
+        if remaining is not None:
+            timeout = tuple(min(t, remaining) for t in timeout)
+
+        if self.hedge_after is None:
+            return self.__send_get_request(endpoint, params, headers, timeout)
+        return self.__send_hedged_get_request(
+            endpoint, params, headers, timeout
+        )
+
+    def __send_hedged_get_request(self, endpoint, params, headers, timeout):
+        # GET requests are idempotent, so a slow request can be raced
+        # against a second one, keeping whichever answers first
+        if self._hedging_executor is None:
+            with self._stats_lock:
+                if self._hedging_executor is None:
+                    self._hedging_executor = ThreadPoolExecutor(
+                        max_workers=self.pool_maxsize,
+                        thread_name_prefix="5gasp-cli-hedging"
+                    )
+
+        def send():
+            return self.__send_get_request(endpoint, params, headers, timeout)
+
+        pending = {self._hedging_executor.submit(send)}
+        done, pending = wait(pending, timeout=self.hedge_after)
+        if not done:
+            with self._stats_lock:
+                self._requests_hedged += 1
+            pending.add(self._hedging_executor.submit(send))
+
+        error = None
+        while True:
+            for future in done:
+                if future.exception() is None:
+                    # Release the connection of the slower request, if any
+                    for other in pending:
+                        other.add_done_callback(
+                            lambda f: f.exception() is None and
+                            f.result().close()
+                        )
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                raise error
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+
+    def __send_get_request(self, endpoint, params, headers, timeout):
+        with self._stats_lock:
+            self._requests_made += 1
+        try:
+            with tracer.span(f"GET {endpoint}", "http", params=params):
+                response = self.session.get(
+                    url=endpoint,
+                    params=params,
+                    headers=headers,
+                    timeout=timeout
+                )
+        except requests.exceptions.Timeout as errt:
+            raise CICDManagerTimeoutError(f"Timeout Error: {errt}") from errt
+        except requests.exceptions.ConnectionError as errc:
+            raise CICDManagerConnectionError(
+                f"Connection Error: {errc}"
+            ) from errc
         except requests.exceptions.RequestException as err:
-            print(f"Unknown Error: {err}")
-            return None
-        else:
-            return response
+            raise CICDManagerAPIError(f"Unknown Error: {err}") from err
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as errh:
+            raise CICDManagerHTTPError(
+                f"HTTP Error: {errh}",
+                status_code=response.status_code,
+                retry_after=self._parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+            ) from errh
+        return response
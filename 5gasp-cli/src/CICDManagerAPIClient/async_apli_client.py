@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 12:20:51
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 12:20:51
+
+import asyncio
+from CICDManagerAPIClient.apli_client import CICDManagerAPIClient
+
+
+class AsyncCICDManagerAPIClient:
+    '''
+    Asyncio variant of the CI/CD Manager API client.
+
+    It exposes the same surface as `CICDManagerAPIClient`, but its methods
+    are coroutines, and independent requests (e.g., the tests and testbeds
+    catalogs) are issued concurrently. The requests themselves are
+    performed by a `CICDManagerAPIClient` in worker threads, so the pooled
+    connections, the request coalescing and the on-disk cache are shared
+    with the synchronous client. A bounded semaphore limits the number of
+    requests in-flight to the size of the connection pool.
+    '''
+
+    def __init__(self, api_client=None, max_concurrency=None, **kwargs):
+        self.api_client = api_client or CICDManagerAPIClient(**kwargs)
+        self.max_concurrency = max_concurrency or \
+            self.api_client.pool_maxsize
+        # asyncio primitives are bound to an event loop, so there is one
+        # semaphore for each loop running this client
+        self._semaphores = {}
+
+    @property
+    def connection_stats(self):
+        return self.api_client.connection_stats
+
+    def close(self):
+        self.api_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _semaphore(self):
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            # Forget the semaphores of loops that are no longer running
+            self._semaphores = {
+                loop: semaphore
+                for loop, semaphore
+                in self._semaphores.items()
+                if not loop.is_closed()
+            }
+            semaphore = asyncio.BoundedSemaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, func, *args, **kwargs):
+        async with self._semaphore():
+            return await asyncio.to_thread(func, *args, **kwargs)
+
+    async def get_all_testbeds(self):
+        '''
+        Retrieves  testbeds from the CI/CD Manager API. The tests and the
+        testbeds are requested concurrently.
+
+        Returns
+        -------
+            List of testbeds.
+        '''
+        tests_data, testbeds_data = await asyncio.gather(
+            self._run(self.api_client.get_raw_tests),
+            self._run(self.api_client.get_raw_testbeds)
+        )
+        return self.api_client.testbeds_with_tests(tests_data, testbeds_data)
+
+    async def get_all_tests(self):
+        '''
+        Retrieves all tests from the CI/CD Manager API.
+
+        Returns
+        -------
+            List of all tests.
+        '''
+        return await self._run(self.api_client.get_all_tests)
+
+    async def get_catalog(self):
+        '''
+        Retrieves the tests of all testbeds from the CI/CD Manager API.
+
+        Returns
+        -------
+            Dictionary with the list of tests of each testbed.
+        '''
+        return await self._run(self.api_client.get_catalog)
+
+    async def get_tests_per_testbed(self, testbed: str):
+        '''
+        Retrieves the tests available in a testbed from the CI/CD Manager
+        API.
+
+        Parameters
+        ----------
+        testbed : str
+            Testbed
+
+        Returns
+        -------
+            List of the testbed's tests.
+        '''
+        return await self._run(self.api_client.get_tests_per_testbed, testbed)
+
+    async def get_tests_per_testbeds(self, testbeds):
+        '''
+        Retrieves the tests available in several testbeds concurrently.
+
+        Parameters
+        ----------
+        testbeds : list
+            Testbeds
+
+        Returns
+        -------
+            Dictionary with the list of tests of each testbed, in the same
+            order as the given testbeds.
+        '''
+        tests = await asyncio.gather(*[
+            self.get_tests_per_testbed(testbed)
+            for testbed
+            in testbeds
+        ])
+        return dict(zip(testbeds, tests))
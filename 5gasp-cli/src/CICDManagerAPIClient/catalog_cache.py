@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 11:21:09
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 11:21:09
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import Counter
+
+from helpers import constants as Constants
+from helpers.file_utils import user_cache_dir, file_lock, atomic_write
+
+
+class CacheEntry:
+    def __init__(self, url, body, etag=None, last_modified=None,
+                 fetched_at=None, validated=False):
+        self.url = url
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.fetched_at = fetched_at if fetched_at is not None \
+            else time.time()
+        # Whether the body was already checked against the catalog schema
+        self.validated = validated
+
+    @property
+    def age(self):
+        return time.time() - self.fetched_at
+
+    def is_fresh(self, ttl):
+        return self.age < ttl
+
+    def metadata(self):
+        return {
+            "url": self.url,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "fetched_at": self.fetched_at,
+            "validated": self.validated
+        }
+
+
+class CatalogCache:
+    '''
+    On-disk cache for the CI/CD Manager catalog responses (testbeds and
+    tests).
+
+    Each response is stored in a single file, holding a metadata line
+    (ETag, Last-Modified and fetch time) followed by the raw response body.
+    Files are always replaced atomically and written under an exclusive
+    file lock, so parallel CI jobs running on the same host can share the
+    cache.
+    '''
+
+    STATS_COUNTERS = ["hits", "misses", "revalidated", "stale_served"]
+
+    def __init__(self, cache_dir=None, ttl=None):
+        self.cache_dir = cache_dir or \
+            os.path.join(user_cache_dir(), "catalog")
+        self.ttl = ttl if ttl is not None else Constants.CATALOG_CACHE_TTL
+        self._counters = Counter()
+        self._counters_lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(endpoint, params=None):
+        key = endpoint
+        if params:
+            key += "?" + "&".join(
+                f"{k}={v}" for k, v in sorted(params.items())
+            )
+        return key
+
+    def _entry_filepath(self, cache_key):
+        digest = hashlib.sha256(cache_key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".entry")
+
+    def get(self, endpoint, params=None):
+        '''
+        Gets a cached response.
+
+        Parameters
+        ----------
+        endpoint : str
+            Request URL
+        params : dict
+            Query parameters
+
+        Returns
+        -------
+            Cached entry, or None if the response was never cached.
+        '''
+        cache_key = self._cache_key(endpoint, params)
+        entry_filepath = self._entry_filepath(cache_key)
+        try:
+            with file_lock(entry_filepath + ".lock", shared=True):
+                with open(entry_filepath, "rb") as entry_file:
+                    metadata = json.loads(entry_file.readline())
+                    body = entry_file.read()
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get("url") != cache_key:
+            return None
+        return CacheEntry(
+            url=cache_key,
+            body=body,
+            etag=metadata.get("etag"),
+            last_modified=metadata.get("last_modified"),
+            fetched_at=metadata.get("fetched_at"),
+            validated=metadata.get("validated", False)
+        )
+
+    def has_fresh_entry(self, endpoint, params=None, ignore_ttl=False):
+        '''
+        Checks if a response is cached and still fresh, without reading its
+        body.
+        '''
+        cache_key = self._cache_key(endpoint, params)
+        entry_filepath = self._entry_filepath(cache_key)
+        try:
+            with open(entry_filepath, "rb") as entry_file:
+                metadata = json.loads(entry_file.readline())
+        except (OSError, ValueError):
+            return False
+        if metadata.get("url") != cache_key:
+            return False
+        return ignore_ttl or \
+            time.time() - metadata.get("fetched_at", 0) < self.ttl
+
+    def put(self, endpoint, params, body, etag=None, last_modified=None,
+            validated=False):
+        '''
+        Caches a response.
+
+        Parameters
+        ----------
+        endpoint : str
+            Request URL
+        params : dict
+            Query parameters
+        body : bytes
+            Raw response body
+        etag : str
+            Response's ETag header, if any
+        last_modified : str
+            Response's Last-Modified header, if any
+        validated : bool
+            Whether the body was checked against the catalog schema
+
+        Returns
+        -------
+            The cached entry.
+        '''
+        entry = CacheEntry(
+            url=self._cache_key(endpoint, params),
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            validated=validated
+        )
+        self._write_entry(entry)
+        return entry
+
+    def revalidated(self, entry):
+        '''
+        Marks an entry as fresh again, after the CI/CD Manager confirmed it
+        was not modified.
+        '''
+        entry.fetched_at = time.time()
+        self._write_entry(entry)
+        return entry
+
+    def validated(self, entry):
+        '''
+        Marks an entry as checked against the catalog schema, so it is not
+        checked again when served from the cache.
+        '''
+        entry.validated = True
+        self._write_entry(entry)
+        return entry
+
+    def _write_entry(self, entry):
+        entry_filepath = self._entry_filepath(entry.url)
+        with file_lock(entry_filepath + ".lock"):
+            atomic_write(
+                entry_filepath,
+                json.dumps(entry.metadata()).encode() + b"\n" + entry.body
+            )
+
+    def record(self, counter):
+        with self._counters_lock:
+            self._counters[counter] += 1
+
+    def flush_stats(self):
+        '''
+        Adds this process' counters to the ones persisted on disk.
+        '''
+        with self._counters_lock:
+            counters = self._counters
+            self._counters = Counter()
+        if not counters:
+            return
+
+        stats_filepath = os.path.join(self.cache_dir, "stats.json")
+        with file_lock(stats_filepath + ".lock"):
+            persisted = self._read_persisted_stats(stats_filepath)
+            persisted.update(counters)
+            atomic_write(stats_filepath, json.dumps(persisted).encode())
+
+    @staticmethod
+    def _read_persisted_stats(stats_filepath):
+        try:
+            with open(stats_filepath, "r") as stats_file:
+                return Counter(json.load(stats_file))
+        except (OSError, ValueError):
+            return Counter()
+
+    def stats(self):
+        '''
+        Gathers the cache statistics.
+
+        Returns
+        -------
+            Dictionary with the cache location, its entries (URL, size and
+            age) and the accumulated hits, misses and revalidations.
+        '''
+        stats_filepath = os.path.join(self.cache_dir, "stats.json")
+        with file_lock(stats_filepath + ".lock", shared=True):
+            counters = self._read_persisted_stats(stats_filepath)
+        with self._counters_lock:
+            counters.update(self._counters)
+
+        entries = []
+        if os.path.isdir(self.cache_dir):
+            for filename in sorted(os.listdir(self.cache_dir)):
+                if not filename.endswith(".entry"):
+                    continue
+                entry_filepath = os.path.join(self.cache_dir, filename)
+                try:
+                    with open(entry_filepath, "rb") as entry_file:
+                        metadata = json.loads(entry_file.readline())
+                    size = os.path.getsize(entry_filepath)
+                except (OSError, ValueError):
+                    continue
+                entries.append({
+                    "url": metadata.get("url"),
+                    "size": size,
+                    "age": time.time() - metadata.get("fetched_at", 0),
+                    "fresh": time.time() - metadata.get("fetched_at", 0)
+                    < self.ttl
+                })
+
+        return {
+            "cache_dir": self.cache_dir,
+            "ttl": self.ttl,
+            "entries": entries,
+            "size": sum(e["size"] for e in entries),
+            **{c: counters.get(c, 0) for c in self.STATS_COUNTERS}
+        }
+
+    def clear(self):
+        '''
+        Removes all cached entries and statistics.
+
+        Returns
+        -------
+            Number of removed entries.
+        '''
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        removed = 0
+        for filename in os.listdir(self.cache_dir):
+            filepath = os.path.join(self.cache_dir, filename)
+            if not filename.endswith(".entry") and filename != "stats.json":
+                continue
+            # Another process may be clearing, or evicting, the same entries
+            try:
+                with file_lock(filepath + ".lock"):
+                    os.remove(filepath)
+            except FileNotFoundError:
+                continue
+            if filename.endswith(".entry"):
+                removed += 1
+        with self._counters_lock:
+            self._counters = Counter()
+        return removed
@@ -0,0 +1,294 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 18:41:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 18:41:12
+
+import json
+from CICDManagerAPIClient.exceptions import CatalogValidationError
+from CICDManagerAPIClient.test_classes import Test
+
+# The schemas below are compiled into nested checking functions once, at
+# import time. Checking a payload is then a single pass over the decoded
+# JSON, which collects every error (with its path) instead of stopping at
+# the first one, and builds the model objects as it goes
+_MISSING = object()
+
+
+def _format_path(path):
+    # Paths are built as (parent, key) pairs, and only formatted on errors
+    keys = []
+    while path is not None:
+        path, key = path
+        keys.append(f"[{key}]" if type(key) is int else f".{key}")
+    return "$" + "".join(reversed(keys))
+
+
+def _error(errors, path, message):
+    errors.append(f"{_format_path(path)}: {message}")
+
+
+def _describe(value):
+    if value is None:
+        return "null"
+    return f"{type(value).__name__} {value!r}"[:60]
+
+
+class String:
+    transforms = False
+
+    def __init__(self, nullable=False):
+        self.nullable = nullable
+        # Scalars are checked inline by their containers, through the types
+        # they accept, and only call check() to report an error
+        self.types = (str, type(None)) if nullable else (str,)
+
+    def compile(self):
+        nullable = self.nullable
+
+        def check(value, path, errors):
+            if type(value) is not str and not (nullable and value is None):
+                _error(errors, path,
+                       "expected a string, got " + _describe(value))
+            return value
+        return check
+
+
+class Boolean:
+    transforms = False
+    types = (bool,)
+
+    def compile(self):
+        def check(value, path, errors):
+            if type(value) is not bool:
+                _error(errors, path,
+                       "expected a boolean, got " + _describe(value))
+            return value
+        return check
+
+
+class ListOf:
+    def __init__(self, item):
+        self.item = item
+        self.transforms = item.transforms
+
+    def compile(self):
+        check_item = self.item.compile()
+        transforms = self.transforms
+        item_types = getattr(self.item, "types", None)
+
+        def check(value, path, errors):
+            if type(value) is not list:
+                _error(errors, path,
+                       "expected a list, got " + _describe(value))
+                return value
+            if item_types is not None and \
+                    all(type(item) in item_types for item in value):
+                return value
+            checked = [
+                check_item(item, (path, i), errors)
+                for i, item
+                in enumerate(value)
+            ]
+            return checked if transforms else value
+        return check
+
+
+class MapOf:
+    def __init__(self, value):
+        self.value = value
+        self.transforms = value.transforms
+
+    def compile(self):
+        check_value = self.value.compile()
+        transforms = self.transforms
+
+        def check(value, path, errors):
+            if type(value) is not dict:
+                _error(errors, path,
+                       "expected an object, got " + _describe(value))
+                return value
+            checked = {
+                key: check_value(item, (path, key), errors)
+                for key, item
+                in value.items()
+            }
+            return checked if transforms else value
+        return check
+
+
+class Object:
+    '''
+    JSON object with known fields. Fields not in the schema are ignored.
+
+    Parameters
+    ----------
+    fields : dict
+        Schema of each field
+    optional : tuple
+        Fields that may be missing
+    build : callable
+        Builds the model object from the checked object. It is only called
+        if the object has no errors
+    '''
+
+    def __init__(self, fields, optional=(), build=None):
+        self.fields = fields
+        self.optional = frozenset(optional)
+        self.build = build
+        self.transforms = build is not None or any(
+            schema.transforms for schema in fields.values()
+        )
+
+    def compile(self):
+        scalars = [
+            (name, schema.types, schema.compile(), name in self.optional)
+            for name, schema
+            in self.fields.items()
+            if hasattr(schema, "types")
+        ]
+        containers = [
+            (name, schema.compile(), name in self.optional)
+            for name, schema
+            in self.fields.items()
+            if not hasattr(schema, "types")
+        ]
+        build = self.build
+        transforms = self.transforms
+
+        def check(value, path, errors):
+            if type(value) is not dict:
+                _error(errors, path,
+                       "expected an object, got " + _describe(value))
+                return value
+
+            n_errors = len(errors)
+            get = value.get
+            for name, types, check_field, optional in scalars:
+                field = get(name, _MISSING)
+                if type(field) in types:
+                    continue
+                if field is not _MISSING:
+                    check_field(field, (path, name), errors)
+                elif not optional:
+                    _error(errors, path, f"missing field '{name}'")
+
+            checked = {}
+            for name, check_field, optional in containers:
+                field = get(name, _MISSING)
+                if field is _MISSING:
+                    if not optional:
+                        _error(errors, path, f"missing field '{name}'")
+                    continue
+                checked[name] = check_field(field, (path, name), errors)
+
+            if build is not None:
+                return build(value) if len(errors) == n_errors else value
+            if transforms:
+                return {**value, **checked}
+            return value
+        return check
+
+
+TEST_VARIABLE_SCHEMA = Object({
+    "variable_name": String(),
+    "description": String(nullable=True),
+    "mandatory": Boolean(),
+    "possible_options": ListOf(String()),
+    "type": String(),
+    "can_be_injected_by_the_nods": Boolean()
+})
+
+TEST_SCHEMA = Object(
+    {
+        "id": String(),
+        "name": String(),
+        "description": String(nullable=True),
+        "mandatory": Boolean(),
+        "test_variables": ListOf(TEST_VARIABLE_SCHEMA)
+    },
+    optional=("test_variables",),
+    build=Test.from_dict
+)
+
+TESTBED_SCHEMA = Object({
+    "id": String(),
+    "name": String(),
+    "description": String(nullable=True)
+})
+
+TESTS_ENVELOPE_SCHEMA = Object({
+    "data": Object({"tests": MapOf(MapOf(TEST_SCHEMA))})
+})
+
+TESTBEDS_ENVELOPE_SCHEMA = Object({
+    "data": Object({"testbeds": ListOf(TESTBED_SCHEMA)})
+})
+
+_check_tests_envelope = TESTS_ENVELOPE_SCHEMA.compile()
+_check_testbeds_envelope = TESTBEDS_ENVELOPE_SCHEMA.compile()
+
+
+def _decode(url, body):
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise CatalogValidationError(url, [f"invalid JSON: {e}"]) from e
+
+
+def validate_tests_payload(body, url="/tests/all"):
+    '''
+    Validates a `/tests/all` response, and builds its tests.
+
+    Parameters
+    ----------
+    body : bytes or str
+        Raw response body
+    url : str
+        Request URL, to report errors
+
+    Returns
+    -------
+        Dictionary with the list of tests of each testbed.
+
+    Raises
+    ------
+    CatalogValidationError
+        With all the errors found in the response.
+    '''
+    errors = []
+    envelope = _check_tests_envelope(_decode(url, body), None, errors)
+    if errors:
+        raise CatalogValidationError(url, errors)
+    return {
+        testbed: list(tests.values())
+        for testbed, tests
+        in envelope["data"]["tests"].items()
+    }
+
+
+def validate_testbeds_payload(body, url="/testbeds/all"):
+    '''
+    Validates a `/testbeds/all` response.
+
+    Parameters
+    ----------
+    body : bytes or str
+        Raw response body
+    url : str
+        Request URL, to report errors
+
+    Returns
+    -------
+        List of testbeds.
+
+    Raises
+    ------
+    CatalogValidationError
+        With all the errors found in the response.
+    '''
+    errors = []
+    envelope = _check_testbeds_envelope(_decode(url, body), None, errors)
+    if errors:
+        raise CatalogValidationError(url, errors)
+    return envelope["data"]["testbeds"]
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 16:51:40
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 16:51:40
+
+import bisect
+import heapq
+import math
+import re
+from collections import defaultdict
+
+_TOKEN = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
+
+def tokenize(text):
+    '''
+    Splits a text into lowercase tokens. Snake-case identifiers (e.g.,
+    host1_ip) produce both the whole identifier and its parts.
+    '''
+    tokens = []
+    for token in _TOKEN.findall(str(text).lower()):
+        tokens.append(token)
+        if "_" in token:
+            tokens += token.split("_")
+    return tokens
+
+
+class CatalogSearchIndex:
+    '''
+    In-memory inverted index over the tests of all testbeds.
+
+    Tokens from the tests' IDs, names and descriptions, and from their
+    variables' names, descriptions and possible options, are mapped to
+    postings of (testbed, test ID). Matches on names weigh more than matches
+    on descriptions, and rarer tokens weigh more than common ones (IDF).
+    The last query token also matches as a prefix, so partially typed
+    queries already return results.
+    '''
+
+    FIELD_WEIGHTS = {
+        "id": 3.0,
+        "name": 3.0,
+        "variable_name": 2.0,
+        "possible_option": 1.5,
+        "description": 1.0,
+        "variable_description": 0.5
+    }
+
+    def __init__(self):
+        # token -> {document: weight}, where each document is the position
+        # of a (testbed, test) in self.documents
+        self.postings = defaultdict(dict)
+        self.documents = []
+        self.tests = {}
+        self._vocabulary = None
+
+    @classmethod
+    def from_catalog(cls, catalog):
+        '''
+        Builds the index from a catalog.
+
+        Parameters
+        ----------
+        catalog : dict
+            List of tests of each testbed, as given by
+            `CICDManagerAPIClient.get_catalog`
+        '''
+        index = cls()
+        for testbed, tests in catalog.items():
+            for test in tests:
+                index.add_test(testbed, test)
+        return index
+
+    def add_test(self, testbed, test):
+        document = len(self.documents)
+        self.documents.append((testbed, test))
+        self.tests[(testbed, test.id)] = test
+        self._vocabulary = None
+
+        fields = [
+            ("id", test.id),
+            ("name", test.name),
+            ("description", test.description)
+        ]
+        for test_variable in test.test_variables or []:
+            fields.append(("variable_name", test_variable.name))
+            fields.append(
+                ("variable_description", test_variable.description)
+            )
+            for option in test_variable.possible_options or []:
+                fields.append(("possible_option", option))
+
+        for field, text in fields:
+            if text is None:
+                continue
+            weight = self.FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                postings = self.postings[token]
+                postings[document] = postings.get(document, 0) + weight
+
+    def _expand(self, token):
+        # Tokens of the vocabulary starting with the given token
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings.keys())
+        matches = []
+        i = bisect.bisect_left(self._vocabulary, token)
+        while i < len(self._vocabulary) and \
+                self._vocabulary[i].startswith(token):
+            matches.append(self._vocabulary[i])
+            i += 1
+        return matches
+
+    def search(self, query, testbeds=None, limit=10):
+        '''
+        Searches the tests matching a query.
+
+        Parameters
+        ----------
+        query : str
+            Free-text query
+        testbeds : list
+            Only return tests of these testbeds
+        limit : int
+            Maximum number of results
+
+        Returns
+        -------
+            List of (score, testbed, test), ordered by decreasing score.
+        '''
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+
+        n_tests = max(len(self.documents), 1)
+        scores = defaultdict(float)
+        for i, query_token in enumerate(query_tokens):
+            is_last = i == len(query_tokens) - 1
+            tokens = self._expand(query_token) if is_last \
+                else [query_token]
+            for token in tokens:
+                postings = self.postings.get(token, {})
+                if not postings:
+                    continue
+                idf = math.log(1 + n_tests / len(postings))
+                # Prefix matches score less than exact ones
+                idf *= 1.0 if token == query_token else 0.5
+                for document, weight in postings.items():
+                    scores[document] += idf * weight
+
+        if testbeds:
+            testbeds = set(testbeds)
+            scores = {
+                document: score
+                for document, score
+                in scores.items()
+                if self.documents[document][0] in testbeds
+            }
+
+        # Ties are broken by the order in which the tests were indexed
+        ranked = heapq.nsmallest(
+            limit,
+            scores.items(),
+            key=lambda item: (-item[1], item[0])
+        )
+        return [
+            (score, *self.documents[document])
+            for document, score
+            in ranked
+        ]
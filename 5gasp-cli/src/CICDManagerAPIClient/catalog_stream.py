@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 13:31:48
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 13:31:48
+
+import json
+import re
+from json.decoder import scanstring
+from CICDManagerAPIClient.test_classes import Test
+
+# The catalog is walked without decoding it. Only the members along the
+# requested path (data.tests.<testbed>) are decoded, while every other
+# value is skipped by scanning for its closing bracket
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# The patterns are unrolled loops, "normal* (special normal*)*", whose
+# alternatives start with different characters: there is a single way of
+# matching any text, so a failed match never backtracks exponentially
+_STRING_PATTERN = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_STRING = re.compile(_STRING_PATTERN, re.DOTALL)
+_PLAIN_PATTERN = r'[^"{}\[\]]*'
+
+
+def _sequence_pattern(*special_patterns):
+    # Plain text, interleaved with strings and nested containers
+    return r"%s(?:(?:%s)%s)*" % (_PLAIN_PATTERN, "|".join(special_patterns),
+                                 _PLAIN_PATTERN)
+
+
+# Containers nested up to 4 levels deep (e.g., a test with its variables)
+# are consumed by a single match, so the skipping loop only iterates over
+# the brackets of the outer levels
+_CONTAINER_PATTERN = r"[\[{]%s[\]}]" % _sequence_pattern(_STRING_PATTERN)
+for _ in range(3):
+    _CONTAINER_PATTERN = r"[\[{]%s[\]}]" % _sequence_pattern(
+        _STRING_PATTERN, _CONTAINER_PATTERN
+    )
+_CONTAINER = re.compile(_CONTAINER_PATTERN, re.DOTALL)
+_NEXT_BRACKET = re.compile(
+    r"%s([{}\[\]])" % _sequence_pattern(_STRING_PATTERN,
+                                        _CONTAINER_PATTERN),
+    re.DOTALL
+)
+_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(text, pos):
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _expect(text, pos, char):
+    if text[pos:pos + 1] != char:
+        raise ValueError(f"Expecting '{char}' at position {pos} of the " +
+                         "CI/CD Manager response")
+    return pos + 1
+
+
+def _skip_value(text, pos):
+    '''
+    Finds where the JSON value starting at `pos` ends, without decoding it.
+    '''
+    char = text[pos:pos + 1]
+    if char == '"':
+        return _STRING.match(text, pos).end()
+    if char not in ("{", "["):
+        return _DECODER.raw_decode(text, pos)[1]
+
+    match = _CONTAINER.match(text, pos)
+    if match is not None:
+        return match.end()
+
+    depth = 1
+    for match in _NEXT_BRACKET.finditer(text, pos + 1):
+        depth += 1 if match.group(1) in ("{", "[") else -1
+        if depth == 0:
+            return match.end()
+    raise ValueError(f"Unterminated value at position {pos} of the " +
+                     "CI/CD Manager response")
+
+
+def _iter_members(text, pos):
+    '''
+    Iterates over the members of the JSON object starting at `pos`. For each
+    member, yields its key and the position where its value starts. The
+    consumer must send back the position where the value ends, or None for
+    the value to be skipped. Once exhausted, returns the position right
+    after the object.
+    '''
+    pos = _expect(text, _skip_whitespace(text, pos), "{")
+    pos = _skip_whitespace(text, pos)
+    if text[pos:pos + 1] == "}":
+        return pos + 1
+
+    while True:
+        pos = _expect(text, pos, '"')
+        key, pos = scanstring(text, pos)
+        pos = _expect(text, _skip_whitespace(text, pos), ":")
+        pos = _skip_whitespace(text, pos)
+
+        value_end = yield key, pos
+        pos = value_end if value_end is not None else _skip_value(text, pos)
+
+        pos = _skip_whitespace(text, pos)
+        if text[pos:pos + 1] == "}":
+            return pos + 1
+        pos = _skip_whitespace(text, _expect(text, pos, ","))
+
+
+def _find_member(text, pos, key):
+    '''
+    Gets the position where the value of a JSON object's member starts, or
+    None if the object has no such member.
+    '''
+    members = _iter_members(text, pos)
+    try:
+        member_key, value_pos = next(members)
+        while member_key != key:
+            member_key, value_pos = members.send(None)
+    except StopIteration:
+        return None
+    members.close()
+    return value_pos
+
+
+def _find_path(text, path):
+    pos = 0
+    for key in path:
+        pos = _find_member(text, pos, key)
+        if pos is None:
+            raise KeyError(key)
+    return pos
+
+
+def _as_text(body):
+    return body.decode("utf-8") if isinstance(body, (bytes, bytearray)) \
+        else body
+
+
+def iter_testbeds_with_tests(body):
+    '''
+    Iterates over the IDs of the testbeds with tests in a `/tests/all`
+    response, without decoding their tests.
+
+    Parameters
+    ----------
+    body : bytes or str
+        Raw `/tests/all` response body
+    '''
+    text = _as_text(body)
+    members = _iter_members(text, _find_path(text, ["data", "tests"]))
+    try:
+        testbed, _ = next(members)
+        while True:
+            yield testbed
+            testbed, _ = members.send(None)
+    except StopIteration:
+        return
+
+
+def iter_testbed_tests(body, testbed):
+    '''
+    Iterates over the tests of a testbed in a `/tests/all` response. The
+    tests of the other testbeds are never decoded.
+
+    Parameters
+    ----------
+    body : bytes or str
+        Raw `/tests/all` response body
+    testbed : str
+        Testbed
+
+    Raises
+    ------
+    KeyError
+        If the response has no tests for the testbed.
+    '''
+    text = _as_text(body)
+    testbed_tests, _ = _DECODER.raw_decode(
+        text,
+        _find_path(text, ["data", "tests", testbed])
+    )
+    yield from Test.from_testbed_payload(testbed_tests)
+
+
+def iter_catalog_tests(body):
+    '''
+    Iterates over all the tests in a `/tests/all` response, in a single
+    pass. For each test, yields its testbed and the decoded test.
+
+    Parameters
+    ----------
+    body : bytes or str
+        Raw `/tests/all` response body
+    '''
+    text = _as_text(body)
+    testbeds = _iter_members(text, _find_path(text, ["data", "tests"]))
+    try:
+        testbed, testbed_pos = next(testbeds)
+        while True:
+            testbed_tests, testbed_end = _DECODER.raw_decode(
+                text, testbed_pos
+            )
+            for test in Test.from_testbed_payload(testbed_tests):
+                yield testbed, test
+            testbed, testbed_pos = testbeds.send(testbed_end)
+    except StopIteration:
+        return
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 17:32:05
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 17:32:05
+
+
+class CICDManagerAPIError(Exception):
+    '''
+    Base class of the errors raised when communicating with the CI/CD
+    Manager API.
+    '''
+
+
+class CICDManagerConnectionError(CICDManagerAPIError):
+    '''
+    The CI/CD Manager could not be reached.
+    '''
+
+
+class CICDManagerTimeoutError(CICDManagerAPIError):
+    '''
+    The CI/CD Manager did not answer in time.
+    '''
+
+
+class DeadlineExceededError(CICDManagerTimeoutError):
+    '''
+    The command's overall time budget for the CI/CD Manager requests was
+    exhausted.
+    '''
+
+
+class CICDManagerHTTPError(CICDManagerAPIError):
+    '''
+    The CI/CD Manager answered with an HTTP error status.
+    '''
+
+    def __init__(self, message, status_code, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class CICDManagerOfflineError(CICDManagerAPIError):
+    '''
+    A response is not cached, and the CLI is running in offline mode.
+    '''
+
+
+class CatalogValidationError(CICDManagerAPIError):
+    '''
+    A CI/CD Manager response does not follow the expected schema.
+    '''
+
+    def __init__(self, url, errors):
+        super().__init__(
+            f"Invalid response from {url} ({len(errors)} errors):\n" +
+            "\n".join(f"  - {error}" for error in errors)
+        )
+        self.url = url
+        self.errors = errors
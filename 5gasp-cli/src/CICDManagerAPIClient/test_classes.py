@@ -4,10 +4,37 @@
 # @Last Modified by:   Rafael Direito
 # @Last Modified time: 2023-04-26 23:24:28
 
+import sys
 from rich.panel import Panel
 
 
+def _intern(value, _intern=sys.intern, _str=str):
+    # The same types, variable names and options are repeated across the
+    # tests of every testbed, so a single copy of each is kept
+    return _intern(value) if type(value) is _str else value
+
+
+def _cached_panel(model, key, build, version=0):
+    # Panels are rebuilt only when the model changed since they were built:
+    # `version` is a counter, or an immutable snapshot of the rendered
+    # fields, for models that can be changed through their attributes
+    panels = getattr(model, "_panels", None)
+    if panels is None:
+        panels = model._panels = {}
+    cached = panels.get(key)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    panel = build(*key)
+    panels[key] = (version, panel)
+    return panel
+
+
 class Test:
+    # Catalogs may hold thousands of tests, so instances have no __dict__
+    _FIELDS = ("id", "name", "description", "mandatory", "test_variables",
+               "test_type")
+    __slots__ = _FIELDS + ("_panels",)
+
     def __init__(self, id=None, name=None, description=None,  mandatory=None,
                  test_variables=None):
         self.id = id
@@ -17,30 +44,68 @@ class Test:
         self.test_variables = test_variables
         self.test_type = None
 
+    @classmethod
+    def from_dict(cls, test_dict):
+        '''
+        Builds a predefined test from its CI/CD Manager representation.
+        '''
+        return cls._from_dicts((test_dict,))[0]
+
+    @classmethod
+    def from_testbed_payload(cls, testbed_tests):
+        '''
+        Builds all the tests of a testbed, in a single pass.
+
+        Parameters
+        ----------
+        testbed_tests : dict
+            Decoded tests of a testbed, as in the `/tests/all` response
+            ({test_id: test})
+
+        Returns
+        -------
+            List of tests.
+        '''
+        return cls._from_dicts(testbed_tests.values())
+
+    @classmethod
+    def _from_dicts(cls, test_dicts):
+        # Hot loop when loading a catalog: the objects' slots are filled
+        # directly, without going through their constructors
+        new_test = cls.__new__
+        new_variable = TestVariable.__new__
+        intern = _intern
+        tests = []
+        for test_dict in test_dicts:
+            test = new_test(cls)
+            test.id = intern(test_dict["id"])
+            test.name = test_dict["name"]
+            test.description = test_dict["description"]
+            test.mandatory = test_dict["mandatory"]
+            test.test_type = "predefined"
+            test.test_variables = test_variables = []
+            for test_variable in test_dict.get("test_variables", ()):
+                variable = new_variable(TestVariable)
+                variable.name = intern(test_variable["variable_name"])
+                variable.description = test_variable["description"]
+                variable.mandatory = test_variable["mandatory"]
+                options = test_variable["possible_options"]
+                variable.possible_options = \
+                    [intern(option) for option in options] if options else []
+                variable.type = intern(test_variable["type"])
+                variable.can_be_injected_by_the_nods = \
+                    test_variable["can_be_injected_by_the_nods"]
+                test_variables.append(variable)
+            tests.append(test)
+        return tests
+
     def load_from_dict(self, test_dict):
-        self.id = test_dict["id"]
-        self.name = test_dict["name"]
-        self.description = test_dict["description"]
-        self.mandatory = test_dict["mandatory"]
-        self.test_type = "predefined"
-
-        self.test_variables = []
-        if "test_variables" in test_dict:
-            for test_variable in test_dict["test_variables"]:
-                self.test_variables.append(
-                    TestVariable(
-                        name=test_variable["variable_name"],
-                        description=test_variable["description"],
-                        mandatory=test_variable["mandatory"],
-                        possible_options=test_variable["possible_options"],
-                        type=test_variable["type"],
-                        can_be_injected_by_the_nods=test_variable[
-                            "can_be_injected_by_the_nods"
-                        ]
-                    )
-                )
-
-    def __dict__(self):
+        test = self.from_dict(test_dict)
+        for attribute in self._FIELDS:
+            setattr(self, attribute, getattr(test, attribute))
+        self._panels = None
+
+    def to_dict(self):
         return {
             "id": self.id,
             "name": self.name,
@@ -50,9 +115,17 @@ class Test:
         }
 
     def __str__(self):
-        return str(self.__dict__())
+        return str(self.to_dict())
+
+    def _snapshot(self):
+        return (self.id, self.name, self.description, self.mandatory,
+                tuple(tv._snapshot() for tv in self.test_variables))
 
     def to_panel(self, expand=None, width=None):
+        return _cached_panel(self, (expand, width), self._build_panel,
+                             self._snapshot())
+
+    def _build_panel(self, expand, width):
         panel_str = f"""
         [b]{self.name.title()} Test[/b]
 
@@ -80,7 +153,6 @@ class Test:
                 panel_str += str(tv.possible_options) + "\n"
 
         if expand:
-            print("dddd")
             return Panel(renderable=panel_str, expand=True)
         if width:
             return Panel(renderable=panel_str, expand=False, width=width)
@@ -89,17 +161,30 @@ class Test:
 
 
 class TestVariable:
+    __slots__ = ("name", "description", "mandatory", "possible_options",
+                 "type", "can_be_injected_by_the_nods", "_panels")
+
     def __init__(self, name, description, mandatory, possible_options, type,
                  can_be_injected_by_the_nods):
-        self.name = name
+        self.name = _intern(name)
         self.description = description
         self.mandatory = mandatory
-        self.possible_options = possible_options
-        self.type = type
+        self.possible_options = [_intern(o) for o in possible_options]
+        self.type = _intern(type)
         self.can_be_injected_by_the_nods = can_be_injected_by_the_nods
 
+    def _snapshot(self):
+        return (self.name, self.description, self.mandatory,
+                tuple(self.possible_options), self.type,
+                self.can_be_injected_by_the_nods)
+
     def to_panel(self, test_name, expand=None, width=None):
+        return _cached_panel(
+            self, (test_name, expand, width), self._build_panel,
+            self._snapshot()
+        )
 
+    def _build_panel(self, test_name, expand, width):
         possible_values = self.possible_options \
             if len(self.possible_options) != 0 \
             else "Not Applicable"
@@ -130,11 +215,23 @@ class TestCase:
         self.test_variables = {}
         self.description = description
         self.test_case_id = test_case_id
+        # Incremented on every change, to invalidate the rendered panels
+        self.version = 0
+        self._panels = None
 
     def add_test_variable(self, key, value):
         self.test_variables[key] = value
+        self.version += 1
 
     def to_panel(self, show_configured=False, expand=None, width=None):
+        return _cached_panel(
+            self,
+            (self.test_case_id, show_configured, expand, width),
+            self._build_panel,
+            (self.version, self.test.name)
+        )
+
+    def _build_panel(self, test_case_id, show_configured, expand, width):
         panel_str = ""
 
         # Show message stating that the test case was fully configured
@@ -145,7 +242,7 @@ class TestCase:
         # Fill in the rest of the panel with other test info
         panel_str += f"""
 [blue]Test Name:[/blue] {self.test.name}
-[blue]Test Case ID:[/blue] {self.test_case_id}
+[blue]Test Case ID:[/blue] {test_case_id}
         """
         for variable, value in self.test_variables.items():
             panel_str += f"""
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 14:06:37
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 14:06:37
+
+import json
+
+
+def synthetic_testbeds(n_testbeds):
+    return [
+        {
+            "id": f"testbed_{i}",
+            "name": f"Testbed {i}",
+            "description": f"Synthetic testbed number {i}"
+        }
+        for i
+        in range(n_testbeds)
+    ]
+
+
+def synthetic_tests(n_testbeds, tests_per_testbed, variables_per_test=6):
+    '''
+    Builds a `/tests/all` catalog with the same structure as the one served
+    by the CI/CD Manager.
+    '''
+    catalog = {}
+    for i in range(n_testbeds):
+        tests = {}
+        for j in range(tests_per_testbed):
+            test_id = f"test_{j}"
+            tests[test_id] = {
+                "id": test_id,
+                "name": f"synthetic test {j}",
+                "description": f"Synthetic test {j} of the testbed {i}, " +
+                "which validates the Network Application's behaviour",
+                "mandatory": j % 5 == 0,
+                "test_variables": [
+                    {
+                        "variable_name": f"variable_{k}",
+                        "description": f"Synthetic variable {k}",
+                        "mandatory": k % 2 == 0,
+                        "possible_options": ["more_than", "less_than"]
+                        if k % 3 == 0 else [],
+                        "type": ["str", "int", "float"][k % 3],
+                        "can_be_injected_by_the_nods": k % 4 == 0
+                    }
+                    for k
+                    in range(variables_per_test)
+                ]
+            }
+        catalog[f"testbed_{i}"] = tests
+    return catalog
+
+
+def synthetic_tests_body(n_testbeds, tests_per_testbed, variables_per_test=6):
+    return json.dumps({
+        "message": "Success",
+        "data": {
+            "tests": synthetic_tests(
+                n_testbeds, tests_per_testbed, variables_per_test
+            )
+        }
+    }).encode()
+
+
+def synthetic_testbeds_body(n_testbeds):
+    return json.dumps({
+        "message": "Success",
+        "data": {"testbeds": synthetic_testbeds(n_testbeds)}
+    }).encode()
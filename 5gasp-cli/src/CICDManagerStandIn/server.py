@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 15:31:26
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 15:31:26
+'''
+Local stand-in for the 5GASP CI/CD Manager.
+
+It serves `/tests/all` and `/testbeds/all` with the same response envelope
+as the CI/CD Manager, using either a given catalog or a synthetic one, and
+can inject latency and errors. This allows testing and tuning the CLI's
+network behaviour without reaching ci-cd-service.5gasp.eu.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m CICDManagerStandIn.server --port 8080 --testbeds 10 \\
+        --tests 100 --latency 0.05 --error-rate 0.01
+
+and point the CLI to it:
+
+    python3 main.py --ci-cd-manager-url http://127.0.0.1:8080 list-testbeds
+'''
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from CICDManagerStandIn.catalog import synthetic_testbeds, synthetic_tests
+from helpers import constants as Constants
+
+
+class _StandInHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class CICDManagerStandIn:
+    '''
+    Stand-in CI/CD Manager, served from a background thread.
+
+    Parameters
+    ----------
+    tests : dict
+        `/tests/all` catalog ({testbed: {test_id: test}}). If not given, a
+        synthetic catalog is generated
+    testbeds : list
+        `/testbeds/all` testbeds. If not given, synthetic testbeds are
+        generated
+    n_testbeds, tests_per_testbed, variables_per_test : int
+        Size of the synthetic catalog
+    latency : float
+        Seconds added to every response
+    jitter : float
+        Maximum random seconds added on top of the latency
+    error_rate : float
+        Fraction of the requests answered with `error_status`
+    error_status : int
+        HTTP status of the injected errors
+    retry_after : int
+        Value of the Retry-After header of the injected errors, if any
+    seed : int
+        Seed for the latency jitter and error injection
+    '''
+
+    def __init__(self, host="127.0.0.1", port=0, tests=None, testbeds=None,
+                 n_testbeds=5, tests_per_testbed=20, variables_per_test=6,
+                 latency=0, jitter=0, error_rate=0, error_status=503,
+                 retry_after=None, seed=None):
+        self.tests = tests if tests is not None else synthetic_tests(
+            n_testbeds, tests_per_testbed, variables_per_test
+        )
+        self.testbeds = testbeds if testbeds is not None \
+            else synthetic_testbeds(n_testbeds)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.hits = Counter()
+        self.not_modified = Counter()
+        self.errors = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = {}
+        self._thread = None
+        self.server = _StandInHTTPServer((host, port), self._handler())
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _body(self, path, testbed):
+        # Responses are serialized once, as the catalog does not change
+        key = (path, testbed)
+        with self._lock:
+            if key in self._bodies:
+                return self._bodies[key]
+
+        if path == Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value:
+            tests = self.tests if testbed is None \
+                else {testbed: self.tests.get(testbed, {})}
+            data = {"tests": tests}
+        else:
+            data = {"testbeds": self.testbeds}
+        body = json.dumps({"message": "Success", "data": data}).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+        with self._lock:
+            self._bodies[key] = (body, etag)
+        return body, etag
+
+    def _handler(self):
+        stand_in = self
+        endpoints = [
+            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value,
+            Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTBEDS.value
+        ]
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, which would
+            # otherwise hit the delayed ACK of keep-alive connections
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                with stand_in._lock:
+                    stand_in.hits[url.path] += 1
+                    delay = stand_in.latency + \
+                        stand_in._random.uniform(0, stand_in.jitter)
+                    fail = stand_in._random.random() < stand_in.error_rate
+                if delay > 0:
+                    time.sleep(delay)
+
+                if url.path not in endpoints:
+                    self._send(404, b'{"message": "Not Found"}')
+                    return
+
+                if fail:
+                    with stand_in._lock:
+                        stand_in.errors[url.path] += 1
+                    headers = {}
+                    if stand_in.retry_after is not None:
+                        headers["Retry-After"] = str(stand_in.retry_after)
+                    self._send(stand_in.error_status,
+                               b'{"message": "Injected error"}', headers)
+                    return
+
+                testbed = parse_qs(url.query).get("testbed", [None])[0]
+                body, etag = stand_in._body(url.path, testbed)
+
+                if self.headers.get("If-None-Match") == etag:
+                    with stand_in._lock:
+                        stand_in.not_modified[url.path] += 1
+                    self._send(304, b"", {"ETag": etag})
+                    return
+
+                self._send(200, body, {"ETag": etag})
+
+            def _send(self, status, body, headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for header, value in (headers or {}).items():
+                    self.send_header(header, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self.server.serve_forever,
+            name="cicd-manager-stand-in",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the 5GASP CI/CD Manager"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--testbeds", type=int, default=5)
+    parser.add_argument("--tests", type=int, default=20,
+                        help="Tests per testbed")
+    parser.add_argument("--variables", type=int, default=6,
+                        help="Variables per test")
+    parser.add_argument("--latency", type=float, default=0,
+                        help="Seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0,
+                        help="Maximum random seconds added to the latency")
+    parser.add_argument("--error-rate", type=float, default=0,
+                        help="Fraction of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--retry-after", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    stand_in = CICDManagerStandIn(
+        host=args.host,
+        port=args.port,
+        n_testbeds=args.testbeds,
+        tests_per_testbed=args.tests,
+        variables_per_test=args.variables,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        retry_after=args.retry_after,
+        seed=args.seed
+    )
+    print(f"CI/CD Manager stand-in listening on {stand_in.url}")
+    try:
+        stand_in.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stand_in.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 20:58:14
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 20:58:14
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from helpers.file_utils import user_cache_dir, file_lock, atomic_write
+
+# Bumped whenever the extracted connection points change, so the results
+# cached by previous versions of the parser are not used
+FORMAT_VERSION = 4
+# Modification times may be this coarse, depending on the file system
+MTIME_GRANULARITY_NS = 2 * 10**9
+
+
+class CacheLookup:
+    '''
+    Result of looking up a descriptor in the `ConnectionPointsCache`.
+
+    On a miss, it holds the descriptor's content, which was read to hash
+    it, so the parser does not need to read it again.
+    '''
+
+    def __init__(self, nsd_filepath, digest, stat, content=None,
+                 nsd_info=None, kind="nsd"):
+        self.nsd_filepath = nsd_filepath
+        self.kind = kind
+        self.digest = digest
+        self.stat = stat
+        self.content = content
+        self.nsd_info = nsd_info
+
+    @property
+    def hit(self):
+        return self.nsd_info is not None
+
+
+class ConnectionPointsCache:
+    '''
+    On-disk cache of the connection points inferred from each NSD.
+
+    Results are stored by the SHA-256 of the descriptors' kind (NSD or
+    VNFD) and content, so a descriptor is only parsed again when its
+    content changes, wherever it is located, and the results of a VNFD are
+    never served for an NSD with the same content. To avoid hashing
+    unchanged files, an index maps each descriptor's path to its
+    modification time, size and content hash. The index is only trusted
+    for files that were not modified within the file system's timestamp
+    granularity of being indexed, as those could have been modified again
+    without changing their modification time.
+    '''
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or \
+            os.path.join(user_cache_dir(), "connection_points")
+        self.hits = 0
+        self.misses = 0
+        self._index = None
+        self._index_updates = {}
+        self._lock = threading.Lock()
+
+    @property
+    def _index_filepath(self):
+        return os.path.join(self.cache_dir, "index.json")
+
+    def _entry_filepath(self, digest):
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def _load_index(self):
+        if self._index is None:
+            try:
+                with file_lock(self._index_filepath + ".lock", shared=True):
+                    with open(self._index_filepath, "r") as index_file:
+                        self._index = json.load(index_file)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    @staticmethod
+    def _digest(content, kind):
+        return hashlib.sha256(
+            f"v{FORMAT_VERSION}:{kind}:".encode() + content
+        ).hexdigest()
+
+    def _read_entry(self, digest):
+        try:
+            with open(self._entry_filepath(digest), "r") as entry_file:
+                return json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+    def lookup(self, nsd_filepath, kind="nsd"):
+        '''
+        Looks up the connection points of a descriptor.
+
+        Parameters
+        ----------
+        nsd_filepath : str
+            Path of the descriptor
+        kind : str
+            Kind of the descriptor: "nsd" or "vnfd"
+
+        Returns
+        -------
+            `CacheLookup`, holding the cached connection points on a hit.
+
+        Raises
+        ------
+        OSError
+            If the descriptor cannot be read.
+        '''
+        stat = os.stat(nsd_filepath)
+        indexed = self._load_index().get(os.path.abspath(nsd_filepath))
+
+        # 1. Fast check: the file was not modified since it was indexed
+        if indexed is not None and \
+                indexed.get("format_version") == FORMAT_VERSION and \
+                indexed.get("kind") == kind and \
+                indexed["mtime_ns"] == stat.st_mtime_ns and \
+                indexed["size"] == stat.st_size and \
+                indexed["indexed_at_ns"] - stat.st_mtime_ns > \
+                MTIME_GRANULARITY_NS:
+            nsd_info = self._read_entry(indexed["digest"])
+            if nsd_info is not None:
+                self._record(hit=True)
+                return CacheLookup(nsd_filepath, indexed["digest"], stat,
+                                   nsd_info=nsd_info, kind=kind)
+
+        # 2. Otherwise, check by the file's content
+        with open(nsd_filepath, "rb") as nsd_file:
+            content = nsd_file.read()
+        digest = self._digest(content, kind)
+        nsd_info = self._read_entry(digest)
+        lookup = CacheLookup(nsd_filepath, digest, stat, content, nsd_info,
+                             kind)
+        self._record(hit=lookup.hit)
+        if lookup.hit:
+            self._update_index(lookup)
+        return lookup
+
+    def lookup_content(self, nsd_filepath, content, kind="nsd"):
+        '''
+        Looks up the connection points of a descriptor that was already
+        read (e.g., from an NS package). It is looked up by its content
+        only, as it has no modification time to index.
+
+        Parameters
+        ----------
+        nsd_filepath : str
+            Path of the descriptor
+        content : bytes
+            Content of the descriptor
+        kind : str
+            Kind of the descriptor: "nsd" or "vnfd"
+
+        Returns
+        -------
+            `CacheLookup`, holding the cached connection points on a hit.
+        '''
+        digest = self._digest(content, kind)
+        lookup = CacheLookup(nsd_filepath, digest, None, content,
+                             self._read_entry(digest), kind)
+        self._record(hit=lookup.hit)
+        return lookup
+
+    def store(self, lookup, nsd_info):
+        '''
+        Caches the connection points inferred from a descriptor.
+
+        Parameters
+        ----------
+        lookup : CacheLookup
+            Lookup that missed the descriptor
+        nsd_info : dict
+            NS ID and connection points of the descriptor
+        '''
+        atomic_write(
+            self._entry_filepath(lookup.digest),
+            json.dumps(nsd_info).encode()
+        )
+        lookup.nsd_info = nsd_info
+        self._update_index(lookup)
+
+    def _record(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _update_index(self, lookup):
+        if lookup.stat is None:
+            return
+        with self._lock:
+            self._index_updates[os.path.abspath(lookup.nsd_filepath)] = {
+                "mtime_ns": lookup.stat.st_mtime_ns,
+                "size": lookup.stat.st_size,
+                "digest": lookup.digest,
+                "kind": lookup.kind,
+                "format_version": FORMAT_VERSION,
+                "indexed_at_ns": time.time_ns()
+            }
+
+    def flush(self):
+        '''
+        Saves the index updates, merging them with the ones saved by other
+        processes in the meantime.
+        '''
+        with self._lock:
+            updates = self._index_updates
+            self._index_updates = {}
+        if not updates:
+            return
+
+        with file_lock(self._index_filepath + ".lock"):
+            try:
+                with open(self._index_filepath, "r") as index_file:
+                    index = json.load(index_file)
+            except (OSError, ValueError):
+                index = {}
+            index.update(updates)
+            atomic_write(self._index_filepath, json.dumps(index).encode())
+        self._index = index
+
+    def stats(self):
+        '''
+        Gathers the cache statistics.
+
+        Returns
+        -------
+            Dictionary with the cache location, and its number of entries
+            and size.
+        '''
+        entries = 0
+        size = 0
+        if os.path.isdir(self.cache_dir):
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith(".json") and filename != "index.json":
+                    entries += 1
+                    size += os.path.getsize(
+                        os.path.join(self.cache_dir, filename)
+                    )
+        return {
+            "cache_dir": self.cache_dir,
+            "entries": entries,
+            "size": size
+        }
+
+    def clear(self):
+        '''
+        Removes all the cached connection points.
+
+        Returns
+        -------
+            Number of removed entries.
+        '''
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        removed = 0
+        with file_lock(self._index_filepath + ".lock"):
+            for filename in os.listdir(self.cache_dir):
+                if not filename.endswith(".json"):
+                    continue
+                os.remove(os.path.join(self.cache_dir, filename))
+                if filename != "index.json":
+                    removed += 1
+        self._index = None
+        return removed
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:16:32
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:16:32
+
+import re
+
+# Tag, optionally followed by the attribute to gather (e.g., ip-address)
+_TAG = re.compile(
+    r"\{\{deployment_info\|([^|{}]*)\|([^|{}]*)\|([^|{}]*)(?:\|[^{}]*)?\}\}"
+)
+
+
+def format_tag(ns_id, vnf_id, cp_id):
+    '''
+    Formats the tag through which the NODS injects a connection point.
+    '''
+    return "{{deployment_info|" + f"{ns_id}|{vnf_id}|{cp_id}" + "}}"
+
+
+def parse_tags(text):
+    '''
+    Finds the connection point tags in a text (e.g., a test variable's
+    value).
+
+    Returns
+    -------
+        List of the (NS ID, VNF ID, connection point ID) of each tag.
+    '''
+    return _TAG.findall(str(text))
+
+
+class ConnectionPointsIndex:
+    '''
+    Deduplicated index of connection points: NS ID -> VNF ID -> connection
+    point IDs, keeping the order in which they were added.
+
+    The IDs are kept as strings, as they are only used to format tags, and
+    so the index is the same after being cached as JSON. The connection
+    points of each VNF are kept as the keys of a dictionary, so they are
+    deduplicated, and looked up, in constant time. Tags are only formatted
+    when iterating over `tags`.
+    '''
+
+    def __init__(self, index=None):
+        '''
+        Parameters
+        ----------
+        index : dict
+            Nested dictionary, as returned by `to_dict`
+        '''
+        self._index = {}
+        if index:
+            self.update(index)
+
+    def add(self, ns_id, vnf_id, cp_id):
+        self._index.setdefault(str(ns_id), {}) \
+            .setdefault(str(vnf_id), {})[str(cp_id)] = None
+
+    def update(self, other):
+        '''
+        Adds the connection points of another index, or of a nested
+        dictionary, as returned by `to_dict`.
+        '''
+        if isinstance(other, ConnectionPointsIndex):
+            other = other._index
+        for ns_id, vnfs in other.items():
+            ns_vnfs = self._index.setdefault(str(ns_id), {})
+            for vnf_id, cp_ids in vnfs.items():
+                ns_vnfs.setdefault(str(vnf_id), {}).update(
+                    dict.fromkeys(map(str, cp_ids))
+                )
+
+    def network_services(self):
+        return list(self._index)
+
+    def vnfs(self, ns_id):
+        return list(self._index.get(str(ns_id), {}))
+
+    def connection_points(self, ns_id, vnf_id):
+        return list(self._index.get(str(ns_id), {}).get(str(vnf_id), {}))
+
+    def __contains__(self, key):
+        '''
+        Checks if the index holds an (NS ID, VNF ID, connection point ID).
+        '''
+        ns_id, vnf_id, cp_id = key
+        return str(cp_id) in \
+            self._index.get(str(ns_id), {}).get(str(vnf_id), {})
+
+    def __iter__(self):
+        '''
+        Iterates over the (NS ID, VNF ID, connection point ID) of the
+        index.
+        '''
+        for ns_id, vnfs in self._index.items():
+            for vnf_id, cp_ids in vnfs.items():
+                for cp_id in cp_ids:
+                    yield ns_id, vnf_id, cp_id
+
+    def __len__(self):
+        return sum(
+            len(cp_ids)
+            for vnfs in self._index.values()
+            for cp_ids in vnfs.values()
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, ConnectionPointsIndex):
+            return NotImplemented
+        return self._index == other._index
+
+    def __repr__(self):
+        return f"ConnectionPointsIndex({self.to_dict()!r})"
+
+    def tags(self):
+        '''
+        Generates the tag of each connection point, in the index's order.
+        '''
+        for ns_id, vnf_id, cp_id in self:
+            yield format_tag(ns_id, vnf_id, cp_id)
+
+    def to_dict(self):
+        '''
+        Returns
+        -------
+            Nested dictionary with the list of connection point IDs of each
+            VNF of each NS, which can be serialized as JSON.
+        '''
+        return {
+            ns_id: {
+                vnf_id: list(cp_ids)
+                for vnf_id, cp_ids
+                in vnfs.items()
+            }
+            for ns_id, vnfs
+            in self._index.items()
+        }
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 21:24:50
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 21:24:50
+'''
+Extracts the connection points of an NSD from its YAML parse events,
+without building the descriptor's document tree.
+
+Only the values along these paths are constructed:
+
+    nsd.nsd[].id
+    nsd.nsd[].df[].vnf-profile[].id
+    nsd.nsd[].df[].vnf-profile[].vnfd-id
+    nsd.nsd[].df[].vnf-profile[].virtual-link-connectivity[]
+        .constituent-cpd-id[].constituent-cpd-id
+
+Every other value (e.g., the large configuration blocks embedded in the
+NSDs of OSM packages) is skipped by consuming its events. Documents using
+anchors and aliases, which would require keeping the anchored values, are
+loaded as a whole instead.
+'''
+
+from yaml.events import ScalarEvent, MappingStartEvent, MappingEndEvent, \
+    SequenceStartEvent, SequenceEndEvent, CollectionStartEvent, \
+    CollectionEndEvent, AliasEvent, DocumentStartEvent, DocumentEndEvent, \
+    StreamEndEvent
+from yaml.nodes import ScalarNode
+from yaml.resolver import Resolver
+from yaml.constructor import SafeConstructor
+
+from DescriptorParser.connection_points_index import ConnectionPointsIndex
+
+_resolver = Resolver()
+_constructor = SafeConstructor()
+_STR_TAG = "tag:yaml.org,2002:str"
+# Tags of the scalars that are constructed on their own, like
+# yaml.safe_load does. Any other tag (e.g., merge keys) falls back to
+# loading the whole document
+_SCALAR_TAGS = {
+    f"tag:yaml.org,2002:{name}"
+    for name in ("binary", "bool", "float", "int", "null", "timestamp")
+}
+
+
+class UnsupportedDocument(Exception):
+    '''
+    The document cannot be extracted from its events alone.
+    '''
+
+
+def _scalar(event):
+    # Scalars are resolved and constructed as yaml.safe_load would, so
+    # e.g. "version: 1.0" still becomes a float
+    if event.anchor is not None:
+        raise UnsupportedDocument()
+    tag = event.tag
+    if tag is None or tag == "!":
+        tag = _resolver.resolve(ScalarNode, event.value, event.implicit)
+    if tag == _STR_TAG:
+        return event.value
+    if tag not in _SCALAR_TAGS:
+        raise UnsupportedDocument()
+    # The constructors are called directly, as `construct_object` keeps
+    # every constructed object
+    return _constructor.yaml_constructors[tag](
+        _constructor,
+        ScalarNode(tag, event.value, style=event.style)
+    )
+
+
+class _Events:
+    def __init__(self, events):
+        self._next = events.__next__
+
+    def next(self):
+        event = self._next()
+        if isinstance(event, AliasEvent) or (
+            isinstance(event, CollectionStartEvent) and
+            event.anchor is not None
+        ):
+            raise UnsupportedDocument()
+        return event
+
+    def skip(self, event):
+        '''
+        Skips the value starting with the given event.
+        '''
+        if isinstance(event, CollectionStartEvent):
+            depth = 1
+            next_event = self._next
+            while depth:
+                event = next_event()
+                if isinstance(event, CollectionStartEvent):
+                    depth += 1
+                elif isinstance(event, CollectionEndEvent):
+                    depth -= 1
+                elif isinstance(event, AliasEvent):
+                    raise UnsupportedDocument()
+
+    def scalar(self, event):
+        '''
+        Constructs the scalar value of the given event.
+        '''
+        if not isinstance(event, ScalarEvent):
+            raise UnsupportedDocument()
+        return _scalar(event)
+
+    def mapping(self, event, handlers):
+        '''
+        Iterates over a mapping, calling the handler of each known key with
+        the event starting its value. Other values are skipped.
+
+        Returns
+        -------
+            Dictionary with the results of the handlers, by key. As in a
+            loaded document, the last duplicated key wins.
+        '''
+        if not isinstance(event, MappingStartEvent):
+            raise UnsupportedDocument()
+        values = {}
+        while True:
+            key_event = self.next()
+            if isinstance(key_event, MappingEndEvent):
+                return values
+            key = self.scalar(key_event)
+            handler = handlers.get(key) if type(key) is str else None
+            value_event = self.next()
+            if handler is None:
+                self.skip(value_event)
+            else:
+                values[key] = handler(value_event)
+
+    def sequence(self, event, handler):
+        '''
+        Calls a handler with the event starting each item of a sequence.
+
+        Returns
+        -------
+            List with the results of the handler.
+        '''
+        if not isinstance(event, SequenceStartEvent):
+            raise UnsupportedDocument()
+        items = []
+        while True:
+            item_event = self.next()
+            if isinstance(item_event, SequenceEndEvent):
+                return items
+            items.append(handler(item_event))
+
+
+def extract_connection_points_from_events(events):
+    '''
+    Extracts the NS ID and the connection points of a descriptor from its
+    parse events.
+
+    Parameters
+    ----------
+    events : iterator
+        YAML parse events (e.g., from `yaml_io.parse`)
+
+    Returns
+    -------
+        Dictionary with the NS ID, the connection points and the VNFDs of
+        the VNFs, as `extract_connection_points` would return.
+
+    Raises
+    ------
+    KeyError
+        If the descriptor lacks one of the required paths.
+    UnsupportedDocument
+        If the descriptor must be loaded as a whole, e.g., as it uses
+        anchors and aliases. The descriptor may also be invalid, in which
+        case loading it raises the appropriate error.
+    '''
+    events = _Events(events)
+
+    def cpd(event):
+        return events.mapping(event, {"constituent-cpd-id": events.scalar})
+
+    def constituent(event):
+        return events.mapping(event, {
+            "constituent-cpd-id": lambda e: events.sequence(e, cpd)
+        })
+
+    def vnf_profile(event):
+        return events.mapping(event, {
+            "id": events.scalar,
+            "vnfd-id": events.scalar,
+            "virtual-link-connectivity":
+                lambda e: events.sequence(e, constituent)
+        })
+
+    def df(event):
+        return events.mapping(event, {
+            "vnf-profile": lambda e: events.sequence(e, vnf_profile)
+        })
+
+    def network_service(event):
+        return events.mapping(event, {
+            "id": events.scalar,
+            "df": lambda e: events.sequence(e, df)
+        })
+
+    def nsd(event):
+        return events.mapping(event, {
+            "nsd": lambda e: events.sequence(e, network_service)
+        })
+
+    # Stream start
+    events.next()
+    if not isinstance(events.next(), DocumentStartEvent):
+        raise UnsupportedDocument()
+    descriptor = events.mapping(events.next(), {"nsd": nsd})
+    # Streams with several documents are rejected by yaml.safe_load
+    if not isinstance(events.next(), DocumentEndEvent) or \
+            not isinstance(events.next(), StreamEndEvent):
+        raise UnsupportedDocument()
+
+    # The index is only built once the whole document was read, as the IDs
+    # may come after the values that use them
+    index = ConnectionPointsIndex()
+    vnfd_ids = {}
+    for network_service in descriptor["nsd"]["nsd"]:
+        ns_id = network_service["id"]
+        for df in network_service["df"]:
+            for vnf in df["vnf-profile"]:
+                vnf_id = vnf["id"]
+                if vnf.get("vnfd-id") is not None:
+                    vnfd_ids.setdefault(str(ns_id), {})[str(vnf_id)] = \
+                        str(vnf["vnfd-id"])
+                for constituent in vnf["virtual-link-connectivity"]:
+                    for constituent_cpd in constituent["constituent-cpd-id"]:
+                        index.add(
+                            ns_id,
+                            vnf_id,
+                            constituent_cpd["constituent-cpd-id"]
+                        )
+    return {
+        "ns_id": ns_id,
+        "connection_points": index.to_dict(),
+        "vnfd_ids": vnfd_ids
+    }
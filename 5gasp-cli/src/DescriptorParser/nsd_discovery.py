@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 21:51:07
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 21:51:07
+'''
+Discovery of the descriptors given through `--infer-tags-from-nsd`.
+
+Each location may be an NSD file, a directory (scanned recursively), a glob
+pattern, or an OSM package (`.tar.gz`). Inside directories and packages,
+and among the files matching patterns, the NSDs and VNFDs are recognized
+by OSM's naming conventions (`*nsd.yaml` and `*vnfd.yaml`), so the VNFDs
+of the NSDs' VNFs can be given along with them (e.g., the directory
+holding all the NetApp's packages). Packages are read in place, through
+the tarfile stream, without extracting them.
+
+The descriptors are yielded as soon as they are found, so they can be
+parsed while the remaining locations are still being scanned.
+'''
+
+import fnmatch
+import glob
+import os
+import tarfile
+
+NSD_FILENAME_PATTERNS = ("*nsd.yaml", "*nsd.yml")
+VNFD_FILENAME_PATTERNS = ("*vnfd.yaml", "*vnfd.yml")
+PACKAGE_EXTENSIONS = (".tar.gz", ".tgz")
+
+
+class NSDSource:
+    '''
+    Descriptor found by `discover_nsds`: an NSD, or a VNFD.
+
+    Descriptors inside packages are identified by the package's path and
+    their path inside it (e.g.,
+    `hackfest_ns.tar.gz:hackfest_ns/hackfest_nsd.yaml`) and carry their
+    content, as they cannot be read from a path. A source may also carry
+    the error that prevented the discovery of a location's descriptors.
+    '''
+
+    def __init__(self, nsd_filepath, content=None, error=None, kind="nsd"):
+        self.nsd_filepath = nsd_filepath
+        self.content = content
+        self.error = error
+        self.kind = kind
+
+    def __repr__(self):
+        return f"NSDSource({self.nsd_filepath!r})"
+
+
+def is_nsd_filename(filename):
+    return any(
+        fnmatch.fnmatch(filename.lower(), pattern)
+        for pattern
+        in NSD_FILENAME_PATTERNS
+    )
+
+
+def is_vnfd_filename(filename):
+    return any(
+        fnmatch.fnmatch(filename.lower(), pattern)
+        for pattern
+        in VNFD_FILENAME_PATTERNS
+    )
+
+
+def descriptor_kind(filename):
+    '''
+    Returns
+    -------
+        "nsd" or "vnfd", according to OSM's naming conventions, or None.
+    '''
+    if is_nsd_filename(filename):
+        return "nsd"
+    if is_vnfd_filename(filename):
+        return "vnfd"
+    return None
+
+
+def is_package(filepath):
+    return filepath.lower().endswith(PACKAGE_EXTENSIONS)
+
+
+def _scan_directory(directory):
+    # Sorted, so the descriptors are always listed in the same order
+    for root, directories, filenames in os.walk(directory):
+        directories.sort()
+        for filename in sorted(filenames):
+            filepath = os.path.join(root, filename)
+            kind = descriptor_kind(filename)
+            if is_package(filename):
+                yield from _scan_package(filepath)
+            elif kind is not None:
+                yield NSDSource(filepath, kind=kind)
+
+
+def _scan_package(package_filepath):
+    try:
+        # "r|gz" reads the package as a stream, so each member is read
+        # while decompressing, and never written to disk
+        with tarfile.open(package_filepath, "r|gz") as package:
+            for member in package:
+                kind = descriptor_kind(os.path.basename(member.name))
+                if not member.isfile() or kind is None:
+                    continue
+                yield NSDSource(
+                    f"{package_filepath}:{member.name}",
+                    content=package.extractfile(member).read(),
+                    kind=kind
+                )
+    except (OSError, tarfile.TarError) as e:
+        yield NSDSource(package_filepath, error=e)
+
+
+def _scan_location(location):
+    if os.path.isdir(location):
+        yield from _scan_directory(location)
+    elif is_package(location) and os.path.isfile(location):
+        yield from _scan_package(location)
+    else:
+        # Explicit files are parsed as NSDs, unless named as VNFDs. Missing
+        # ones are reported when parsing them
+        yield NSDSource(
+            location,
+            kind="vnfd" if is_vnfd_filename(os.path.basename(location))
+            else "nsd"
+        )
+
+
+def _is_pattern(location):
+    return glob.has_magic(location) and not os.path.exists(location)
+
+
+def _is_hidden(name):
+    return name.startswith(".")
+
+
+def _match_components(patterns, names):
+    # Whether the path components match the pattern's, as in glob: "**"
+    # matches any number of directories, and wildcards match neither
+    # across directories nor hidden names
+    if not patterns:
+        return not names
+    pattern, patterns = patterns[0], patterns[1:]
+    if pattern == "**":
+        return any(
+            _match_components(patterns, names[i:])
+            for i
+            in range(len(names) + 1)
+            if not any(_is_hidden(name) for name in names[:i])
+        )
+    return bool(names) and \
+        (not _is_hidden(names[0]) or _is_hidden(pattern)) and \
+        fnmatch.fnmatch(names[0], pattern) and \
+        _match_components(patterns, names[1:])
+
+
+def _is_discovered_file(filepath):
+    return descriptor_kind(os.path.basename(filepath)) is not None or \
+        is_package(filepath)
+
+
+def location_filepath(location, filepath):
+    '''
+    Gets the path under which `discover_nsds` finds a file in a location
+    (e.g., to know which descriptor changed), following the same rules.
+
+    Parameters
+    ----------
+    location : str
+        NSD or VNFD file, directory, glob pattern or OSM package
+    filepath : str
+        Absolute path of the file
+
+    Returns
+    -------
+        The file's path, as discovered, or None if it is not one of the
+        location's descriptors or packages.
+    '''
+    if _is_pattern(location):
+        # The directory before the first pattern component
+        components = location.split(os.sep)
+        n_root = 0
+        while n_root < len(components) and \
+                not glob.has_magic(components[n_root]):
+            n_root += 1
+        root = os.sep.join(components[:n_root]) or \
+            (os.sep if os.path.isabs(location) else "")
+        root_directory = os.path.abspath(root or ".")
+        if not filepath.startswith(root_directory.rstrip(os.sep) + os.sep):
+            return None
+
+        names = os.path.relpath(filepath, root_directory).split(os.sep)
+        patterns = [
+            component
+            for component
+            in components[n_root:]
+            if component
+        ]
+        # Either the file, or one of the directories it is in, matches. In
+        # both cases, it is only discovered if named as a descriptor. As
+        # in glob, the root directory itself only matches if it was given
+        if _is_discovered_file(filepath) and any(
+            _match_components(patterns, names[:i])
+            for i
+            in range(0 if root else 1, len(names) + 1)
+        ):
+            return os.path.join(root, *names)
+        return None
+    if os.path.isdir(location):
+        directory = os.path.abspath(location)
+        if filepath.startswith(directory + os.sep) and \
+                _is_discovered_file(filepath):
+            return os.path.join(
+                location,
+                os.path.relpath(filepath, directory)
+            )
+        return None
+    return location if os.path.abspath(location) == filepath else None
+
+
+def _discover_location(location):
+    if _is_pattern(location):
+        matches = sorted(glob.glob(location, recursive=True))
+        if not matches:
+            yield NSDSource(
+                location,
+                error=FileNotFoundError(
+                    f"No files match the pattern '{location}'"
+                )
+            )
+        for match in matches:
+            # As inside directories, the matched files are recognized by
+            # their names
+            if os.path.isfile(match) and not _is_discovered_file(match):
+                continue
+            yield from _scan_location(match)
+    else:
+        yield from _scan_location(location)
+
+
+def discover_nsds(locations):
+    '''
+    Finds the NSDs, and VNFDs, in the given locations.
+
+    Parameters
+    ----------
+    locations : list
+        NSD and VNFD files, directories, glob patterns or OSM packages
+
+    Returns
+    -------
+        Generator of `NSDSource`, in the order of the given locations. The
+        locations without NSDs, nor errors, yield a source with an error.
+    '''
+    for location in locations:
+        found = False
+        for source in _discover_location(location):
+            found = found or source.error is not None or \
+                source.kind == "nsd"
+            yield source
+        if not found:
+            yield NSDSource(
+                location,
+                error=FileNotFoundError(f"No NSDs found in '{location}'")
+            )
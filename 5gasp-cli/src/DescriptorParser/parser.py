@@ -2,75 +2,460 @@
 # @Author: Eduardo Santos
 # @Date:   2023-02-18 15:26:20
 # @Last Modified by:   Rafael Direito
-# @Last Modified time: 2023-05-18 14:53:36
+# @Last Modified time: 2026-10-18 19:40:12
 
-import yaml
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List
+from helpers import yaml_io
+from helpers.tracing import tracer
+from DescriptorParser.connection_points_index import ConnectionPointsIndex
+from DescriptorParser.nsd_discovery import discover_nsds
+from DescriptorParser.vnfd_parser import extract_vnfd_connection_points
+from DescriptorParser.event_extractor import UnsupportedDocument, \
+    extract_connection_points_from_events
+
+
+def infer_connection_points_from_df(ns_id, df, index=None):
+    '''
+    Adds the connection points of an NS deployment flavour to an index.
+
+    Returns
+    -------
+        The `ConnectionPointsIndex`, or a new one if none was given.
+    '''
+    if index is None:
+        index = ConnectionPointsIndex()
+    for vnf in df['vnf-profile']:
+        vnf_id = vnf['id']
+        for constituent in vnf['virtual-link-connectivity']:
+            for constituent_cpd in constituent["constituent-cpd-id"]:
+                index.add(ns_id, vnf_id,
+                          constituent_cpd['constituent-cpd-id'])
+    return index
+
+
+def _extract_connection_points_from_tree(nsd_filepath, content=None):
+    index = ConnectionPointsIndex()
+    vnfd_ids = {}
+
+    with tracer.span("yaml.safe_load", "yaml", file=nsd_filepath):
+        if content is not None:
+            descriptor = yaml_io.load(content)
+        else:
+            with open(nsd_filepath, "r") as file:
+                descriptor = yaml_io.load(file)
+
+    for network_service in descriptor['nsd']['nsd']:
+        ns_id = network_service['id']
+        for df in network_service['df']:
+            infer_connection_points_from_df(
+                ns_id=ns_id,
+                df=df,
+                index=index
+            )
+            for vnf in df['vnf-profile']:
+                if vnf.get('vnfd-id') is not None:
+                    vnfd_ids.setdefault(str(ns_id), {})[str(vnf['id'])] = \
+                        str(vnf['vnfd-id'])
+    return {
+        "ns_id": ns_id,
+        "connection_points": index.to_dict(),
+        "vnfd_ids": vnfd_ids
+    }
+
+
+def _extract_connection_points_from_events(nsd_filepath, content=None):
+    with tracer.span("yaml.parse", "yaml", file=nsd_filepath):
+        if content is not None:
+            return extract_connection_points_from_events(
+                yaml_io.parse(content)
+            )
+        with open(nsd_filepath, "rb") as file:
+            try:
+                # Let the parser read the descriptor from the page cache,
+                # instead of copying it to the heap
+                content = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                content = file.read()
+            try:
+                return extract_connection_points_from_events(
+                    yaml_io.parse(content)
+                )
+            finally:
+                if isinstance(content, mmap.mmap):
+                    content.close()
+
+
+def extract_connection_points(nsd_filepath, content=None):
+    '''
+    Retrieves the NS ID and the connection points of a descriptor. This is
+    a module-level function, so it can run in a worker process.
+
+    Only the needed values are extracted from the descriptor's YAML parse
+    events. Descriptors that cannot be handled this way (e.g., using
+    anchors and aliases) are loaded as a whole.
+
+    Parameters
+    ----------
+    nsd_filepath : str
+        Path of the descriptor
+    content : bytes
+        Content of the descriptor, if it was already read
+
+    Returns
+    -------
+        Dictionary with the NS ID, the connection points, as a nested
+        dictionary (see `ConnectionPointsIndex.to_dict`), and the vnfd-id of
+        each VNF of each NS.
+    '''
+    try:
+        return _extract_connection_points_from_events(nsd_filepath, content)
+    except UnsupportedDocument:
+        return _extract_connection_points_from_tree(nsd_filepath, content)
+
+
+def _try_extract_connection_points(nsd_filepath, content=None):
+    # Errors are returned, instead of raised, so that the errors of the
+    # worker processes are reported by the parent, in the files' order.
+    # Only their messages are returned, as not all exceptions can be pickled
+    try:
+        return extract_connection_points(nsd_filepath, content), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _try_extract_vnfd_connection_points(vnfd_filepath, content=None):
+    try:
+        return extract_vnfd_connection_points(vnfd_filepath, content), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _try_extract(nsd_filepath, content, kind):
+    if kind == "vnfd":
+        return _try_extract_vnfd_connection_points(nsd_filepath, content)
+    return _try_extract_connection_points(nsd_filepath, content)
+
+
+def _try_extract_many(nsd_sources):
+    return [
+        _try_extract(nsd_filepath, content, kind)
+        for nsd_filepath, content, kind
+        in nsd_sources
+    ]
 
 
 class ConnectionPointsParser:
     """
     Injected Tags Parser Class
+
+    The NSDs are discovered in the given locations (see `discover_nsds`),
+    and parsed as soon as they are found. The VNFDs found along with them
+    are parsed in the same pass, so the NSDs' connection points can be
+    resolved to the VDU interfaces they are mapped to (see `resolve`).
+    With more than one worker, the descriptors are parsed by a pool of
+    processes, while the remaining locations are still being scanned.
+    Results are always gathered in the order in which the descriptors were
+    found.
+
+    When a `ConnectionPointsCache` is given, descriptors whose content did
+    not change since they were last parsed are not parsed again.
+
+    The descriptors that could not be parsed are kept in `errors`. They are
+    also printed, unless `report_errors` is False (e.g., when parsing in a
+    background thread, while the developer answers prompts), in which case
+    they can be printed later through `print_errors`.
     """
     validated_connection_points = None
     _interfaces = None
 
-    def __init__(self, nsd_filepaths: List[str]):
+    def __init__(self, nsd_filepaths: List[str], workers: int = 1,
+                 cache=None, report_errors: bool = True):
         """
         Constructor
         """
-        self.base_nsd_filepaths = set(nsd_filepaths)
+        self.nsd_locations = nsd_filepaths
+        self.report_errors = report_errors
+        # (descriptor, kind, error) of each descriptor that was not parsed
+        self.errors = []
+        # Discovered descriptors. Duplicated ones are only parsed once,
+        # keeping the order in which they were found
+        self.base_nsd_filepaths = []
+        self.workers = workers
+        self.cache = cache
         self.validated_connection_points = {}
+        # External connection points of each VNFD file
+        self.vnfd_connection_points = {}
+        # Connection points of all the NSDs, the vnfd-id of each of their
+        # VNFs (NS ID -> VNF ID -> vnfd-id), and the external connection
+        # points of all the VNFDs (vnfd-id -> ext-cpd ID -> VDU interfaces)
+        self.index = ConnectionPointsIndex()
+        self.vnfd_ids = {}
+        self.vnfds = {}
         self._interfaces = []
         self.infer_connection_points()
 
-    def infer_connection_points(self):
-        for filepath in self.base_nsd_filepaths:
-            self.parse_descriptor(filepath)
+    @property
+    def cache_hits(self):
+        '''
+        Number of descriptors whose connection points were cached
+        '''
+        return self.cache.hits if self.cache is not None else 0
+
+    def infer_connection_points(self, nsd_locations=None):
+        # (connection points, error) of each descriptor
+        outcomes = {}
+        lookups = {}
+        # Descriptors to parse, and batches already sent to the workers
+        batch = []
+        batches = []
+        n_pending = 0
+        executor = None
+        discovered = set(self.base_nsd_filepaths)
+        kinds = {}
+
+        try:
+            for source in discover_nsds(nsd_locations or
+                                        self.nsd_locations):
+                nsd_filepath = source.nsd_filepath
+                if nsd_filepath in discovered:
+                    continue
+                discovered.add(nsd_filepath)
+                self.base_nsd_filepaths.append(nsd_filepath)
+                kinds[nsd_filepath] = source.kind
+                if source.error is not None:
+                    outcomes[nsd_filepath] = (None, source.error)
+                    continue
+
+                content = source.content
+                if self.cache is not None:
+                    try:
+                        lookup = self.cache.lookup(nsd_filepath,
+                                                   source.kind) \
+                            if content is None \
+                            else self.cache.lookup_content(nsd_filepath,
+                                                           content,
+                                                           source.kind)
+                    except OSError as e:
+                        outcomes[nsd_filepath] = (None, e)
+                        continue
+                    if lookup.hit:
+                        outcomes[nsd_filepath] = (lookup.nsd_info, None)
+                        continue
+                    lookups[nsd_filepath] = lookup
+                    content = lookup.content
+
+                if self.workers == 1:
+                    outcomes[nsd_filepath] = _try_extract(
+                        nsd_filepath,
+                        content,
+                        source.kind
+                    )
+                    continue
+
+                batch.append((nsd_filepath, content, source.kind))
+                n_pending += 1
+                # Send the descriptors in batches growing with the number
+                # of descriptors found, to amortize the inter-process
+                # communication when there are many small ones. A single
+                # descriptor is parsed without starting the pool
+                if n_pending > 1 and \
+                        len(batch) >= n_pending // (self.workers * 4):
+                    if executor is None:
+                        executor = ProcessPoolExecutor(
+                            max_workers=self.workers
+                        )
+                    batches.append((
+                        [path for path, _, _ in batch],
+                        executor.submit(_try_extract_many, batch)
+                    ))
+                    batch = []
+
+            if executor is None:
+                batches.append((
+                    [path for path, _, _ in batch],
+                    _try_extract_many(batch)
+                ))
+            elif batch:
+                batches.append((
+                    [path for path, _, _ in batch],
+                    executor.submit(_try_extract_many, batch)
+                ))
+
+            with tracer.span("parse descriptors", "yaml",
+                             workers=self.workers):
+                for nsd_filepaths, results in batches:
+                    if executor is not None:
+                        results = results.result()
+                    outcomes.update(zip(nsd_filepaths, results))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        for nsd_filepath in self.base_nsd_filepaths:
+            if nsd_filepath not in outcomes:
+                continue
+            nsd_info, error = outcomes[nsd_filepath]
+            if error is not None:
+                self._report_error(nsd_filepath, error,
+                                   kinds[nsd_filepath])
+                continue
+            if kinds[nsd_filepath] == "vnfd":
+                self._add_vnfd_connection_points(nsd_filepath, nsd_info)
+            else:
+                self._add_connection_points(nsd_filepath, nsd_info)
+            lookup = lookups.get(nsd_filepath)
+            if lookup is not None:
+                self.cache.store(lookup, nsd_info)
+
+        if self.cache is not None:
+            self.cache.flush()
+
+    def update(self, nsd_filepaths):
+        '''
+        Parses the given descriptors again (e.g., after they changed),
+        keeping the connection points of the other ones.
+
+        Parameters
+        ----------
+        nsd_filepaths : list
+            Changed descriptors or packages. The connection points of the
+            ones that no longer exist are removed
+        '''
+        def is_updated(nsd_filepath):
+            # NSDs of packages are identified by "<package>:<member>"
+            return any(
+                nsd_filepath == updated or
+                nsd_filepath.startswith(updated + ":")
+                for updated
+                in nsd_filepaths
+            )
+
+        self.base_nsd_filepaths = [
+            nsd_filepath
+            for nsd_filepath
+            in self.base_nsd_filepaths
+            if not is_updated(nsd_filepath)
+        ]
+        for descriptors in (self.validated_connection_points,
+                            self.vnfd_connection_points):
+            for nsd_filepath in list(descriptors):
+                if is_updated(nsd_filepath):
+                    del descriptors[nsd_filepath]
+
+        existing = [
+            nsd_filepath
+            for nsd_filepath
+            in nsd_filepaths
+            if os.path.exists(nsd_filepath)
+        ]
+        if existing:
+            self.infer_connection_points(existing)
+
+        self.index = ConnectionPointsIndex()
+        self.vnfd_ids = {}
+        self.vnfds = {}
+        for nsd_info in self.validated_connection_points.values():
+            self._merge_connection_points(nsd_info)
+        for vnfd_info in self.vnfd_connection_points.values():
+            self.vnfds.update(vnfd_info["vnfds"])
 
     def parse_descriptor(self, nsd_filepath):
         '''
         Retrieves all the tags from the given descriptor
         '''
         try:
-            connection_points = []
-
-            with open(nsd_filepath, "r") as file:
-                descriptor = yaml.safe_load(file)
-
-            for network_service in descriptor['nsd']['nsd']:
-                ns_id = network_service['id']
-                for df in network_service['df']:
-                    connection_points += self.infer_connection_points_from_df(
-                        ns_id=ns_id,
-                        df=df,
-                    )
             # save connection points
-            self.validated_connection_points[nsd_filepath] = {
-                "ns_id": ns_id,
-                "connection_points": connection_points
-            }
+            self._add_connection_points(
+                nsd_filepath,
+                extract_connection_points(nsd_filepath)
+            )
 
         except Exception as e:
-            print("\nThe following exception occurred when trying to infer " +
-                  f"connection points for the NSD '{nsd_filepath}': {e}.")
+            self._report_error(nsd_filepath, e)
+
+    def _add_connection_points(self, nsd_filepath, nsd_info):
+        nsd_info = {
+            "ns_id": nsd_info["ns_id"],
+            "connection_points": ConnectionPointsIndex(
+                nsd_info["connection_points"]
+            ),
+            "vnfd_ids": nsd_info.get("vnfd_ids", {})
+        }
+        self.validated_connection_points[nsd_filepath] = nsd_info
+        self._merge_connection_points(nsd_info)
+
+    def _merge_connection_points(self, nsd_info):
+        self.index.update(nsd_info["connection_points"])
+        for ns_id, vnfd_ids in nsd_info["vnfd_ids"].items():
+            self.vnfd_ids.setdefault(ns_id, {}).update(vnfd_ids)
+
+    def _add_vnfd_connection_points(self, vnfd_filepath, vnfd_info):
+        self.vnfd_connection_points[vnfd_filepath] = vnfd_info
+        self.vnfds.update(vnfd_info["vnfds"])
+
+    def resolve(self, ns_id, vnf_id, cp_id):
+        '''
+        Resolves a connection point to the VDU interfaces it is mapped to,
+        by joining the NSDs' vnf-profiles with the VNFDs on their vnfd-id.
+        Each connection point is resolved by hash lookups only, so all of
+        them are resolved in linear time.
+
+        Returns
+        -------
+            Dictionary with the vnfd-id, the VDU ID, the internal
+            connection point ID and the VDU interfaces of the connection
+            point, or None if its VNFD was not found.
+        '''
+        vnfd_id = self.vnfd_ids.get(str(ns_id), {}).get(str(vnf_id))
+        ext_cpd = self.vnfds.get(vnfd_id, {}).get(str(cp_id))
+        if ext_cpd is None:
+            return None
+        return {"vnfd_id": vnfd_id, **ext_cpd}
+
+    def resolved_connection_points(self):
+        '''
+        Generates the (NS ID, VNF ID, connection point ID) of each of the
+        NSDs' connection points, along with its resolution (see `resolve`).
+        '''
+        for ns_id, vnf_id, cp_id in self.index:
+            yield (ns_id, vnf_id, cp_id), self.resolve(ns_id, vnf_id, cp_id)
+
+    def _report_error(self, nsd_filepath, error, kind="nsd"):
+        self.errors.append((nsd_filepath, kind, error))
+        if self.report_errors:
+            self._print_error(nsd_filepath, kind, error)
+
+    @staticmethod
+    def _print_error(nsd_filepath, kind, error):
+        print("\nThe following exception occurred when trying to infer " +
+              f"connection points for the {kind.upper()} " +
+              f"'{nsd_filepath}': {error}.")
+
+    def print_errors(self):
+        '''
+        Prints the errors of the descriptors that could not be parsed.
+        '''
+        for nsd_filepath, kind, error in self.errors:
+            self._print_error(nsd_filepath, kind, error)
 
     def infer_connection_points_from_df(self, ns_id, df):
-        connection_points = []
-        for vnf in df['vnf-profile']:
-            vnf_id = vnf['id']
-            for constituent in vnf['virtual-link-connectivity']:
-                for constituent_cpd in constituent["constituent-cpd-id"]:
-                    interface_id = constituent_cpd['constituent-cpd-id']
-                    connection_points.append(
-                        "{{deployment_info|" + f"{ns_id}|{vnf_id}|" +
-                        f"{interface_id}" + "}}"
-                    )
-        return connection_points
+        return infer_connection_points_from_df(ns_id, df)
 
     @property
     def connection_points(self):
         '''
-        Get interfaces
+        Get interfaces: the NS ID and the `ConnectionPointsIndex` of each
+        descriptor
         '''
         return self.validated_connection_points
+
+    def tags(self):
+        '''
+        Generates the tags of the connection points of all the descriptors,
+        without duplicates
+        '''
+        return self.index.tags()
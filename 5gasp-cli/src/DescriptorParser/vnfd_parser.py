@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:08:52
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:08:52
+'''
+Extracts, from OSM VNFDs, to which VDU internal connection point, and VDU
+interfaces, each external connection point of a VNF is mapped:
+
+    vnfd-id -> ext-cpd -> (vdu-id, int-cpd, interfaces)
+
+The NSDs' connection points are the VNFs' external connection points, so
+they are resolved by joining both on the vnf-profiles' vnfd-id.
+'''
+
+from helpers import yaml_io
+from helpers.tracing import tracer
+
+
+def _vnfds(descriptor):
+    # VNFDs are a single mapping in OSM's current information model, and a
+    # list in older ones
+    vnfds = descriptor['vnfd']
+    if isinstance(vnfds, dict) and 'vnfd' in vnfds:
+        vnfds = vnfds['vnfd']
+    return [vnfds] if isinstance(vnfds, dict) else vnfds
+
+
+def extract_vnfd_connection_points(vnfd_filepath, content=None):
+    '''
+    Retrieves the external connection points of a VNFD. This is a
+    module-level function, so it can run in a worker process.
+
+    Parameters
+    ----------
+    vnfd_filepath : str
+        Path of the descriptor
+    content : bytes
+        Content of the descriptor, if it was already read
+
+    Returns
+    -------
+        Dictionary with the external connection points of each VNFD in the
+        descriptor, by vnfd-id. Each one holds its VDU's ID, its internal
+        connection point's ID, and the names of the VDU interfaces of the
+        internal connection point (None, if not mapped to a VDU).
+    '''
+    with tracer.span("yaml.safe_load", "yaml", file=vnfd_filepath):
+        if content is not None:
+            descriptor = yaml_io.load(content)
+        else:
+            with open(vnfd_filepath, "rb") as file:
+                descriptor = yaml_io.load(file)
+
+    ext_cpds_per_vnfd = {}
+    for vnfd in _vnfds(descriptor):
+        # (vdu-id, int-cpd) -> interfaces, so each external connection
+        # point is resolved with a single lookup
+        interfaces = {}
+        for vdu in vnfd.get('vdu') or []:
+            for int_cpd in vdu.get('int-cpd') or []:
+                interfaces[(str(vdu['id']), str(int_cpd['id']))] = [
+                    str(requirement['name'])
+                    for requirement
+                    in int_cpd.get(
+                        'virtual-network-interface-requirement'
+                    ) or []
+                ]
+
+        ext_cpds = {}
+        for ext_cpd in vnfd.get('ext-cpd') or []:
+            int_cpd = ext_cpd.get('int-cpd') or {}
+            vdu_id = int_cpd.get('vdu-id')
+            cpd = int_cpd.get('cpd')
+            key = (str(vdu_id), str(cpd))
+            ext_cpds[str(ext_cpd['id'])] = {
+                "vdu_id": None if vdu_id is None else str(vdu_id),
+                "int_cpd": None if cpd is None else str(cpd),
+                "interfaces": interfaces.get(key, [])
+            }
+        ext_cpds_per_vnfd[str(vnfd['id'])] = ext_cpds
+    return {"vnfds": ext_cpds_per_vnfd}
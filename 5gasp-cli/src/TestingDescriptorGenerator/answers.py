@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:41:19
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:41:19
+'''
+Answers files, holding the answers to the prompts of
+`create-testing-descriptor`, so a testing descriptor can be generated
+without prompting the developer:
+
+    netapp_name: my-netapp
+    ns_name: my-ns
+    testbed_id: testbed_itav
+    test_cases:
+      - test: bandwidth
+        description: Bandwidth between both VNFs
+        parameters:
+          host1_ip: "{{deployment_info|my-ns|vnf1|vnf-mgmt-ext|ip-address}}"
+    # Optional. Test case IDs are the positions of the test cases,
+    # starting at 1
+    execution_order: [1]
+'''
+
+import yaml
+
+from DescriptorParser.connection_points_index import parse_tags
+from helpers import yaml_io
+
+
+class AnswersError(Exception):
+    '''
+    An answers file is invalid.
+    '''
+
+    def __init__(self, errors, filepath=None):
+        source = f"answers file {filepath}" if filepath else "answers"
+        super().__init__(
+            f"Invalid {source} ({len(errors)} errors):\n" +
+            "\n".join(f"  - {error}" for error in errors)
+        )
+        self.errors = errors
+        self.filepath = filepath
+
+
+def load_answers(filepath):
+    '''
+    Loads an answers file, checking its structure.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the answers file
+
+    Returns
+    -------
+        Dictionary with the answers. Test cases without parameters have an
+        empty dictionary of parameters.
+
+    Raises
+    ------
+    AnswersError
+        If the file cannot be read, or its structure is invalid.
+    '''
+    try:
+        with open(filepath, "rb") as answers_file:
+            answers = yaml_io.load(answers_file)
+    except (OSError, yaml.YAMLError) as e:
+        raise AnswersError([str(e)], filepath)
+
+    if not isinstance(answers, dict):
+        raise AnswersError(["expected a mapping of answers"], filepath)
+
+    errors = []
+    for key in ("netapp_name", "ns_name", "testbed_id"):
+        if not isinstance(answers.get(key), str) or not answers[key]:
+            errors.append(f"'{key}' must be a non-empty string")
+
+    test_cases = answers.get("test_cases")
+    if not isinstance(test_cases, list) or not test_cases:
+        errors.append("'test_cases' must be a non-empty list")
+        test_cases = []
+    for i, test_case in enumerate(test_cases):
+        if not isinstance(test_case, dict):
+            errors.append(f"test_cases[{i}] must be a mapping")
+            continue
+        if not isinstance(test_case.get("test"), str):
+            errors.append(f"test_cases[{i}].test must be a test ID")
+        test_case.setdefault("parameters", {})
+        if test_case["parameters"] is None:
+            test_case["parameters"] = {}
+        if not isinstance(test_case["parameters"], dict):
+            errors.append(f"test_cases[{i}].parameters must be a mapping")
+
+    execution_order = answers.get("execution_order")
+    if execution_order is not None and (
+        not isinstance(execution_order, list) or
+        not all(type(test_case_id) is int for test_case_id in
+                execution_order)
+    ):
+        errors.append("'execution_order' must be a list of test case IDs")
+
+    if errors:
+        raise AnswersError(errors, filepath)
+    return answers
+
+
+# Python types accepted for each test variable type. Integers are accepted
+# as floats, and booleans are not accepted as numbers
+_VARIABLE_TYPES = {
+    "str": (str,),
+    "int": (int,),
+    "float": (int, float),
+}
+
+
+def _has_type(value, variable_type):
+    python_types = _VARIABLE_TYPES.get(variable_type)
+    if python_types is None:
+        # Unknown types are not checked
+        return True
+    return isinstance(value, python_types) and not isinstance(value, bool)
+
+
+def check_parameters(test, parameters):
+    '''
+    Checks the parameters of a test case against the variables of its test,
+    as the prompts of `create-testing-descriptor` would.
+
+    Parameters
+    ----------
+    test : Test
+        Test of the test case
+    parameters : dict
+        Value of each test variable
+
+    Returns
+    -------
+        List of errors. Empty, if the parameters are valid.
+    '''
+    variables = {variable.name: variable for variable in test.test_variables}
+    errors = []
+    for key, value in parameters.items():
+        variable = variables.get(key)
+        if variable is None:
+            errors.append(
+                f"unknown parameter '{key}' (test '{test.id}' takes: " +
+                (", ".join(variables) or "no parameters") + ")"
+            )
+        elif variable.possible_options:
+            if value not in variable.possible_options:
+                errors.append(
+                    f"parameter '{key}' must be one of " +
+                    f"{variable.possible_options}, not {value!r}"
+                )
+        elif isinstance(value, str) and variable.can_be_injected_by_the_nods \
+                and parse_tags(value):
+            # Injected by the NODS, whatever the variable's type
+            continue
+        elif not _has_type(value, variable.type):
+            errors.append(
+                f"parameter '{key}' must be of type {variable.type}, not " +
+                f"{value!r}"
+            )
+    for variable in test.test_variables:
+        if variable.mandatory and variable.name not in parameters:
+            errors.append(f"missing mandatory parameter '{variable.name}'")
+    return errors
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:54:27
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:54:27
+'''
+Generation of testing descriptors from answers files (see `load_answers`),
+without prompts: one at a time, or many of them in parallel.
+
+When generating many descriptors, the tests catalog, and the connection
+points inferred from the NSDs, are handed to each worker process once,
+when it starts, so they are neither fetched again nor sent along with each
+answers file.
+'''
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from TestingDescriptorGenerator.answers import AnswersError, load_answers
+from TestingDescriptorGenerator.descriptor_generator import \
+    TestingDescriptorGenerator
+from helpers.file_utils import atomic_write
+
+ANSWERS_FILENAME_EXTENSIONS = (".yaml", ".yml")
+
+# Catalog and connection points of the worker processes, set when they start
+_worker_state = {}
+
+
+def generate_testing_descriptor(answers_filepath, get_tests,
+                                output_filepath, connection_points=None):
+    '''
+    Generates a testing descriptor from an answers file, and saves it.
+
+    Parameters
+    ----------
+    answers_filepath : str
+        Answers file
+    get_tests : callable
+        Retrieves the tests of a testbed
+    output_filepath : str
+        Where to save the testing descriptor
+    connection_points : ConnectionPointsIndex
+        Connection points inferred from the NSDs
+
+    Returns
+    -------
+        The `TestingDescriptorGenerator` of the descriptor.
+
+    Raises
+    ------
+    AnswersError
+        If the answers are invalid, or do not match the testbed's tests.
+        Nothing is saved, in that case.
+    '''
+    answers = load_answers(answers_filepath)
+    try:
+        tests = get_tests(answers["testbed_id"])
+    except KeyError:
+        tests = []
+    if not tests:
+        raise AnswersError(
+            [f"testbed '{answers['testbed_id']}' does not exist or does " +
+             "not provide tests"],
+            answers_filepath
+        )
+
+    try:
+        generator = TestingDescriptorGenerator.from_answers(
+            answers,
+            tests,
+            output_filepath,
+            connection_points
+        )
+    except AnswersError as e:
+        raise AnswersError(e.errors, answers_filepath)
+
+    atomic_write(
+        output_filepath,
+        generator.render_testing_descriptor().encode()
+    )
+    return generator
+
+
+def unknown_connection_point_warnings(generator):
+    '''
+    Returns
+    -------
+        List of warnings about the test variables of a generator referring
+        to connection points that were not inferred from the NSDs.
+    '''
+    return [
+        f"test case {test_case.test_case_id} ({test_case.test.id}) " +
+        f"variable '{key}' refers to an unknown connection point: {value}"
+        for test_case, key, value
+        in generator.unknown_connection_points()
+    ]
+
+
+def find_answers_files(answers_directory):
+    '''
+    Lists the answers files (`.yaml` and `.yml`) of a directory, sorted.
+    '''
+    return [
+        os.path.join(answers_directory, filename)
+        for filename
+        in sorted(os.listdir(answers_directory))
+        if filename.lower().endswith(ANSWERS_FILENAME_EXTENSIONS) and
+        os.path.isfile(os.path.join(answers_directory, filename))
+    ]
+
+
+def _init_worker(catalog, connection_points):
+    _worker_state["catalog"] = catalog
+    _worker_state["connection_points"] = connection_points
+
+
+def _generate(task):
+    # Module-level, so it can run in a worker process
+    answers_filepath, output_filepath = task
+    catalog = _worker_state["catalog"]
+    start = time.perf_counter()
+    result = {
+        "answers_filepath": answers_filepath,
+        "output_filepath": output_filepath,
+        "errors": [],
+        "warnings": []
+    }
+    try:
+        generator = generate_testing_descriptor(
+            answers_filepath,
+            lambda testbed_id: catalog.get(testbed_id, []),
+            output_filepath,
+            _worker_state["connection_points"]
+        )
+        result["warnings"] = unknown_connection_point_warnings(generator)
+    except AnswersError as e:
+        result["errors"] = e.errors
+    except OSError as e:
+        result["errors"] = [str(e)]
+    except Exception as e:
+        # Any other failure is reported as this descriptor's, so it does
+        # not abort the generation of the remaining ones
+        result["errors"] = [f"{type(e).__name__}: {e}"]
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def generate_many(answers_filepaths, output_directory, catalog,
+                  connection_points=None, workers=1):
+    '''
+    Generates the testing descriptors of many answers files. Each one is
+    saved in the output directory, with the name of its answers file.
+
+    Parameters
+    ----------
+    answers_filepaths : list
+        Answers files
+    output_directory : str
+        Where to save the testing descriptors
+    catalog : dict
+        List of tests of each testbed (see `get_catalog`)
+    connection_points : ConnectionPointsIndex
+        Connection points inferred from the NSDs
+    workers : int
+        Number of processes generating the descriptors
+
+    Returns
+    -------
+        List with the result of each answers file, in the given order:
+        its output file, the errors that prevented its generation, the
+        warnings about unknown connection points, and the seconds it took.
+    '''
+    os.makedirs(output_directory, exist_ok=True)
+    tasks = [
+        (
+            answers_filepath,
+            os.path.join(output_directory,
+                         os.path.basename(answers_filepath))
+        )
+        for answers_filepath
+        in answers_filepaths
+    ]
+
+    # A single process needs no pool, nor copies of the catalog
+    if workers == 1 or len(tasks) <= 1:
+        _init_worker(catalog, connection_points)
+        try:
+            return [_generate(task) for task in tasks]
+        finally:
+            _worker_state.clear()
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        initializer=_init_worker,
+        initargs=(catalog, connection_points)
+    ) as executor:
+        # Several answers files per task, so the pool's overhead is paid
+        # once per chunk, while keeping the workers balanced
+        chunksize = max(1, len(tasks) // (workers * 4))
+        return list(executor.map(_generate, tasks, chunksize=chunksize))
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:58:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:58:12
+
+from helpers.base_testing_descriptor import new_testing_descriptor
+
+
+class TestingDescriptorBuilder:
+    '''
+    Builds testing descriptors, without prompts:
+
+        testing_descriptor = TestingDescriptorBuilder(
+            "my-netapp", "my-ns", "testbed_itav"
+        ).add_testcase(
+            1, "predefined", "bandwidth", "Bandwidth between both VNFs",
+            {"host1_ip": "{{deployment_info|my-ns|vnf1|vnf-mgmt-ext}}"}
+        ).set_execution_order([1]).build()
+
+    Each `build` returns a new descriptor, filled in from the read-only
+    template, so builders hold no state shared with other builders. They
+    can be used any number of times in a long-lived process, and
+    concurrently by several threads, as long as each thread uses its own
+    builder.
+    '''
+
+    def __init__(self, netapp_id, network_service_id, testbed_id,
+                 description=None):
+        '''
+        Parameters
+        ----------
+        netapp_id : str
+            NetApp's name
+        network_service_id : str
+            Network service's name
+        testbed_id : str
+            Testbed where the NetApp will be validated
+        description : str
+            Descriptor's description. By default, it refers to the NetApp
+        '''
+        self.netapp_id = netapp_id
+        self.network_service_id = network_service_id
+        self.testbed_id = testbed_id
+        self.description = description if description is not None else \
+            f"Testing Descriptor for the {netapp_id} Network Application"
+        self.testcases = []
+        self.execution_order = None
+
+    def add_testcase(self, testcase_id, test_type, name, description,
+                     parameters):
+        '''
+        Adds a test case.
+
+        Parameters
+        ----------
+        testcase_id : int
+            Test case ID
+        test_type : str
+            Type of the test (e.g., predefined)
+        name : str
+            Test ID
+        description : str
+            Test case's description
+        parameters : dict
+            Value of each test variable
+
+        Returns
+        -------
+            The builder, so calls can be chained.
+        '''
+        self.testcases.append(
+            (testcase_id, test_type, name, description, parameters)
+        )
+        return self
+
+    def set_execution_order(self, testcase_ids):
+        '''
+        Sets the order in which the test cases are executed. By default,
+        they are executed in the order in which they were added.
+
+        Returns
+        -------
+            The builder, so calls can be chained.
+        '''
+        self.execution_order = testcase_ids
+        return self
+
+    def build(self):
+        '''
+        Returns
+        -------
+            New testing descriptor, as a dictionary.
+        '''
+        testing_descriptor = new_testing_descriptor()
+        test_info = testing_descriptor["test_info"]
+        test_info["netapp_id"] = self.netapp_id
+        test_info["network_service_id"] = self.network_service_id
+        test_info["testbed_id"] = self.testbed_id
+        test_info["description"] = self.description
+
+        testing_descriptor["test_phases"]["setup"]["testcases"] = [
+            {
+                "testcase_id": testcase_id,
+                "type": test_type,
+                "scope": test_type,
+                "name": name,
+                "description": description,
+                "parameters": [
+                    {"key": key, "value": value}
+                    for key, value
+                    in parameters.items()
+                ]
+            }
+            for testcase_id, test_type, name, description, parameters
+            in self.testcases
+        ]
+        testing_descriptor["test_phases"]["execution"][0]["executions"]\
+            [0]["testcase_ids"] = list(
+                self.execution_order if self.execution_order is not None
+                else (testcase[0] for testcase in self.testcases)
+            )
+        return testing_descriptor
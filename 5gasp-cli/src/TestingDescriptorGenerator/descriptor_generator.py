@@ -2,25 +2,31 @@
 # @Author: Eduardo Santos
 # @Date:   2023-04-03 23:41:36
 # @Last Modified by:   Rafael Direito
-# @Last Modified time: 2023-05-18 15:21:39
+# @Last Modified time: 2026-10-18 23:58:12
 
 # OS
 import os
 from helpers.beatiful_prints import PrintAsTable, PrintAsPanelColumns
 from helpers import prompts
-import yaml
+from helpers import yaml_io
 
 from rich.prompt import Prompt, FloatPrompt, IntPrompt, Confirm
 from rich.text import Text
 from rich.console import Console
 from CICDManagerAPIClient.test_classes import TestCase
+from DescriptorParser.connection_points_index import parse_tags
+from TestingDescriptorGenerator.answers import AnswersError, \
+    check_parameters
+from TestingDescriptorGenerator.descriptor_builder import \
+    TestingDescriptorBuilder
 from helpers.connection_point_tags import CONNECTION_POINT_TAGS
-from helpers.base_testing_descriptor import BASE_TESTING_DESCRIPTOR
+from helpers.tracing import tracer
 
 
 class TestingDescriptorGenerator:
     def __init__(self, netapp_name, ns_name, testbed_id, tests,
                  output_filepath, connection_points=None):
+        # ConnectionPointsIndex of the NSDs' connection points
         self.netapp_name = netapp_name
         self.ns_name = ns_name
         self.testbed_id = testbed_id
@@ -30,16 +36,31 @@ class TestingDescriptorGenerator:
         self.test_cases = []
         self.tests_cases_ids_ordered_by_user = []
         self.last_test_id = 1
+        # Panel columns already printed, reused on each redraw
+        self._panel_columns = {}
+
+    def _print_panel_columns(self, name, panels):
+        # The panels are memoized, so getting the same ones means they did
+        # not change, and their columns need not be sorted and built again
+        panel_columns = self._panel_columns.get(name)
+        if panel_columns is None or \
+                len(panel_columns.panels) != len(panels) or \
+                any(old is not new
+                    for old, new
+                    in zip(panel_columns.panels, panels)):
+            panel_columns = PrintAsPanelColumns(panels)
+            self._panel_columns[name] = panel_columns
+        panel_columns.print()
 
     def _show_test_info(self):
         test_id = Prompt.ask(
                 "For which test do you wish to see additional information? ",
                 choices=[str(i) for i in range(1, len(self.tests)+1)]
             )
-        panels = PrintAsPanelColumns(
-                panels=[self.tests[int(test_id)-1].to_panel(expand=True)]
-            )
-        panels.print()
+        self._print_panel_columns(
+            "test_info",
+            [self.tests[int(test_id)-1].to_panel(expand=True)]
+        )
 
     def __test_variable_input(self, test_variable):
         value = None
@@ -48,12 +69,9 @@ class TestingDescriptorGenerator:
 
         if test_variable.can_be_injected_by_the_nods and self.connection_points:
 
-            connection_points = []
+            connection_points = list(self.connection_points.tags())
             connection_point_keys = list(CONNECTION_POINT_TAGS.keys())
 
-            for cps in self.connection_points.values():
-                connection_points += cps["connection_points"]
-
             # Prepare table printing
             tmp_smaller_list = connection_points \
                 if len(connection_points) < len(connection_point_keys) \
@@ -153,9 +171,10 @@ class TestingDescriptorGenerator:
                       style="bold")
         console.print(header)
         # Print all configured Test Cases
-        panels = [tc.to_panel(expand=False) for tc in self.test_cases]
-        panel_columns = PrintAsPanelColumns(panels)
-        panel_columns.print()
+        self._print_panel_columns(
+            "test_cases",
+            [tc.to_panel(expand=False) for tc in self.test_cases]
+        )
 
     def _finish_test_cases_definition(self):
         console = Console()
@@ -258,15 +277,11 @@ class TestingDescriptorGenerator:
 
         console.print(Text("\nTest Case Information:", style="bold"))
 
-        panels = PrintAsPanelColumns(panels=[test_case.test.to_panel()])
-        panels.print()
+        self._print_panel_columns("test", [test_case.test.to_panel()])
 
         console.print(Text("\nCurrent Test Case Definition:", style="bold"))
 
-        panels = PrintAsPanelColumns(
-            panels=[test_case.to_panel()]
-        )
-        panels.print()
+        self._print_panel_columns("test_case", [test_case.to_panel()])
 
         for variable, value in test_case.test_variables.items():
             info = Text()
@@ -367,56 +382,157 @@ class TestingDescriptorGenerator:
             #console.print(info)
         return True
 
-    def _save_testing_decritptor(self):
-        testing_descriptor = BASE_TESTING_DESCRIPTOR
-        testing_descriptor["test_info"]["netapp_id"] = self.netapp_name
-        testing_descriptor["test_info"]["network_service_id"] = self.ns_name
-        testing_descriptor["test_info"]["testbed_id"] = self.testbed_id
-        testing_descriptor["test_info"]["description"] = "Testing "\
-            f"Descriptor for the {self.netapp_name} Network Application"
-
-        testcases = []
-        for tc in self.test_cases:
-            tc_dict = {
-                "testcase_id": tc.test_case_id,
-                "type": tc.test.test_type,
-                "scope": tc.test.test_type,
-                "name": tc.test.id,
-                "description": tc.description,
-                "parameters": []
-            }
-            for key, value in tc.test_variables.items():
-                tc_dict["parameters"].append(
-                    {
-                        "key": key,
-                        "value": value
-                    }
-                )
-
-            testcases.append(tc_dict)
+    @classmethod
+    def from_answers(cls, answers, tests, output_filepath,
+                     connection_points=None):
+        '''
+        Creates a generator whose test cases are defined by an answers file,
+        instead of prompting the developer.
+
+        Parameters
+        ----------
+        answers : dict
+            Answers, as loaded by `load_answers`
+        tests : list
+            Tests of the answers' testbed
+        output_filepath : str
+            Where to save the testing descriptor
+        connection_points : ConnectionPointsIndex
+            Connection points inferred from the NSDs
+
+        Raises
+        ------
+        AnswersError
+            If the answers refer to tests, or test cases, that do not exist,
+            if the test cases' parameters do not match their tests'
+            variables (see `check_parameters`), or if the execution order
+            does not hold each test case exactly once.
+        '''
+        generator = cls(
+            netapp_name=answers["netapp_name"],
+            ns_name=answers["ns_name"],
+            testbed_id=answers["testbed_id"],
+            tests=tests,
+            output_filepath=output_filepath,
+            connection_points=connection_points
+        )
 
-        testing_descriptor["test_phases"]["setup"]["testcases"] = testcases
-        testing_descriptor["test_phases"]["execution"][0]["executions"]\
-            [0]["testcase_ids"] = self.tests_cases_ids_ordered_by_user
+        tests_by_id = {test.id: test for test in tests}
+        errors = []
+        for i, test_case_answers in enumerate(answers["test_cases"]):
+            test = tests_by_id.get(test_case_answers["test"])
+            if test is None:
+                errors.append(
+                    f"test_cases[{i}]: test '{test_case_answers['test']}' " +
+                    f"does not exist in testbed '{generator.testbed_id}'"
+                )
+                # Test case IDs are the test cases' positions
+                generator.last_test_id += 1
+                continue
+            errors.extend(
+                f"test_cases[{i}]: {error}"
+                for error
+                in check_parameters(test, test_case_answers["parameters"])
+            )
+            test_case = TestCase(
+                test=test,
+                description=test_case_answers.get("description"),
+                test_case_id=generator.last_test_id
+            )
+            for key, value in test_case_answers["parameters"].items():
+                test_case.add_test_variable(key=key, value=value)
+            generator.test_cases.append(test_case)
+            generator.last_test_id += 1
+
+        test_case_ids = list(range(1, generator.last_test_id))
+        execution_order = answers.get("execution_order") or test_case_ids
+        for test_case_id in execution_order:
+            if test_case_id not in test_case_ids:
+                errors.append(
+                    f"execution_order: test case {test_case_id} does not " +
+                    "exist"
+                )
+        if len(set(execution_order)) != len(execution_order):
+            errors.append("execution_order: test cases must appear once")
+        missing = [
+            test_case_id
+            for test_case_id
+            in test_case_ids
+            if test_case_id not in execution_order
+        ]
+        if missing:
+            errors.append(f"execution_order: missing test cases {missing}")
+        if errors:
+            raise AnswersError(errors)
+        generator.tests_cases_ids_ordered_by_user = list(execution_order)
+        return generator
+
+    def unknown_connection_points(self):
+        '''
+        Finds the test variables referring to connection points that were
+        not inferred from the NSDs.
+
+        Returns
+        -------
+            List of the (test case, variable name, value) of each of them.
+        '''
+        if self.connection_points is None:
+            return []
+        return [
+            (test_case, key, value)
+            for test_case in self.test_cases
+            for key, value in test_case.test_variables.items()
+            if any(
+                tag not in self.connection_points
+                for tag
+                in parse_tags(value)
+            )
+        ]
+
+    def build_testing_descriptor(self):
+        '''
+        Builds the testing descriptor from the configured test cases.
+
+        Returns
+        -------
+            Testing descriptor, as a dictionary.
+        '''
+        builder = TestingDescriptorBuilder(
+            netapp_id=self.netapp_name,
+            network_service_id=self.ns_name,
+            testbed_id=self.testbed_id
+        )
+        for tc in self.test_cases:
+            builder.add_testcase(
+                testcase_id=tc.test_case_id,
+                test_type=tc.test.test_type,
+                name=tc.test.id,
+                description=tc.description,
+                parameters=tc.test_variables
+            )
+        builder.set_execution_order(self.tests_cases_ids_ordered_by_user)
+        return builder.build()
+
+    def render_testing_descriptor(self):
+        '''
+        Returns
+        -------
+            Testing descriptor, as YAML.
+        '''
+        with tracer.span("yaml.dump", "serialization",
+                         file=self.output_filepath):
+            return yaml_io.dump(self.build_testing_descriptor())
 
+    def _save_testing_decritptor(self):
+        # The descriptor is serialized once, to be saved and printed
+        testing_descriptor_yaml = self.render_testing_descriptor()
         with open(self.output_filepath, 'w') as output_file:
-            yaml.dump(
-                testing_descriptor,
-                output_file,
-                default_flow_style=False,
-                sort_keys=False
-            )
+            output_file.write(testing_descriptor_yaml)
 
         console = Console()
         console.print(Text("\nGenerated Testing Descriptor:", style="bold"))
 
-        print(
-            yaml.dump(
-                testing_descriptor,
-                default_flow_style=False,
-                sort_keys=False
-            )
-        )
+        print(testing_descriptor_yaml)
 
         info = Text()
         info.append("\nThe Testing Descriptor was saved in the " +
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:41:19
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:41:19
+
+import glob
+import os
+import time
+
+from DescriptorParser.nsd_discovery import location_filepath
+from DescriptorParser.parser import ConnectionPointsParser
+from TestingDescriptorGenerator.answers import AnswersError, load_answers
+from TestingDescriptorGenerator.batch_generator import \
+    unknown_connection_point_warnings
+from TestingDescriptorGenerator.descriptor_generator import \
+    TestingDescriptorGenerator
+from helpers.file_utils import atomic_write
+from helpers.file_watcher import create_file_watcher
+
+
+class DescriptorWatcher:
+    '''
+    Keeps a testing descriptor up to date with an answers file and the
+    NSDs its connection points are inferred from.
+
+    When files change, the changes are debounced: they are gathered until
+    no file changed for `debounce` seconds, as editors and tools often
+    write a file several times in a row. Then, only the changed NSDs are
+    parsed again, and the descriptor is only rewritten if its content
+    changed.
+    '''
+
+    def __init__(self, nsd_locations, answers_filepath, output_filepath,
+                 get_tests, workers=1, cache=None, debounce=0.2,
+                 polling=False):
+        '''
+        Parameters
+        ----------
+        nsd_locations : list
+            NSD files, directories, glob patterns or OSM NS packages
+        answers_filepath : str
+            Answers file (see `load_answers`)
+        output_filepath : str
+            Where to save the testing descriptor
+        get_tests : callable
+            Retrieves the tests of a testbed
+        workers : int
+            Number of processes parsing the NSDs
+        cache : ConnectionPointsCache
+            Cache of the NSDs' connection points
+        debounce : float
+            Seconds without changes before regenerating the descriptor
+        polling : bool
+            Whether to poll the files, instead of using inotify
+        '''
+        self.nsd_locations = nsd_locations
+        self.answers_filepath = os.path.abspath(answers_filepath)
+        self.output_filepath = output_filepath
+        self.get_tests = get_tests
+        self.workers = workers
+        self.cache = cache
+        self.debounce = debounce
+        self.polling = polling
+        self.tags_parser = None
+        self.answers = None
+        self.regenerations = 0
+        self._tests = {}
+        self._testing_descriptor_yaml = None
+
+    def _watched_directories(self):
+        directories = {os.path.dirname(self.answers_filepath)}
+        recursive_directories = set()
+        for location in self.nsd_locations:
+            if glob.has_magic(location) and not os.path.exists(location):
+                # The directory before the first pattern component
+                root = os.path.dirname(location)
+                while glob.has_magic(root):
+                    root = os.path.dirname(root)
+                recursive_directories.add(os.path.abspath(root or "."))
+            elif os.path.isdir(location):
+                recursive_directories.add(os.path.abspath(location))
+            else:
+                directories.add(
+                    os.path.dirname(os.path.abspath(location))
+                )
+        return directories, recursive_directories
+
+    def _nsd_location(self, path):
+        # The path of a changed file, as the parser found it, if it is one
+        # of the descriptors (or packages) in the given locations
+        for location in self.nsd_locations:
+            filepath = location_filepath(location, path)
+            if filepath is not None:
+                return filepath
+        return None
+
+    def _tests_of(self, testbed_id):
+        if testbed_id not in self._tests:
+            self._tests[testbed_id] = self.get_tests(testbed_id)
+        return self._tests[testbed_id]
+
+    def start(self):
+        '''
+        Parses the NSDs and the answers, and generates the descriptor.
+        '''
+        self.tags_parser = ConnectionPointsParser(
+            self.nsd_locations,
+            self.workers,
+            self.cache
+        )
+        self._reload_answers()
+        return self.regenerate()
+
+    def _reload_answers(self):
+        try:
+            self.answers = load_answers(self.answers_filepath)
+        except AnswersError as e:
+            # Keep the last valid answers while the file is being edited
+            print(f"\n{e}")
+
+    def regenerate(self):
+        '''
+        Generates the testing descriptor, and rewrites it if it changed.
+
+        Returns
+        -------
+            Whether the descriptor was rewritten.
+        '''
+        if self.answers is None:
+            return False
+        try:
+            generator = TestingDescriptorGenerator.from_answers(
+                self.answers,
+                self._tests_of(self.answers["testbed_id"]),
+                self.output_filepath,
+                self.tags_parser.index
+            )
+        except AnswersError as e:
+            print(f"\n{e}")
+            return False
+
+        for warning in unknown_connection_point_warnings(generator):
+            print(f"\nWarning: {warning}")
+
+        testing_descriptor_yaml = generator.render_testing_descriptor()
+        if testing_descriptor_yaml == self._testing_descriptor_yaml:
+            return False
+        atomic_write(self.output_filepath, testing_descriptor_yaml.encode())
+        self._testing_descriptor_yaml = testing_descriptor_yaml
+        self.regenerations += 1
+        return True
+
+    def _wait_for_changes(self, watcher, timeout):
+        changed = watcher.changes(timeout)
+        if not changed:
+            return changed
+        # Debounce
+        while True:
+            more = watcher.changes(self.debounce)
+            if not more:
+                return changed
+            changed |= more
+
+    def handle_changes(self, changed):
+        '''
+        Updates the descriptor after some files changed.
+
+        Parameters
+        ----------
+        changed : set
+            Absolute paths of the changed files
+
+        Returns
+        -------
+            Whether the descriptor was rewritten.
+        '''
+        changed_nsds = []
+        for path in sorted(changed):
+            location = self._nsd_location(path)
+            if location is not None:
+                changed_nsds.append(location)
+        answers_changed = self.answers_filepath in changed
+        if not changed_nsds and not answers_changed:
+            return False
+
+        if changed_nsds:
+            self.tags_parser.update(changed_nsds)
+        if answers_changed:
+            self._reload_answers()
+        return self.regenerate()
+
+    def run(self, timeout=None, max_updates=None):
+        '''
+        Watches the files, updating the descriptor when they change.
+
+        Parameters
+        ----------
+        timeout : float
+            Stop after this number of seconds without changes
+        max_updates : int
+            Stop after handling this number of changes
+        '''
+        directories, recursive_directories = self._watched_directories()
+        updates = 0
+        with create_file_watcher(directories, recursive_directories,
+                                 polling=self.polling) as watcher:
+            while max_updates is None or updates < max_updates:
+                changed = self._wait_for_changes(watcher, timeout)
+                if not changed:
+                    if timeout is not None:
+                        return
+                    continue
+                start = time.perf_counter()
+                if self.handle_changes(changed):
+                    print(
+                        "Testing descriptor updated in " +
+                        f"{(time.perf_counter() - start) * 1000:.0f} ms: " +
+                        self.output_filepath
+                    )
+                updates += 1
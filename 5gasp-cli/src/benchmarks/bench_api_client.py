@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 15:58:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 15:58:12
+'''
+Measures the CICDManagerAPIClient throughput and latency percentiles under
+concurrency, against a local CI/CD Manager stand-in.
+
+A single client is shared by all the workers, with request coalescing and
+caching disabled, so every call reaches the stand-in.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_api_client --requests 500 \\
+        --concurrency 1 4 16 --latency 0.01
+'''
+
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from CICDManagerAPIClient.apli_client import CICDManagerAPIClient
+from CICDManagerStandIn.server import CICDManagerStandIn
+from helpers import constants as Constants
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return float("nan")
+    index = min(int(round(p / 100 * (len(sorted_values) - 1))),
+                len(sorted_values) - 1)
+    return sorted_values[index]
+
+
+def run(api_client, testbeds, n_requests, concurrency, seed):
+    rng = random.Random(seed)
+    chosen_testbeds = [rng.choice(testbeds) for _ in range(n_requests)]
+
+    def timed_request(testbed):
+        start = time.perf_counter()
+        try:
+            ok = len(api_client.get_tests_per_testbed(testbed)) > 0
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(timed_request, chosen_testbeds))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, ok in results if ok)
+    return {
+        "throughput": n_requests / elapsed,
+        "errors": sum(1 for _, ok in results if not ok),
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p99": percentile(latencies, 99),
+        "mean": statistics.fmean(latencies) if latencies else float("nan")
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+",
+                        default=[1, 4, 16])
+    parser.add_argument("--pool-size", type=int,
+                        default=Constants.CI_CD_SERVICE_POOL_MAXSIZE)
+    parser.add_argument("--testbeds", type=int, default=5)
+    parser.add_argument("--tests", type=int, default=20,
+                        help="Tests per testbed")
+    parser.add_argument("--latency", type=float, default=0.005,
+                        help="Seconds added by the stand-in to each response")
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    stand_in = CICDManagerStandIn(
+        n_testbeds=args.testbeds,
+        tests_per_testbed=args.tests,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        seed=args.seed
+    )
+    Constants.CI_CD_SERVICE_URL = stand_in.url
+    testbeds = [t["id"] for t in stand_in.testbeds]
+
+    print(f"Stand-in: {args.testbeds} testbeds x {args.tests} tests | " +
+          f"latency {args.latency * 1000:.1f} ms | " +
+          f"error rate {args.error_rate:.1%} | pool size {args.pool_size}")
+    print(f"{'concurrency':>11} {'req/s':>9} {'p50 ms':>8} {'p90 ms':>8} " +
+          f"{'p99 ms':>8} {'errors':>7} {'conns':>6}")
+
+    with stand_in:
+        for concurrency in args.concurrency:
+            with CICDManagerAPIClient(pool_maxsize=args.pool_size,
+                                      memoize=False) as api_client:
+                result = run(api_client, testbeds, args.requests,
+                             concurrency, args.seed)
+                connections = api_client.connection_stats[
+                    "connections_opened"
+                ]
+            print(f"{concurrency:>11} {result['throughput']:>9.1f} " +
+                  f"{result['p50'] * 1000:>8.2f} " +
+                  f"{result['p90'] * 1000:>8.2f} " +
+                  f"{result['p99'] * 1000:>8.2f} " +
+                  f"{result['errors']:>7} {connections:>6}")
+
+
+if __name__ == "__main__":
+    main()
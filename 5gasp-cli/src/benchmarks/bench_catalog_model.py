@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 18:02:37
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 18:02:37
+'''
+Compares the memory held by a catalog of tests built with dict-backed model
+objects (as before the catalog model used __slots__) versus with the
+current slotted and interned model.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_catalog_model --testbeds 50 --tests 200
+'''
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from CICDManagerAPIClient.test_classes import Test
+from CICDManagerStandIn.catalog import synthetic_tests_body
+
+
+class DictTest:
+    def __init__(self, test_dict):
+        self.id = test_dict["id"]
+        self.name = test_dict["name"]
+        self.description = test_dict["description"]
+        self.mandatory = test_dict["mandatory"]
+        self.test_type = "predefined"
+        self.test_variables = [
+            DictTestVariable(test_variable)
+            for test_variable
+            in test_dict.get("test_variables", [])
+        ]
+
+
+class DictTestVariable:
+    def __init__(self, test_variable):
+        self.name = test_variable["variable_name"]
+        self.description = test_variable["description"]
+        self.mandatory = test_variable["mandatory"]
+        self.possible_options = test_variable["possible_options"]
+        self.type = test_variable["type"]
+        self.can_be_injected_by_the_nods = \
+            test_variable["can_be_injected_by_the_nods"]
+
+
+def dict_model(body):
+    return {
+        testbed: [DictTest(test_dict) for test_dict in tests.values()]
+        for testbed, tests
+        in json.loads(body)["data"]["tests"].items()
+    }
+
+
+def slotted_model(body):
+    return {
+        testbed: Test.from_testbed_payload(tests)
+        for testbed, tests
+        in json.loads(body)["data"]["tests"].items()
+    }
+
+
+def measure(func, body, repeat):
+    gc.collect()
+    tracemalloc.start()
+    catalog = func(body)
+    # Only the memory still held by the catalog is accounted
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del catalog
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    return retained, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--testbeds", type=int, default=50)
+    parser.add_argument("--tests", type=int, default=200,
+                        help="Tests per testbed")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = synthetic_tests_body(args.testbeds, args.tests)
+    n_tests = args.testbeds * args.tests
+    print(f"Catalog: {args.testbeds} testbeds x {args.tests} tests")
+
+    for name, func in [("dict model", dict_model),
+                       ("slotted model", slotted_model)]:
+        retained, latency = measure(func, body, args.repeat)
+        print(f"{name:>14}: retained {retained / 2**20:7.2f} MiB " +
+              f"({retained / n_tests:7.0f} B/test) | " +
+              f"build {latency * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
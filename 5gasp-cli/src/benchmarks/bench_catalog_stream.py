@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 14:15:22
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 14:15:22
+'''
+Compares the peak memory and latency of gathering one testbed's tests from
+a large `/tests/all` catalog, by decoding the whole catalog versus by
+parsing it incrementally.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_catalog_stream --testbeds 50 --tests 200
+'''
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from CICDManagerAPIClient.catalog_stream import iter_testbed_tests
+from CICDManagerAPIClient.test_classes import Test
+from CICDManagerStandIn.catalog import synthetic_tests_body
+
+
+def full_parse(body, testbed):
+    tests = []
+    for test_info in json.loads(body)["data"]["tests"][testbed].values():
+        t = Test()
+        t.load_from_dict(test_info)
+        tests.append(t)
+    return tests
+
+
+def streaming_parse(body, testbed):
+    return list(iter_testbed_tests(body, testbed))
+
+
+def measure(func, body, testbed, repeat):
+    tracemalloc.start()
+    func(body, testbed)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body, testbed)
+        timings.append(time.perf_counter() - start)
+    return peak, min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--testbeds", type=int, default=50)
+    parser.add_argument("--tests", type=int, default=200,
+                        help="Tests per testbed")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = synthetic_tests_body(args.testbeds, args.tests)
+    # The last testbed is the worst case for the incremental parser, as all
+    # the other testbeds must be skipped before reaching it
+    testbed = f"testbed_{args.testbeds - 1}"
+    print(f"Catalog: {args.testbeds} testbeds x {args.tests} tests " +
+          f"({len(body) / 2**20:.1f} MiB)")
+
+    for name, func in [("full parse", full_parse),
+                       ("streaming parse", streaming_parse)]:
+        peak, latency = measure(func, body, testbed, args.repeat)
+        print(f"{name:>16}: peak memory {peak / 2**20:8.2f} MiB | " +
+              f"latency {latency * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
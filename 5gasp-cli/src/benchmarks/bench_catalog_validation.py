@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 19:16:48
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 19:16:48
+'''
+Measures the overhead of validating a `/tests/all` catalog against its
+schema, compared to decoding it and building its tests without any checks.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_catalog_validation --tests 1000 10000
+'''
+
+import argparse
+import json
+import time
+
+from CICDManagerAPIClient.catalog_schema import validate_tests_payload
+from CICDManagerAPIClient.test_classes import Test
+from CICDManagerStandIn.catalog import synthetic_tests_body
+
+
+def unchecked_build(body):
+    return {
+        testbed: Test.from_testbed_payload(tests)
+        for testbed, tests
+        in json.loads(body)["data"]["tests"].items()
+    }
+
+
+def best_of(func, body, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(body)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tests", type=int, nargs="+",
+                        default=[1000, 10000],
+                        help="Total number of tests of each catalog")
+    parser.add_argument("--testbeds", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for n_tests in args.tests:
+        tests_per_testbed = max(n_tests // args.testbeds, 1)
+        body = synthetic_tests_body(args.testbeds, tests_per_testbed)
+        n_tests = args.testbeds * tests_per_testbed
+
+        unchecked = best_of(unchecked_build, body, args.repeat)
+        validated = best_of(validate_tests_payload, body, args.repeat)
+        overhead = (validated - unchecked) / n_tests * 1000
+        print(f"{n_tests:>7} tests: unchecked {unchecked * 1000:8.2f} ms | " +
+              f"validated {validated * 1000:8.2f} ms | " +
+              f"overhead {overhead * 1000:6.2f} ms per 1k tests")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:16:32
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:16:32
+'''
+Measures how the connection points index scales with the number of
+vnf-profiles of an NSD, compared with the flat list of tags it replaced.
+
+Each NSD is given twice (as two copies), so the flat list holds every tag
+twice, as when the same NSD is found in a directory and in a package.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_connection_points_index --vnfs 1000 10000
+'''
+
+import argparse
+import random
+import shutil
+import tempfile
+import time
+
+from DescriptorParser.parser import ConnectionPointsParser
+from benchmarks.synthetic_nsd import write_synthetic_nsds
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vnfs", type=int, nargs="+",
+                        default=[1000, 10000],
+                        help="vnf-profiles of the NSD")
+    parser.add_argument("--cps-per-vnf", type=int, default=2)
+    parser.add_argument("--lookups", type=int, default=1000)
+    args = parser.parse_args()
+
+    for n_vnfs in args.vnfs:
+        with tempfile.TemporaryDirectory() as directory:
+            nsd_filepath, = write_synthetic_nsds(
+                directory, 1, n_vnfs=n_vnfs, cps_per_vnf=args.cps_per_vnf
+            )
+            copy_filepath = nsd_filepath.replace(".yaml", "_copy.yaml")
+            shutil.copy(nsd_filepath, copy_filepath)
+            tags_parser, parse_time = timed(
+                ConnectionPointsParser, [nsd_filepath, copy_filepath]
+            )
+
+        # What the callers used to build: the concatenated tags of all the
+        # descriptors
+        tags, flatten_time = timed(lambda: [
+            tag
+            for nsd_info in tags_parser.connection_points.values()
+            for tag in nsd_info["connection_points"].tags()
+        ])
+        keys = random.Random(0).sample(list(tags_parser.index), min(
+            args.lookups, len(tags_parser.index)
+        ))
+        key_tags = [
+            "{{deployment_info|" + "|".join(key) + "}}"
+            for key in keys
+        ]
+
+        _, list_lookup_time = timed(
+            lambda: [tag in tags for tag in key_tags]
+        )
+        _, index_lookup_time = timed(
+            lambda: [key in tags_parser.index for key in keys]
+        )
+
+        print(f"NSD with {n_vnfs} vnf-profiles, given twice")
+        print(f"  parse and index:   {parse_time * 1000:9.2f} ms")
+        print(f"  tags: {len(tags)} in the flat list, " +
+              f"{len(tags_parser.index)} in the index " +
+              f"(flattened in {flatten_time * 1000:.2f} ms)")
+        print(f"  {len(keys)} lookups: {list_lookup_time * 1000:9.2f} ms " +
+              f"in the flat list, {index_lookup_time * 1000:.2f} ms in " +
+              "the index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:58:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:58:12
+'''
+Measures the creation of testing descriptors from the read-only template,
+compared with deep copies of a mutable template, in a single long-lived
+process.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_descriptor_builder --descriptors 100000
+'''
+
+import argparse
+import copy
+import time
+
+from TestingDescriptorGenerator.descriptor_builder import \
+    TestingDescriptorBuilder
+from helpers.base_testing_descriptor import new_testing_descriptor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptors", type=int, default=100000)
+    parser.add_argument("--test-cases", type=int, default=10,
+                        help="Test cases per descriptor")
+    args = parser.parse_args()
+
+    mutable_template = new_testing_descriptor()
+    parameters = {f"variable_{k}": f"value_{k}" for k in range(4)}
+
+    start = time.perf_counter()
+    for _ in range(args.descriptors):
+        copy.deepcopy(mutable_template)
+    deepcopy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.descriptors):
+        new_testing_descriptor()
+    template_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(args.descriptors):
+        builder = TestingDescriptorBuilder(
+            f"netapp_{i}", f"netapp_{i}-ns", "testbed_itav"
+        )
+        for j in range(1, args.test_cases + 1):
+            builder.add_testcase(j, "predefined", f"test_{j}",
+                                 f"Test case {j}", parameters)
+        builder.build()
+    builder_time = time.perf_counter() - start
+
+    print(f"{args.descriptors} descriptors")
+    print("  template deep copy:       " +
+          f"{deepcopy_time / args.descriptors * 1e6:8.2f} us each")
+    print("  read-only template:       " +
+          f"{template_time / args.descriptors * 1e6:8.2f} us each")
+    print(f"  builder ({args.test_cases} test cases):  " +
+          f"{builder_time / args.descriptors * 1e6:8.2f} us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:54:27
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:54:27
+'''
+Measures the generation of many testing descriptors from answers files,
+by a single process and by a pool of processes sharing the catalog.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_generate_many --descriptors 500 --workers 4
+'''
+
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from CICDManagerAPIClient.test_classes import Test
+from TestingDescriptorGenerator.batch_generator import find_answers_files, \
+    generate_many
+
+
+def synthetic_catalog(n_testbeds, n_tests):
+    return {
+        f"testbed_{t}": Test.from_testbed_payload({
+            f"test_{i}": {
+                "id": f"test_{i}",
+                "name": f"test {i}",
+                "description": f"Synthetic test {i}",
+                "mandatory": False,
+                "test_variables": [
+                    {
+                        "variable_name": f"variable_{j}",
+                        "description": f"Variable {j}",
+                        "mandatory": True,
+                        "possible_options": [],
+                        "type": "str",
+                        "can_be_injected_by_the_nods": True
+                    }
+                    for j
+                    in range(4)
+                ]
+            }
+            for i
+            in range(n_tests)
+        })
+        for t
+        in range(n_testbeds)
+    }
+
+
+def synthetic_answers(i, n_testbeds, n_tests, n_test_cases):
+    return {
+        "netapp_name": f"netapp_{i}",
+        "ns_name": f"netapp_{i}-ns",
+        "testbed_id": f"testbed_{i % n_testbeds}",
+        "test_cases": [
+            {
+                "test": f"test_{(i + k) % n_tests}",
+                "description": f"Test case {k}",
+                "parameters": {
+                    f"variable_{j}":
+                    "{{deployment_info|" + f"netapp_{i}-ns|vnf{j}|" +
+                    "vnf-mgmt-ext|ip-address}}"
+                    for j
+                    in range(4)
+                }
+            }
+            for k
+            in range(n_test_cases)
+        ]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--descriptors", type=int, default=500,
+                        help="Answers files to generate descriptors from")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[1, os.cpu_count() or 1])
+    parser.add_argument("--testbeds", type=int, default=5)
+    parser.add_argument("--tests", type=int, default=200,
+                        help="Tests per testbed")
+    parser.add_argument("--test-cases", type=int, default=10,
+                        help="Test cases per descriptor")
+    args = parser.parse_args()
+
+    catalog = synthetic_catalog(args.testbeds, args.tests)
+    with tempfile.TemporaryDirectory() as directory:
+        answers_directory = os.path.join(directory, "answers")
+        os.mkdir(answers_directory)
+        for i in range(args.descriptors):
+            filepath = os.path.join(answers_directory, f"netapp_{i}.yaml")
+            with open(filepath, "w") as f:
+                yaml.safe_dump(synthetic_answers(
+                    i, args.testbeds, args.tests, args.test_cases
+                ), f)
+        answers_filepaths = find_answers_files(answers_directory)
+
+        print(f"{args.descriptors} descriptors, {args.test_cases} test " +
+              f"cases each, {args.testbeds * args.tests} tests in the " +
+              "catalog")
+        for workers in args.workers:
+            start = time.perf_counter()
+            results = generate_many(
+                answers_filepaths,
+                os.path.join(directory, f"output_{workers}"),
+                catalog,
+                workers=workers
+            )
+            elapsed = time.perf_counter() - start
+            assert not any(result["errors"] for result in results)
+            per_descriptor = sum(r["seconds"] for r in results) / \
+                len(results)
+            print(f"  {workers:3d} workers: {elapsed * 1000:9.2f} ms " +
+                  f"({per_descriptor * 1000:.2f} ms per descriptor)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 21:24:50
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 21:24:50
+'''
+Compares the time and peak memory taken to extract the connection points
+of a large NSD by loading its whole document tree versus by going through
+its YAML parse events.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_nsd_extraction --config-primitives 1000 5000
+'''
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from DescriptorParser import parser
+from benchmarks.synthetic_nsd import write_synthetic_nsds
+
+EXTRACTORS = {
+    "tree": parser._extract_connection_points_from_tree,
+    "events": parser._extract_connection_points_from_events
+}
+
+
+def measure(extract, nsd_filepath, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        nsd_info = extract(nsd_filepath)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    extract(nsd_filepath)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return nsd_info, min(timings), peak
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument("--vnfs", type=int, default=50,
+                            help="vnf-profiles of the NSD")
+    arg_parser.add_argument("--config-primitives", type=int, nargs="+",
+                            default=[1000, 5000],
+                            help="Sizes of the NSD's configuration block")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for config_primitives in args.config_primitives:
+            # Each run overwrites the previous NSD
+            nsd_filepath, = write_synthetic_nsds(
+                directory,
+                1,
+                n_vnfs=args.vnfs,
+                config_primitives=config_primitives
+            )
+            size = os.path.getsize(nsd_filepath) / 2**20
+            print(f"NSD with {args.vnfs} vnf-profiles and " +
+                  f"{config_primitives} config primitives ({size:.1f} MiB)")
+
+            expected = None
+            for name, extract in EXTRACTORS.items():
+                nsd_info, timing, peak = measure(
+                    extract, nsd_filepath, args.repeat
+                )
+                if expected is None:
+                    expected = nsd_info
+                assert nsd_info == expected
+                print(f"  {name:>6}: {timing * 1000:9.2f} ms, " +
+                      f"peak {peak / 2**20:7.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
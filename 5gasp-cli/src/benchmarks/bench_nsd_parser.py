@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 19:58:45
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 19:58:45
+'''
+Compares the time taken by the `ConnectionPointsParser` to parse many NSD
+files serially versus with a pool of worker processes.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_nsd_parser --files 48 --workers 1 2 4 8
+'''
+
+import argparse
+import tempfile
+import time
+
+from DescriptorParser.parser import ConnectionPointsParser
+from benchmarks.synthetic_nsd import write_synthetic_nsds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=48)
+    parser.add_argument("--vnfs", type=int, default=20,
+                        help="vnf-profiles per NSD")
+    parser.add_argument("--config-primitives", type=int, default=20,
+                        help="Size of the configuration block of each NSD")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=[1, 2, 4, 8])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        filepaths = write_synthetic_nsds(
+            directory,
+            args.files,
+            n_vnfs=args.vnfs,
+            config_primitives=args.config_primitives
+        )
+        print(f"{args.files} NSDs with {args.vnfs} vnf-profiles each")
+
+        expected = None
+        for workers in args.workers:
+            timings = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                tags_parser = ConnectionPointsParser(filepaths, workers)
+                timings.append(time.perf_counter() - start)
+
+            if expected is None:
+                expected = tags_parser.connection_points
+            assert tags_parser.connection_points == expected
+            print(f"{workers:>3} workers: {min(timings) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:08:52
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:08:52
+'''
+Measures how resolving the NSDs' connection points to VDU interfaces
+scales with the number of VNFs of a NetApp, each with its own VNFD.
+
+The hash join of the `ConnectionPointsParser` is compared with nested
+scans over the VNFDs, their external connection points and their VDUs.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_vnfd_join --vnfs 100 1000
+'''
+
+import argparse
+import os
+import tempfile
+import time
+
+import yaml
+
+from DescriptorParser.parser import ConnectionPointsParser
+from benchmarks.synthetic_nsd import synthetic_nsd, synthetic_vnfd
+
+
+def nested_scan_join(tags_parser):
+    vnfds = [
+        {"id": vnfd_id, "ext-cpd": list(ext_cpds.items())}
+        for vnfd_id, ext_cpds
+        in tags_parser.vnfds.items()
+    ]
+    vnf_profiles = [
+        (ns_id, vnf_id, vnfd_id)
+        for ns_id, vnfd_ids in tags_parser.vnfd_ids.items()
+        for vnf_id, vnfd_id in vnfd_ids.items()
+    ]
+    resolved = {}
+    for ns_id, vnf_id, cp_id in tags_parser.index:
+        for profile_ns_id, profile_vnf_id, vnfd_id in vnf_profiles:
+            if (profile_ns_id, profile_vnf_id) != (ns_id, vnf_id):
+                continue
+            for vnfd in vnfds:
+                if vnfd["id"] != vnfd_id:
+                    continue
+                for ext_cpd_id, ext_cpd in vnfd["ext-cpd"]:
+                    if ext_cpd_id == cp_id:
+                        resolved[(ns_id, vnf_id, cp_id)] = ext_cpd
+    return resolved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vnfs", type=int, nargs="+", default=[100, 1000],
+                        help="VNFs of the NetApp")
+    parser.add_argument("--cps-per-vnf", type=int, default=2)
+    parser.add_argument("--nested-scan-limit", type=int, default=1000,
+                        help="Skip the nested scans above this many VNFs")
+    args = parser.parse_args()
+
+    for n_vnfs in args.vnfs:
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "netapp_nsd.yaml"), "w") as f:
+                yaml.safe_dump(synthetic_nsd(
+                    "netapp-ns", n_vnfs, args.cps_per_vnf,
+                    distinct_vnfds=True
+                ), f)
+            for i in range(n_vnfs):
+                filepath = os.path.join(directory, f"netapp_{i}_vnfd.yaml")
+                with open(filepath, "w") as f:
+                    yaml.safe_dump(
+                        synthetic_vnfd(f"netapp-ns-vnf{i}",
+                                       args.cps_per_vnf),
+                        f
+                    )
+
+            start = time.perf_counter()
+            tags_parser = ConnectionPointsParser([directory])
+            parse_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        resolved = dict(tags_parser.resolved_connection_points())
+        join_time = time.perf_counter() - start
+        assert all(resolved.values())
+
+        print(f"{n_vnfs} VNFs ({len(resolved)} connection points)")
+        print(f"  parse NSD and VNFDs: {parse_time * 1000:9.2f} ms")
+        print(f"  hash join:           {join_time * 1000:9.2f} ms")
+        if n_vnfs <= args.nested_scan_limit:
+            start = time.perf_counter()
+            nested_scan_join(tags_parser)
+            print("  nested scans:        " +
+                  f"{(time.perf_counter() - start) * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
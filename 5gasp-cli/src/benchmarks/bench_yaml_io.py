@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 20:45:52
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 20:45:52
+'''
+Compares PyYAML's pure-Python loader and dumper with the ones used by the
+CLI (libyaml-based, when available), over the bundled NSDs, large synthetic
+NSDs and a testing descriptor with many test cases.
+
+Run from the 5gasp-cli/src directory:
+
+    python3 -m benchmarks.bench_yaml_io --vnfs 500 --config-primitives 500
+'''
+
+import argparse
+import glob
+import os
+import time
+
+import yaml
+
+from benchmarks.synthetic_nsd import synthetic_nsd
+from helpers import yaml_io
+from helpers.base_testing_descriptor import new_testing_descriptor
+
+RESOURCES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "resources"
+)
+
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def synthetic_testing_descriptor(n_testcases):
+    testing_descriptor = new_testing_descriptor()
+    testing_descriptor["test_phases"]["setup"]["testcases"] = [
+        {
+            "testcase_id": i,
+            "type": "predefined",
+            "scope": "predefined",
+            "name": f"test_{i}",
+            "description": f"Test case number {i}, which validates the " +
+            "Network Application's behaviour",
+            "parameters": [
+                {"key": f"variable_{k}", "value": f"value_{k}"}
+                for k
+                in range(6)
+            ]
+        }
+        for i
+        in range(n_testcases)
+    ]
+    return testing_descriptor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vnfs", type=int, default=500,
+                        help="vnf-profiles of the synthetic NSD")
+    parser.add_argument("--config-primitives", type=int, default=500,
+                        help="Size of the configuration block of the " +
+                        "synthetic NSD")
+    parser.add_argument("--testcases", type=int, default=1000,
+                        help="Test cases of the synthetic testing descriptor")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    documents = {}
+    for filepath in sorted(glob.glob(os.path.join(RESOURCES_DIR, "*.yaml"))):
+        with open(filepath, "r") as nsd_file:
+            documents[os.path.basename(filepath)] = nsd_file.read()
+    documents["synthetic NSD"] = yaml.safe_dump(
+        synthetic_nsd(
+            "synthetic-ns",
+            n_vnfs=args.vnfs,
+            config_primitives=args.config_primitives
+        )
+    )
+
+    print(f"libyaml available: {yaml_io.LIBYAML}")
+    for name, document in documents.items():
+        pure = best_of(
+            lambda: yaml_io.load(document, loader=yaml.SafeLoader),
+            args.repeat
+        )
+        fast = best_of(lambda: yaml_io.load(document), args.repeat)
+        print(f"load {name:>28} ({len(document) / 1024:8.1f} KiB): " +
+              f"pure {pure * 1000:9.2f} ms | fast {fast * 1000:9.2f} ms | " +
+              f"x{pure / fast:5.1f}")
+
+    testing_descriptor = synthetic_testing_descriptor(args.testcases)
+    pure = best_of(
+        lambda: yaml_io.dump(testing_descriptor, dumper=yaml.SafeDumper),
+        args.repeat
+    )
+    fast = best_of(lambda: yaml_io.dump(testing_descriptor), args.repeat)
+    assert yaml_io.dump(testing_descriptor) == \
+        yaml_io.dump(testing_descriptor, dumper=yaml.SafeDumper)
+    print(f"dump {args.testcases} test cases: " +
+          f"pure {pure * 1000:9.2f} ms | fast {fast * 1000:9.2f} ms | " +
+          f"x{pure / fast:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
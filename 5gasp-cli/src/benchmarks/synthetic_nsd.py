@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 19:52:03
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 19:52:03
+'''
+Synthetic OSM NSDs, with the same structure as the ones parsed by the
+`ConnectionPointsParser`, for the benchmarks.
+'''
+
+import os
+import yaml
+
+
+def synthetic_nsd(ns_id, n_vnfs=2, cps_per_vnf=2, config_primitives=0,
+                  distinct_vnfds=False):
+    '''
+    Builds an NSD with `n_vnfs` vnf-profiles, each with `cps_per_vnf`
+    connection points. `config_primitives` adds an embedded
+    configuration block, which the parser must go through but does not
+    need, as in real NSDs from OSM packages. With `distinct_vnfds`, each
+    vnf-profile has its own VNFD (see `synthetic_vnfd`), instead of all
+    sharing the same one.
+    '''
+    vnf_profiles = [
+        {
+            "id": f"vnf{i}",
+            "virtual-link-connectivity": [
+                {
+                    "constituent-cpd-id": [
+                        {
+                            "constituent-base-element-id": f"vnf{i}",
+                            "constituent-cpd-id": f"vnf-cp{j}-ext"
+                        }
+                    ],
+                    "virtual-link-profile-id": f"vl{j}"
+                }
+                for j
+                in range(cps_per_vnf)
+            ],
+            "vnfd-id": f"{ns_id}-vnf{i}" if distinct_vnfds
+            else f"{ns_id}-vnf"
+        }
+        for i
+        in range(n_vnfs)
+    ]
+    network_service = {
+        "description": f"Synthetic NS with {n_vnfs} VNFs",
+        "df": [{"id": "default-df", "vnf-profile": vnf_profiles}],
+        "id": ns_id,
+        "name": ns_id,
+        "version": 1.0,
+        "virtual-link-desc": [
+            {"id": f"vl{j}", "mgmt-network": j == 0}
+            for j
+            in range(cps_per_vnf)
+        ],
+        "vnfd-id": [
+            f"{ns_id}-vnf{i}" for i in range(n_vnfs)
+        ] if distinct_vnfds else [f"{ns_id}-vnf"]
+    }
+    if config_primitives:
+        network_service["ns-configuration"] = {
+            "config-primitive": [
+                {
+                    "name": f"primitive-{k}",
+                    "parameter": [
+                        {
+                            "name": f"param-{k}-{p}",
+                            "data-type": "STRING",
+                            "default-value": f"value {k} {p} " * 8
+                        }
+                        for p
+                        in range(4)
+                    ],
+                    "script": "#!/bin/bash\n" + "echo configuring\n" * 8
+                }
+                for k
+                in range(config_primitives)
+            ]
+        }
+    return {"nsd": {"nsd": [network_service]}}
+
+
+def synthetic_vnfd(vnfd_id, cps=2):
+    '''
+    Builds a VNFD whose `cps` external connection points (as referred to
+    by `synthetic_nsd`) are each mapped to an interface of its own VDU.
+    '''
+    return {
+        "vnfd": {
+            "id": vnfd_id,
+            "ext-cpd": [
+                {
+                    "id": f"vnf-cp{j}-ext",
+                    "int-cpd": {"cpd": f"vdu{j}-eth0-int", "vdu-id": f"vdu{j}"}
+                }
+                for j
+                in range(cps)
+            ],
+            "vdu": [
+                {
+                    "id": f"vdu{j}",
+                    "int-cpd": [
+                        {
+                            "id": f"vdu{j}-eth0-int",
+                            "virtual-network-interface-requirement": [
+                                {"name": f"vdu{j}-eth0", "position": 1}
+                            ]
+                        }
+                    ]
+                }
+                for j
+                in range(cps)
+            ]
+        }
+    }
+
+
+def write_synthetic_nsds(directory, n_files, **nsd_kwargs):
+    '''
+    Writes `n_files` synthetic NSDs to a directory.
+
+    Returns
+    -------
+        List of the written file paths.
+    '''
+    filepaths = []
+    for i in range(n_files):
+        filepath = os.path.join(directory, f"synthetic_{i}_nsd.yaml")
+        with open(filepath, "w") as nsd_file:
+            yaml.safe_dump(synthetic_nsd(f"synthetic_{i}-ns", **nsd_kwargs),
+                           nsd_file)
+        filepaths.append(filepath)
+    return filepaths
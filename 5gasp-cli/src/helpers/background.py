@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 13:02:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 13:02:12
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BackgroundTasks:
+    '''
+    Runs named tasks in background worker threads, so they can overlap with
+    the time the developer spends answering the CLI prompts.
+
+    The time each caller spent blocked waiting for a task's result is
+    recorded, which allows measuring how much of the work was effectively
+    hidden behind the prompts.
+
+    Tasks should not print, as their output would interleave with the
+    prompts. Instead, they can be given an `on_result` callback, which is
+    called with their result by the thread gathering it (e.g., to print
+    the errors the task collected).
+    '''
+
+    def __init__(self, max_workers=2):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="5gasp-cli-background"
+        )
+        self._futures = {}
+        self._on_result = {}
+        self.started_at = time.perf_counter()
+        self.wait_times = {}
+
+    def submit(self, name, func, *args, on_result=None, **kwargs):
+        '''
+        Starts a task in background.
+
+        Parameters
+        ----------
+        name : str
+            Task name, used to later gather its result
+        func : callable
+            Function to run
+        on_result : callable
+            Called with the task's result, by the thread that first gathers
+            it through `result`
+        '''
+        self._futures[name] = self._executor.submit(func, *args, **kwargs)
+        if on_result is not None:
+            self._on_result[name] = on_result
+
+    def __contains__(self, name):
+        return name in self._futures
+
+    def result(self, name):
+        '''
+        Waits for a task to finish.
+
+        Parameters
+        ----------
+        name : str
+            Task name
+
+        Returns
+        -------
+            The task's result. If the task raised an exception, it is
+            re-raised here.
+        '''
+        start = time.perf_counter()
+        try:
+            result = self._futures[name].result()
+        finally:
+            self.wait_times[name] = self.wait_times.get(name, 0) + \
+                time.perf_counter() - start
+        on_result = self._on_result.pop(name, None)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    def elapsed(self):
+        '''
+        Seconds elapsed since the background tasks were created.
+        '''
+        return time.perf_counter() - self.started_at
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
@@ -2,10 +2,34 @@
 # @Author: Rafael Direito
 # @Date:   2023-04-26 09:33:16
 # @Last Modified by:   Rafael Direito
-# @Last Modified time: 2023-04-26 10:01:15
+# @Last Modified time: 2026-10-18 23:58:12
 
+from types import MappingProxyType
 
-BASE_TESTING_DESCRIPTOR = {
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value, _mapping=MappingProxyType, _tuple=tuple):
+    # Hot path when generating many descriptors: exact type checks, and no
+    # memo, as the template holds no shared or recursive containers
+    if type(value) is _mapping:
+        return {key: _thaw(item) for key, item in value.items()}
+    if type(value) is _tuple:
+        return [_thaw(item) for item in value]
+    return value
+
+
+# Read-only, so it cannot leak state from one descriptor to the next. Use
+# `new_testing_descriptor` to get a descriptor that can be filled in
+BASE_TESTING_DESCRIPTOR = _freeze({
   "test_info": {
     "netapp_id": None,
     "network_service_id": None,
@@ -31,4 +55,16 @@ BASE_TESTING_DESCRIPTOR = {
       }
     ]
   }
-}
\ No newline at end of file
+})
+
+
+def new_testing_descriptor():
+    '''
+    Creates a testing descriptor from the template.
+
+    Returns
+    -------
+        New testing descriptor, as a dictionary sharing no containers with
+        the template, nor with other descriptors.
+    '''
+    return _thaw(BASE_TESTING_DESCRIPTOR)
@@ -7,6 +7,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.columns import Columns
 from rich.align import Align
+from helpers.tracing import tracer
 
 
 class PrintAsTable:
@@ -22,6 +23,7 @@ class PrintAsTable:
         for row in self.rows:
             self.table.add_row(*row)
 
+    @tracer.traced("PrintAsTable.print", "render")
     def print(self, centered=False):
         console = Console()
         if centered:
@@ -31,18 +33,25 @@ class PrintAsTable:
 
 
 class PrintAsPanelColumns:
+    # The columns are only sorted once, even if printed several times. They
+    # are kept by each instance, as they may be printed from several threads
 
     def __init__(self, panels):
         self.panels = panels
+        self._columns = None
+
+    def __columns(self):
+        if self._columns is None:
+            self._columns = Columns(
+                sorted(
+                    self.panels,
+                    key=lambda p: len(p.renderable),
+                    reverse=True
+                )
+            )
+        return self._columns
 
+    @tracer.traced("PrintAsPanelColumns.print", "render")
     def print(self):
-
-        columns = Columns(
-            sorted(
-                self.panels,
-                key=lambda p: len(p.renderable),
-                reverse=True
-            )
-        )
         console = Console()
-        console.print(columns)
\ No newline at end of file
+        console.print(self.__columns())
\ No newline at end of file
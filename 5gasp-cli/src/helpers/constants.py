@@ -18,3 +18,26 @@ class CI_CD_SERVICE_URL_ENDPOINTS(Enum):
 class USER_PROMPTS(Enum):
     NETAPP_NAME = "Network Application's name: "
     NS_NAME = "Network Service's name: "
+
+
+# HTTP Connection Pooling
+# Number of distinct hosts kept in the pool and maximum number of keep-alive
+# connections kept open per host
+CI_CD_SERVICE_POOL_CONNECTIONS = 4
+CI_CD_SERVICE_POOL_MAXSIZE = 10
+
+# Cache
+CACHE_DIR_NAME = "5gasp-cli"
+# Seconds during which the cached testbeds and tests are served without
+# revalidating them with the CI/CD Manager
+CATALOG_CACHE_TTL = 3600
+
+# CI/CD Manager Requests
+# Seconds to establish a connection and to wait for the server to send data
+CI_CD_SERVICE_CONNECT_TIMEOUT = 5
+CI_CD_SERVICE_READ_TIMEOUT = 30
+# Retries of the failed idempotent requests, with exponential backoff
+CI_CD_SERVICE_RETRIES = 3
+CI_CD_SERVICE_BACKOFF_BASE = 0.5
+CI_CD_SERVICE_BACKOFF_MAX = 10
+CI_CD_SERVICE_RETRYABLE_STATUS = [429, 502, 503, 504]
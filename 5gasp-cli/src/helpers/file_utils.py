@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 11:05:44
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 11:05:44
+
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+from helpers import constants as Constants
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+def user_cache_dir():
+    '''
+    Gets the directory where the CLI should keep its cached data, according
+    to the conventions of the current platform.
+
+    Returns
+    -------
+        Path of the CLI's cache directory.
+    '''
+    if os.name == "nt":
+        base_dir = os.environ.get("LOCALAPPDATA") or \
+            os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        return os.path.join(base_dir, Constants.CACHE_DIR_NAME, "Cache")
+    if sys.platform == "darwin":
+        return os.path.join(
+            os.path.expanduser("~"), "Library", "Caches",
+            Constants.CACHE_DIR_NAME
+        )
+    base_dir = os.environ.get("XDG_CACHE_HOME") or \
+        os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base_dir, Constants.CACHE_DIR_NAME)
+
+
+@contextmanager
+def file_lock(lock_filepath, shared=False):
+    '''
+    Holds an advisory lock on a lock file, so several processes on the same
+    host can safely share a file (e.g., parallel CI jobs).
+
+    Parameters
+    ----------
+    lock_filepath : str
+        Path of the lock file. It is created if it does not exist
+    shared : bool
+        Whether to acquire a shared (read) lock instead of an exclusive one.
+        Windows only supports exclusive locks
+    '''
+    os.makedirs(os.path.dirname(lock_filepath) or ".", exist_ok=True)
+    with open(lock_filepath, "a+b") as lock_file:
+        if os.name == "nt":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(
+                lock_file.fileno(),
+                fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            )
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def atomic_write(filepath, data: bytes):
+    '''
+    Writes a file atomically. The data is written to a temporary file in the
+    same directory, which then replaces the target file, so readers never
+    see a partially written file.
+
+    Parameters
+    ----------
+    filepath : str
+        Path of the file to write
+    data : bytes
+        File content
+    '''
+    directory = os.path.dirname(filepath) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_filepath = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(data)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        if os.path.exists(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
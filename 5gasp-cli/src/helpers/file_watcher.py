@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:41:19
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:41:19
+'''
+Watches directories for changed files.
+
+On Linux, the kernel notifies the changes through inotify, which is used
+through ctypes, so no additional dependency is needed. Elsewhere, or if
+inotify is not available (e.g., the watches limit was reached), the
+directories are polled instead.
+
+Directories are watched, instead of files, as editors usually save files
+by replacing them, which would end a watch on the file itself.
+'''
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import time
+
+# inotify(7) event masks
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+_WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | \
+    IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    '''
+    Watches directories through Linux's inotify.
+
+    Raises
+    ------
+    OSError
+        If inotify is not available.
+    '''
+
+    def __init__(self, directories, recursive_directories=()):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name or not hasattr(os, "O_NONBLOCK"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        self._fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        # Watch descriptor -> (directory, recursive)
+        self._watches = {}
+        try:
+            for directory in directories:
+                self._add_watch(directory, recursive=False)
+            for directory in recursive_directories:
+                self._add_watch(directory, recursive=True)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, directory, recursive):
+        wd = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK
+        )
+        if wd < 0:
+            error = ctypes.get_errno()
+            # Directories may be removed while they are being watched
+            if error == errno.ENOENT:
+                return
+            raise OSError(error, os.strerror(error), directory)
+        self._watches[wd] = (directory, recursive)
+        if recursive:
+            for entry in os.scandir(directory):
+                if entry.is_dir(follow_symlinks=False):
+                    self._add_watch(entry.path, recursive=True)
+
+    def changes(self, timeout=None):
+        '''
+        Waits for changes.
+
+        Parameters
+        ----------
+        timeout : float
+            Maximum number of seconds to wait
+
+        Returns
+        -------
+            Set of the paths of the changed files, which is empty if no
+            file changed within the timeout.
+        '''
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, name_length = \
+                    _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + name_length].rstrip(b"\0")
+                offset += name_length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Events were lost, so every watched file may have
+                    # changed
+                    changed.update(self._watched_files())
+                    continue
+                if mask & IN_IGNORED:
+                    self._watches.pop(wd, None)
+                    continue
+                if wd not in self._watches or not name:
+                    continue
+                directory, recursive = self._watches[wd]
+                path = os.path.join(directory, os.fsdecode(name))
+                if mask & IN_ISDIR:
+                    if recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_watch(path, recursive=True)
+                        # Files may be created before the watch was added
+                        changed.update(_files_in(path, recursive=True))
+                    continue
+                changed.add(path)
+
+    def _watched_files(self):
+        files = set()
+        for directory, recursive in self._watches.values():
+            files.update(_files_in(directory, recursive=False))
+        return files
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _files_in(directory, recursive):
+    # Snapshot of the files in a directory: path -> (inode, size, mtime)
+    files = {}
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return files
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    files.update(_files_in(entry.path, recursive=True))
+            elif entry.is_file():
+                stat = entry.stat()
+                files[entry.path] = \
+                    (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            continue
+    return files
+
+
+class PollingWatcher:
+    '''
+    Watches directories by comparing snapshots of their files' inode, size
+    and modification time.
+    '''
+
+    def __init__(self, directories, recursive_directories=(),
+                 interval=0.5):
+        self.interval = interval
+        self._directories = [(d, False) for d in directories] + \
+            [(d, True) for d in recursive_directories]
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for directory, recursive in self._directories:
+            snapshot.update(_files_in(directory, recursive))
+        return snapshot
+
+    def changes(self, timeout=None):
+        '''
+        Waits for changes. See `InotifyWatcher.changes`.
+        '''
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._take_snapshot()
+            changed = {
+                path
+                for path
+                in snapshot.keys() | self._snapshot.keys()
+                if snapshot.get(path) != self._snapshot.get(path)
+            }
+            self._snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            sleep = self.interval if deadline is None \
+                else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(sleep, 0))
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def create_file_watcher(directories, recursive_directories=(),
+                        polling=False):
+    '''
+    Creates an `InotifyWatcher`, or a `PollingWatcher` if inotify is not
+    available or polling is requested.
+
+    Parameters
+    ----------
+    directories : list
+        Directories whose files are watched
+    recursive_directories : list
+        Directories whose files, and the files of their subdirectories,
+        are watched
+    polling : bool
+        Whether to poll the directories, even if inotify is available
+    '''
+    if not polling:
+        try:
+            return InotifyWatcher(directories, recursive_directories)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directories, recursive_directories)
@@ -10,13 +10,9 @@ from rich.panel import Panel
 from rich.align import Align
 from rich.console import Group
 
-# ruamel.yaml
-from ruamel.yaml import YAML
-
 from helpers.connection_point_tags import CONNECTION_POINT_TAGS
 from helpers.beatiful_prints import PrintAsTable
 from rich.prompt import Prompt
-yaml = YAML()
 
 
 def test_cases_operation():
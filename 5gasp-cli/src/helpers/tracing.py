@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 14:48:03
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 14:48:03
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Tracer:
+    '''
+    Records timing spans and exports them in the Chrome trace-event format,
+    which can be opened in chrome://tracing or in https://ui.perfetto.dev.
+
+    The tracer is disabled by default, in which case recording a span costs
+    a single attribute check.
+    '''
+
+    def __init__(self):
+        self.enabled = False
+        self._events = []
+        self._thread_names = {}
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def enable(self):
+        self.enabled = True
+        self._origin = time.perf_counter()
+
+    def _timestamp(self):
+        # Chrome trace events are timestamped in microseconds
+        return (time.perf_counter() - self._origin) * 1e6
+
+    @contextmanager
+    def span(self, name, category, **args):
+        '''
+        Records the duration of a block of code.
+
+        Parameters
+        ----------
+        name : str
+            Span name
+        category : str
+            Span category (e.g., http, yaml, render)
+        args : dict
+            Additional information to attach to the span
+        '''
+        if not self.enabled:
+            yield
+            return
+
+        start = self._timestamp()
+        try:
+            yield
+        finally:
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": start,
+                "dur": self._timestamp() - start,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": {k: str(v) for k, v in args.items()}
+            }
+            with self._lock:
+                self._events.append(event)
+                self._thread_names[event["tid"]] = \
+                    threading.current_thread().name
+
+    def traced(self, name, category):
+        '''
+        Decorator that records a span for each call of a function.
+        '''
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    @property
+    def events(self):
+        with self._lock:
+            return list(self._events)
+
+    def export(self, trace_filepath):
+        '''
+        Saves the recorded spans as Chrome trace-event JSON.
+        '''
+        with self._lock:
+            thread_names = [
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": os.getpid(),
+                    "tid": tid,
+                    "args": {"name": name}
+                }
+                for tid, name
+                in self._thread_names.items()
+            ]
+        with open(trace_filepath, "w") as trace_file:
+            json.dump(
+                {
+                    "traceEvents": thread_names + self.events,
+                    "displayTimeUnit": "ms"
+                },
+                trace_file
+            )
+
+
+# Global tracer, enabled through the CLI's --trace option
+tracer = Tracer()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 20:21:34
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 20:21:34
+'''
+YAML loading and dumping for the whole CLI.
+
+PyYAML's pure-Python parser and emitter are slow on large descriptors. When
+PyYAML was built with libyaml, its C-based loader and dumper are used
+instead, and the pure-Python ones otherwise. Both produce the same objects
+and the same output.
+
+The only output difference between both emitters is how they fold long
+double-quoted strings. Those are only used for strings with non-printable
+or non-ASCII characters, so documents holding such strings are always
+dumped by the pure-Python emitter.
+'''
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+    LIBYAML = False
+
+
+def load(stream, loader=None):
+    '''
+    Loads a YAML document, like `yaml.safe_load`.
+
+    Parameters
+    ----------
+    stream : str, bytes or file
+        YAML document
+    loader : type
+        Loader class, to override the fastest available one
+    '''
+    return yaml.load(stream, Loader=loader or SafeLoader)
+
+
+def parse(stream, loader=None):
+    '''
+    Iterates over the parse events of a YAML document, like `yaml.parse`.
+
+    Parameters
+    ----------
+    stream : str, bytes or file
+        YAML document
+    loader : type
+        Loader class, to override the fastest available one
+    '''
+    return yaml.parse(stream, Loader=loader or SafeLoader)
+
+
+def _has_plain_strings_only(data):
+    # Checks that every string is printable ASCII, so no string can be
+    # emitted double-quoted
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if type(value) is str:
+            if not (value.isascii() and value.isprintable()):
+                return False
+        elif type(value) is dict:
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif type(value) in (list, tuple):
+            stack.extend(value)
+    return True
+
+
+def dump(data, stream=None, dumper=None, **kwargs):
+    '''
+    Dumps an object as YAML, keeping the order of its keys, like
+    `yaml.dump(data, stream, default_flow_style=False, sort_keys=False)`.
+
+    Parameters
+    ----------
+    data : object
+        Object to dump
+    stream : file
+        Where to write the YAML document. If not given, it is returned
+    dumper : type
+        Dumper class, to override the fastest available one
+    '''
+    kwargs.setdefault("default_flow_style", False)
+    kwargs.setdefault("sort_keys", False)
+    if dumper is None:
+        dumper = SafeDumper if LIBYAML and _has_plain_strings_only(data) \
+            else yaml.SafeDumper
+    return yaml.dump(data, stream, Dumper=dumper, **kwargs)
@@ -4,6 +4,10 @@
 # @Last Modified by:   Eduardo Santos
 # @Last Modified time: 2023-05-16 17:21:19
 
+import asyncio
+import functools
+import os
+import time
 from typing import List, Optional
 from helpers.beatiful_prints import PrintAsTable, PrintAsPanelColumns
 from rich.prompt import Prompt, Confirm
@@ -12,18 +16,106 @@ from rich.console import Console
 import typer
 
 from CICDManagerAPIClient import apli_client as CICD_API_Client
+from CICDManagerAPIClient.async_apli_client import AsyncCICDManagerAPIClient
+from CICDManagerAPIClient.catalog_cache import CatalogCache
+from CICDManagerAPIClient.catalog_search import CatalogSearchIndex
+from CICDManagerAPIClient.exceptions import CICDManagerAPIError
+from DescriptorParser.connection_points_cache import ConnectionPointsCache
 from DescriptorParser.parser import ConnectionPointsParser
+from TestingDescriptorGenerator.answers import AnswersError
+from TestingDescriptorGenerator.batch_generator import find_answers_files, \
+    generate_many as generate_many_testing_descriptors, \
+    generate_testing_descriptor, unknown_connection_point_warnings
 from TestingDescriptorGenerator.descriptor_generator import \
     TestingDescriptorGenerator
+from TestingDescriptorGenerator.descriptor_watcher import DescriptorWatcher
 from helpers import constants as Constants
 from helpers import prompts
+from helpers.background import BackgroundTasks
+from helpers.tracing import tracer
 
 app = typer.Typer()
-state = {"verbose": False}
+cache_app = typer.Typer(help="Manage the local testbeds and tests cache")
+app.add_typer(cache_app, name="cache")
+state = {
+    "verbose": False,
+    "pool_size": None,
+    "offline": False,
+    "use_cache": True,
+    "cache_ttl": Constants.CATALOG_CACHE_TTL,
+    "connect_timeout": Constants.CI_CD_SERVICE_CONNECT_TIMEOUT,
+    "read_timeout": Constants.CI_CD_SERVICE_READ_TIMEOUT,
+    "deadline": None,
+    "retries": Constants.CI_CD_SERVICE_RETRIES,
+    "hedge_after": None,
+    "api_client": None
+}
+
+
+def _get_api_client():
+    # A single pooled client is shared by the whole CLI invocation
+    if state["api_client"] is None:
+        state["api_client"] = AsyncCICDManagerAPIClient(
+            api_client=CICD_API_Client.CICDManagerAPIClient(
+                pool_maxsize=state["pool_size"],
+                cache=CatalogCache(ttl=state["cache_ttl"])
+                if state["use_cache"] else None,
+                offline=state["offline"],
+                connect_timeout=state["connect_timeout"],
+                read_timeout=state["read_timeout"],
+                deadline=state["deadline"],
+                retries=state["retries"],
+                hedge_after=state["hedge_after"]
+            )
+        )
+    return state["api_client"]
+
+
+def _positive(value):
+    # Requests cannot wait for no time at all, nor be hedged right away
+    if value is not None and value <= 0:
+        raise typer.BadParameter("must be positive")
+    return value
+
+
+def _exit_on_api_error(command):
+    # Fail fast, with a readable message, when the CI/CD Manager cannot
+    # answer a command
+    @functools.wraps(command)
+    def wrapper(*args, **kwargs):
+        try:
+            return command(*args, **kwargs)
+        except CICDManagerAPIError as e:
+            print(f"Could not reach the CI/CD Manager: {e}")
+            raise typer.Exit(code=1)
+    return wrapper
+
+
+def _close_api_client():
+    api_client = state["api_client"]
+    if api_client is None:
+        return
+    if state["verbose"]:
+        stats = api_client.connection_stats
+        print(
+            f"\nCI/CD Manager requests: {stats['requests']} | " +
+            f"Coalesced: {stats['requests_coalesced']} | " +
+            f"Retried: {stats['requests_retried']} | " +
+            f"Hedged: {stats['requests_hedged']} | " +
+            f"Connections opened: {stats['connections_opened']} | " +
+            f"Connections reused: {stats['connections_reused']}"
+        )
+    api_client.close()
+    state["api_client"] = None
 
 
-def _list_testbeds(api_client, print_info=False, centered=False):
-    testbeds = api_client.get_all_testbeds()
+def _list_testbeds(api_client, print_info=False, centered=False,
+                   background_tasks=None):
+    # Use the testbeds prefetched in background, if any
+    if background_tasks is not None and "testbeds" in background_tasks:
+        testbeds = background_tasks.result("testbeds")
+    else:
+        testbeds = asyncio.run(api_client.get_all_testbeds())
     # Print table with the available testbeds
     if print_info:
         table = PrintAsTable(
@@ -39,7 +131,7 @@ def _list_testbeds(api_client, print_info=False, centered=False):
 
 
 def _list_tests(api_client, testbed_id, print_info=False):
-    tests = api_client.get_tests_per_testbed(testbed_id)
+    tests = asyncio.run(api_client.get_tests_per_testbed(testbed_id))
     if print_info:
         panels = PrintAsPanelColumns(
             panels=[t.to_panel() for t in tests]
@@ -48,16 +140,91 @@ def _list_tests(api_client, testbed_id, print_info=False):
     return tests
 
 
+def infer_tags(nsd_filepaths, workers=1):
+    '''
+    Infers the connection point tags of the given NSDs.
+
+    Parameters
+    ----------
+    nsd_filepaths : list
+        NSD files, directories, glob patterns or OSM NS packages
+    workers : int
+        Number of processes parsing the NSDs
+
+    Returns
+    -------
+        List of the tags, without duplicates.
+    '''
+    tags_parser = ConnectionPointsParser(
+        nsd_filepaths,
+        workers,
+        ConnectionPointsCache() if state["use_cache"] else None
+    )
+    return list(tags_parser.tags())
+
+
+def _format_vdu_interfaces(resolution):
+    # Connection points whose VNFD was not found, or that are not bound to
+    # a VDU's internal connection point, are shown as "-"
+    if resolution is None or resolution["vdu_id"] is None:
+        return "-"
+    if not resolution["interfaces"]:
+        return resolution["vdu_id"]
+    return f"{resolution['vdu_id']}: " + ", ".join(resolution["interfaces"])
+
+
 @app.command()
+@_exit_on_api_error
 def create_testing_descriptor(
     output_filepath: str = typer.Option(
         default="testing-descriptor.yaml",
         help="Output filepath"
     ),
     infer_tags_from_nsd: Optional[List[str]] = typer.Option(
-        default=None
+        default=None,
+        help="NSD file, directory, glob pattern or OSM package " +
+        "(.tar.gz) to infer connection points from. VNFDs found along " +
+        "with the NSDs are used to resolve the connection points."
+    ),
+    nsd_parser_workers: int = typer.Option(
+        default=1,
+        min=1,
+        help="Number of processes parsing the NSDs given through " +
+        "--infer-tags-from-nsd."
     )
 ):
+    api_client = _get_api_client()
+
+    # Fetch the testbeds and tests, and parse the NSDs, while the developer
+    # is answering the prompts
+    with BackgroundTasks() as background_tasks:
+        background_tasks.submit(
+            "testbeds",
+            lambda: asyncio.run(api_client.get_all_testbeds())
+        )
+        if infer_tags_from_nsd:
+            # Parsing errors are printed once the parser is gathered, so
+            # they do not interleave with the prompts
+            background_tasks.submit(
+                "tags_parser",
+                ConnectionPointsParser,
+                infer_tags_from_nsd,
+                nsd_parser_workers,
+                ConnectionPointsCache() if state["use_cache"] else None,
+                report_errors=False,
+                on_result=ConnectionPointsParser.print_errors
+            )
+
+        _create_testing_descriptor(
+            api_client=api_client,
+            background_tasks=background_tasks,
+            output_filepath=output_filepath,
+            infer_tags_from_nsd=infer_tags_from_nsd
+        )
+
+
+def _create_testing_descriptor(api_client, background_tasks, output_filepath,
+                               infer_tags_from_nsd):
     console = Console()
     text = Text()
     
@@ -68,30 +235,55 @@ def create_testing_descriptor(
         prompts.connection_points_information_prompt()
 
         # Parse connection points information
-        tags_parser = ConnectionPointsParser(infer_tags_from_nsd)
+        tags_parser = background_tasks.result("tags_parser")
         existing_connect_points = tags_parser.connection_points
+        if state["verbose"] and tags_parser.cache is not None:
+            print(f"\nConnection points cache hits: {tags_parser.cache_hits}" +
+                  f" of {len(tags_parser.base_nsd_filepaths)} descriptors")
 
         print("\nThe following NSDs can be used for inferring connection " +
               "points:"
               )
 
-        table = PrintAsTable(
-            header=["NSD's File Path", "NSD ID", "Inferred Connection Points"],
-            rows=[
-                [
-                    nsd_file_path,
-                    nsd_info["ns_id"],
-                    "\n".join(nsd_info["connection_points"])
-                ]
-                for nsd_file_path, nsd_info
-                in existing_connect_points.items()
+        header = ["NSD's File Path", "NSD ID", "Inferred Connection Points"]
+        rows = [
+            [
+                nsd_file_path,
+                nsd_info["ns_id"],
+                "\n".join(nsd_info["connection_points"].tags())
             ]
-        )
+            for nsd_file_path, nsd_info
+            in existing_connect_points.items()
+        ]
+        # Show the VDU interface of each connection point, when the VNFDs
+        # were given along with the NSDs
+        if tags_parser.vnfds:
+            header.append("VDU Interfaces")
+            for row, nsd_info in zip(rows,
+                                     existing_connect_points.values()):
+                resolutions = [
+                    tags_parser.resolve(*connection_point)
+                    for connection_point
+                    in nsd_info["connection_points"]
+                ]
+                row.append("\n".join(
+                    _format_vdu_interfaces(resolution)
+                    for resolution
+                    in resolutions
+                ))
+        table = PrintAsTable(header=header, rows=rows)
         table.print()
 
-        prompts.connection_point_keys(
-            list(existing_connect_points.values())[0]["connection_points"][0]
-        )
+        example_tag = next(tags_parser.tags(), None)
+        if example_tag is None:
+            # E.g., no NSDs were found in the given locations
+            console.print(Text(
+                "\nNo connection points could be inferred from the given " +
+                "NSDs. You can enter them manually.",
+                style="bold"
+            ))
+        else:
+            prompts.connection_point_keys(example_tag)
 
         # 2. Ask the developer if he wishes to proceed
         proceed = Confirm.ask(
@@ -106,15 +298,22 @@ def create_testing_descriptor(
     netapp_name = input("\n" + Constants.USER_PROMPTS.NETAPP_NAME.value)
     ns_name = input(Constants.USER_PROMPTS.NS_NAME.value)
 
-    api_client = CICD_API_Client.CICDManagerAPIClient()
-
     # Print table with the available testbeds
     # List Testbeds
     testbeds = _list_testbeds(
         api_client=api_client,
         print_info=True,
-        centered=True
+        centered=True,
+        background_tasks=background_tasks
     )
+
+    if state["verbose"]:
+        print(
+            "\nTime to testbed prompt: " +
+            f"{background_tasks.elapsed():.3f}s (blocked " +
+            f"{background_tasks.wait_times.get('testbeds', 0):.3f}s " +
+            "waiting for the testbeds)"
+        )
     # Prompt to choose a testbed
     testbed_id = Prompt.ask(
         "\nIn which testbed do you want to validate your Network " +
@@ -135,7 +334,7 @@ def create_testing_descriptor(
         console.print(text)
 
     generator = TestingDescriptorGenerator(
-        connection_points=existing_connect_points if infer_tags_from_nsd else None,
+        connection_points=tags_parser.index if infer_tags_from_nsd else None,
         netapp_name=netapp_name,
         ns_name=ns_name,
         testbed_id=testbed_id,
@@ -147,11 +346,216 @@ def create_testing_descriptor(
 
 
 @app.command()
+@_exit_on_api_error
+def generate(
+    answers: str = typer.Option(
+        ...,
+        help="Answers file, with the answers to the prompts of " +
+        "create-testing-descriptor."
+    ),
+    output_filepath: str = typer.Option(
+        default="testing-descriptor.yaml",
+        help="Output filepath"
+    ),
+    infer_tags_from_nsd: Optional[List[str]] = typer.Option(
+        default=None,
+        help="NSD file, directory, glob pattern or OSM package " +
+        "(.tar.gz) to check the answers' connection points against."
+    ),
+    nsd_parser_workers: int = typer.Option(
+        default=1,
+        min=1,
+        help="Number of processes parsing the NSDs."
+    )
+):
+    '''
+    Generate a testing descriptor from an answers file, without prompts
+    '''
+    start = time.perf_counter()
+    connection_points = None
+    if infer_tags_from_nsd:
+        connection_points = ConnectionPointsParser(
+            infer_tags_from_nsd,
+            nsd_parser_workers,
+            ConnectionPointsCache() if state["use_cache"] else None
+        ).index
+
+    api_client = _get_api_client()
+    try:
+        generator = generate_testing_descriptor(
+            answers,
+            lambda testbed_id: _list_tests(api_client, testbed_id),
+            output_filepath,
+            connection_points
+        )
+    except AnswersError as e:
+        print(e)
+        raise typer.Exit(code=1)
+
+    for warning in unknown_connection_point_warnings(generator):
+        print(f"Warning: {warning}")
+    print(f"Testing descriptor saved in {output_filepath}.")
+    if state["verbose"]:
+        print(f"Generated in {time.perf_counter() - start:.3f}s")
+
+
+@app.command()
+@_exit_on_api_error
+def generate_many(
+    answers_directory: str = typer.Argument(
+        ...,
+        help="Directory with the answers files (.yaml or .yml) of the " +
+        "testing descriptors."
+    ),
+    output_directory: str = typer.Option(
+        default="testing-descriptors",
+        help="Directory where the testing descriptors are saved, with the " +
+        "names of their answers files."
+    ),
+    infer_tags_from_nsd: Optional[List[str]] = typer.Option(
+        default=None,
+        help="NSD file, directory, glob pattern or OSM package " +
+        "(.tar.gz) to check the answers' connection points against."
+    ),
+    workers: int = typer.Option(
+        default=os.cpu_count() or 1,
+        min=1,
+        help="Number of processes generating the testing descriptors, " +
+        "and parsing the NSDs."
+    )
+):
+    '''
+    Generate the testing descriptors of a directory of answers files, in
+    parallel, without prompts
+    '''
+    if not os.path.isdir(answers_directory):
+        print(f"{answers_directory} is not a directory.")
+        raise typer.Exit(code=1)
+    if os.path.abspath(answers_directory) == \
+            os.path.abspath(output_directory):
+        print("The testing descriptors cannot be saved in the directory " +
+              "of the answers files.")
+        raise typer.Exit(code=1)
+    answers_filepaths = find_answers_files(answers_directory)
+    if not answers_filepaths:
+        print(f"There are no answers files in {answers_directory}.")
+        raise typer.Exit(code=1)
+
+    start = time.perf_counter()
+    connection_points = None
+    if infer_tags_from_nsd:
+        connection_points = ConnectionPointsParser(
+            infer_tags_from_nsd,
+            workers,
+            ConnectionPointsCache() if state["use_cache"] else None
+        ).index
+
+    # The catalog is fetched, and validated, once for all the descriptors
+    catalog = asyncio.run(_get_api_client().get_catalog())
+    results = generate_many_testing_descriptors(
+        answers_filepaths,
+        output_directory,
+        catalog,
+        connection_points,
+        workers
+    )
+
+    table = PrintAsTable(
+        header=["Answers File", "Testing Descriptor", "Time (ms)", "Result"],
+        rows=[
+            [
+                result["answers_filepath"],
+                result["output_filepath"] if not result["errors"] else "-",
+                f"{result['seconds'] * 1000:.1f}",
+                "\n".join(result["errors"]) if result["errors"] else
+                "\n".join(["OK"] + [
+                    f"Warning: {warning}"
+                    for warning
+                    in result["warnings"]
+                ])
+            ]
+            for result
+            in results
+        ]
+    )
+    table.print()
+
+    failures = sum(1 for result in results if result["errors"])
+    print(f"\nGenerated {len(results) - failures} of {len(results)} " +
+          f"testing descriptors in {time.perf_counter() - start:.3f}s " +
+          f"({failures} failed).")
+    if failures:
+        raise typer.Exit(code=1)
+
+
+@app.command()
+@_exit_on_api_error
+def watch(
+    answers: str = typer.Option(
+        ...,
+        help="Answers file, with the answers to the prompts of " +
+        "create-testing-descriptor."
+    ),
+    output_filepath: str = typer.Option(
+        default="testing-descriptor.yaml",
+        help="Output filepath"
+    ),
+    infer_tags_from_nsd: Optional[List[str]] = typer.Option(
+        default=None,
+        help="NSD file, directory, glob pattern or OSM package " +
+        "(.tar.gz) to infer connection points from. VNFDs found along " +
+        "with the NSDs are used to resolve the connection points."
+    ),
+    nsd_parser_workers: int = typer.Option(
+        default=1,
+        min=1,
+        help="Number of processes parsing the NSDs."
+    ),
+    debounce: float = typer.Option(
+        default=0.2,
+        min=0,
+        help="Seconds without changes before regenerating the " +
+        "testing descriptor."
+    ),
+    polling: bool = typer.Option(
+        default=False,
+        help="Poll the files for changes, instead of using inotify."
+    )
+):
+    '''
+    Regenerate a testing descriptor whenever its answers file, or its NSDs,
+    change
+    '''
+    api_client = _get_api_client()
+    watcher = DescriptorWatcher(
+        nsd_locations=infer_tags_from_nsd or [],
+        answers_filepath=answers,
+        output_filepath=output_filepath,
+        get_tests=lambda testbed_id: _list_tests(api_client, testbed_id),
+        workers=nsd_parser_workers,
+        cache=ConnectionPointsCache() if state["use_cache"] else None,
+        debounce=debounce,
+        polling=polling
+    )
+
+    if watcher.start():
+        print(f"\nTesting descriptor saved in {output_filepath}.")
+    print(f"\nWatching {answers} and " +
+          f"{len(watcher.tags_parser.base_nsd_filepaths)} descriptors " +
+          "for changes (Ctrl+C to stop)...")
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        pass
+
+
+@app.command()
+@_exit_on_api_error
 def list_testbeds():
     '''
     List available testbeds
     '''
-    api_client = CICD_API_Client.CICDManagerAPIClient()
+    api_client = _get_api_client()
 
     # List Testbeds
     testbeds = _list_testbeds(
@@ -181,7 +585,152 @@ def list_testbeds():
         )
 
 
+def _availability_matrix(tests_per_testbed):
+    # Rows are the tests of all testbeds, columns the testbeds providing them
+    test_names = {}
+    for tests in tests_per_testbed.values():
+        for test in tests:
+            test_names.setdefault(test.id, test.name)
+
+    available = {
+        testbed: {test.id for test in tests}
+        for testbed, tests
+        in tests_per_testbed.items()
+    }
+
+    return PrintAsTable(
+        header=["Test ID", "Test Name"] + list(tests_per_testbed.keys()),
+        rows=[
+            [test_id, test_name] + [
+                "✓" if test_id in available[testbed] else ""
+                for testbed
+                in tests_per_testbed.keys()
+            ]
+            for test_id, test_name
+            in sorted(test_names.items())
+        ]
+    )
+
+
+@app.command()
+@_exit_on_api_error
+def list_tests(
+    testbed: Optional[List[str]] = typer.Option(
+        default=None,
+        help="Testbed whose tests shall be listed. Can be used several times."
+    ),
+    all_testbeds: bool = typer.Option(
+        False,
+        "--all",
+        help="List the tests of all the testbeds."
+    ),
+    matrix: bool = typer.Option(
+        default=True,
+        help="Show the tests availability across the testbeds."
+    )
+):
+    '''
+    List the tests of several testbeds, without prompts
+    '''
+    if not testbed and not all_testbeds:
+        print("Either pass one or more testbeds (--testbed) or list the " +
+              "tests of all testbeds (--all).")
+        raise typer.Exit(code=1)
+
+    api_client = _get_api_client()
+    testbeds = _list_testbeds(api_client=api_client)
+    testbed_ids = [t["id"] for t in testbeds]
+
+    if all_testbeds:
+        selected_testbeds = testbed_ids
+    else:
+        # Keep the order in which the testbeds were passed, without repeats
+        selected_testbeds = list(dict.fromkeys(testbed))
+        unknown_testbeds = [
+            t for t in selected_testbeds if t not in testbed_ids
+        ]
+        if unknown_testbeds:
+            print("The following testbeds do not exist or do not provide " +
+                  f"tests: {', '.join(unknown_testbeds)}. Available " +
+                  f"testbeds: {', '.join(testbed_ids)}.")
+            raise typer.Exit(code=1)
+
+    tests_per_testbed = asyncio.run(
+        api_client.get_tests_per_testbeds(selected_testbeds)
+    )
+
+    table = PrintAsTable(
+        header=["Testbed", "Test ID", "Test Name", "Test Description"],
+        rows=[
+            [testbed_id, test.id, test.name, test.description]
+            for testbed_id, tests
+            in tests_per_testbed.items()
+            for test
+            in tests
+        ]
+    )
+    table.print()
+
+    if matrix:
+        print("\nTests availability across testbeds:")
+        _availability_matrix(tests_per_testbed).print()
+
+
 @app.command()
+@_exit_on_api_error
+def search_tests(
+    query: str = typer.Argument(
+        ...,
+        help="Words to search in the tests' names, descriptions and variables."
+    ),
+    testbed: Optional[List[str]] = typer.Option(
+        default=None,
+        help="Only search the tests of this testbed. Can be used several " +
+        "times."
+    ),
+    limit: int = typer.Option(
+        default=10,
+        min=1,
+        help="Maximum number of results."
+    )
+):
+    '''
+    Search tests across all testbeds
+    '''
+    api_client = _get_api_client()
+
+    start = time.perf_counter()
+    index = CatalogSearchIndex.from_catalog(
+        asyncio.run(api_client.get_catalog())
+    )
+    built = time.perf_counter()
+    results = index.search(query, testbeds=testbed, limit=limit)
+    searched = time.perf_counter()
+
+    if state["verbose"]:
+        print(f"Indexed {len(index.tests)} tests in " +
+              f"{(built - start) * 1000:.1f}ms. Query answered in " +
+              f"{(searched - built) * 1000:.2f}ms.")
+
+    if not results:
+        print(f"No tests match '{query}'.")
+        return
+
+    table = PrintAsTable(
+        header=["Score", "Testbed", "Test ID", "Test Name",
+                "Test Description"],
+        rows=[
+            [f"{score:.2f}", result_testbed, test.id, test.name,
+             test.description]
+            for score, result_testbed, test
+            in results
+        ]
+    )
+    table.print()
+
+
+@app.command()
+@_exit_on_api_error
 def list_available_tests():
     '''
     List available tests to developer
@@ -192,7 +741,7 @@ def list_available_tests():
     # Print all the available testbeds
     prompts.tests_testbeds_list_prompt()
 
-    ApiClient = CICD_API_Client.CICDManagerAPIClient()
+    ApiClient = _get_api_client()
     # List Testbeds
     testbeds = _list_testbeds(
         api_client=ApiClient,
@@ -243,12 +792,107 @@ def list_available_tests():
         panels.print()
 
 
+@cache_app.command("stats")
+def cache_stats():
+    '''
+    Show the local testbeds and tests cache statistics
+    '''
+    stats = CatalogCache(ttl=state["cache_ttl"]).stats()
+
+    print(f"\nCache directory: {stats['cache_dir']}")
+    print(f"Time to live: {stats['ttl']} seconds")
+    print(f"Hits: {stats['hits']} | Misses: {stats['misses']} | " +
+          f"Revalidated: {stats['revalidated']} | " +
+          f"Stale responses served: {stats['stale_served']}")
+    nsd_stats = ConnectionPointsCache().stats()
+    print(f"Cached NSD connection points: {nsd_stats['entries']} " +
+          f"({nsd_stats['size']} bytes, in {nsd_stats['cache_dir']})\n")
+
+    table = PrintAsTable(
+        header=["Cached URL", "Size (bytes)", "Age (seconds)", "Fresh"],
+        rows=[
+            [
+                entry["url"],
+                str(entry["size"]),
+                str(int(entry["age"])),
+                "Yes" if entry["fresh"] else "No"
+            ]
+            for entry
+            in stats["entries"]
+        ]
+    )
+    table.print()
+
+
+@cache_app.command("clear")
+def cache_clear():
+    '''
+    Remove all the cached testbeds, tests and NSD connection points
+    '''
+    removed = CatalogCache().clear()
+    print(f"Removed {removed} cached responses.")
+    removed = ConnectionPointsCache().clear()
+    print(f"Removed {removed} cached NSD connection points.")
+
+
 @app.callback()
 def main(
+    ctx: typer.Context,
     verbose: bool = False,
     ci_cd_manager_url: str = typer.Option(
         default=Constants.CI_CD_SERVICE_URL,
         help="CI/CD Manager URL to override the default one."
+    ),
+    pool_size: int = typer.Option(
+        default=Constants.CI_CD_SERVICE_POOL_MAXSIZE,
+        min=1,
+        help="Maximum number of keep-alive connections to the CI/CD Manager."
+    ),
+    offline: bool = typer.Option(
+        default=False,
+        help="Only use the cached testbeds and tests, even if stale."
+    ),
+    cache: bool = typer.Option(
+        default=True,
+        help="Cache the testbeds and tests retrieved from the CI/CD Manager."
+    ),
+    cache_ttl: int = typer.Option(
+        default=Constants.CATALOG_CACHE_TTL,
+        min=0,
+        help="Seconds during which the cached testbeds and tests are used " +
+        "without revalidating them."
+    ),
+    connect_timeout: float = typer.Option(
+        default=Constants.CI_CD_SERVICE_CONNECT_TIMEOUT,
+        callback=_positive,
+        help="Seconds to wait for a connection to the CI/CD Manager."
+    ),
+    read_timeout: float = typer.Option(
+        default=Constants.CI_CD_SERVICE_READ_TIMEOUT,
+        callback=_positive,
+        help="Seconds to wait for each response of the CI/CD Manager."
+    ),
+    deadline: Optional[float] = typer.Option(
+        default=None,
+        callback=_positive,
+        help="Overall seconds the command may spend on CI/CD Manager " +
+        "requests, including retries, counted from its first request."
+    ),
+    retries: int = typer.Option(
+        default=Constants.CI_CD_SERVICE_RETRIES,
+        min=0,
+        help="Times a failed CI/CD Manager request is retried."
+    ),
+    hedge_after: Optional[float] = typer.Option(
+        default=None,
+        callback=_positive,
+        help="Seconds after which a slow CI/CD Manager request is raced " +
+        "against a second one."
+    ),
+    trace: Optional[str] = typer.Option(
+        default=None,
+        help="Save a Chrome trace-event JSON file with the timings of the " +
+        "HTTP requests, YAML parsing, rendering and serialization."
     )
 ):
     if verbose:
@@ -256,6 +900,23 @@ def main(
         state["verbose"] = True
     # Set the ci_cd_manager_url
     Constants.CI_CD_SERVICE_URL = ci_cd_manager_url
+    state["pool_size"] = pool_size
+    state["offline"] = offline
+    state["use_cache"] = cache
+    state["cache_ttl"] = cache_ttl
+    state["connect_timeout"] = connect_timeout
+    state["read_timeout"] = read_timeout
+    state["deadline"] = deadline
+    state["retries"] = retries
+    state["hedge_after"] = hedge_after
+    # Release the pooled connections once the command finishes
+    ctx.call_on_close(_close_api_client)
+
+    if trace:
+        tracer.enable()
+        # The command's span is closed before the trace is saved
+        ctx.call_on_close(lambda: tracer.export(trace))
+        ctx.with_resource(tracer.span(ctx.invoked_subcommand, "cli"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 10:40:02
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 10:40:02
+
+import pytest
+
+from CICDManagerStandIn.server import CICDManagerStandIn
+from helpers import constants as Constants
+
+STUB_TESTBEDS = [
+    {"id": "testbed_itav", "name": "ITAv", "description": "ITAv Testbed"},
+    {"id": "testbed_ote", "name": "OTE", "description": "OTE Testbed"},
+    {"id": "testbed_empty", "name": "Empty", "description": "No tests"},
+]
+
+STUB_TESTS = {
+    "testbed_itav": {
+        "bandwidth": {
+            "id": "bandwidth",
+            "name": "bandwidth",
+            "description": "Tests the bandwidth between two VNFs",
+            "mandatory": False,
+            "test_variables": [
+                {
+                    "variable_name": "host1_ip",
+                    "description": "IP of the first host",
+                    "mandatory": True,
+                    "possible_options": [],
+                    "type": "str",
+                    "can_be_injected_by_the_nods": True
+                },
+                {
+                    "variable_name": "comparator",
+                    "description": "Comparator",
+                    "mandatory": True,
+                    "possible_options": ["more_than", "less_than"],
+                    "type": "str",
+                    "can_be_injected_by_the_nods": False
+                }
+            ]
+        },
+        "open_ports": {
+            "id": "open_ports",
+            "name": "open ports",
+            "description": "Validates the open ports of a VM",
+            "mandatory": True,
+            "test_variables": []
+        }
+    },
+    "testbed_ote": {
+        "packet_loss": {
+            "id": "packet_loss",
+            "name": "packet loss",
+            "description": "Tests the packet loss between two VNFs",
+            "mandatory": False,
+            "test_variables": [
+                {
+                    "variable_name": "threshold",
+                    "description": "Threshold",
+                    "mandatory": True,
+                    "possible_options": [],
+                    "type": "float",
+                    "can_be_injected_by_the_nods": False
+                }
+            ]
+        }
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def user_cache_dir(tmp_path, monkeypatch):
+    # Commands cache the catalog and the NSDs' connection points by default,
+    # so tests must never touch the developer's cache
+    cache_home = tmp_path / "user_cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.setenv("LOCALAPPDATA", str(cache_home))
+    monkeypatch.setenv("HOME", str(cache_home))
+    return cache_home
+
+
+@pytest.fixture
+def stub_manager(monkeypatch):
+    stub = CICDManagerStandIn(tests=STUB_TESTS, testbeds=STUB_TESTBEDS)
+    stub.start()
+    monkeypatch.setattr(Constants, "CI_CD_SERVICE_URL", stub.url)
+    yield stub
+    stub.stop()
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 10:52:17
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 10:52:17
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from CICDManagerAPIClient.apli_client import CICDManagerAPIClient
+from CICDManagerAPIClient.exceptions import CICDManagerAPIError, \
+    CICDManagerHTTPError, CICDManagerTimeoutError, DeadlineExceededError
+from helpers import constants as Constants
+
+ALL_TESTS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+ALL_TESTBEDS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTBEDS.value
+
+
+def test_connections_are_reused(stub_manager):
+    with CICDManagerAPIClient() as api_client:
+        for _ in range(5):
+            api_client.clear_memo()
+            api_client.get_all_testbeds()
+
+        stats = api_client.connection_stats
+
+    assert stats["requests"] == 10
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 9
+
+
+def test_pool_is_shared_by_concurrent_requests(stub_manager):
+    stub_manager.latency = 0.05
+
+    # Without memoization, each call sends its own request
+    with CICDManagerAPIClient(pool_maxsize=2, memoize=False) as api_client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda _: api_client.get_all_testbeds(),
+                range(8)
+            ))
+        stats = api_client.connection_stats
+
+    assert all(r == results[0] for r in results)
+    assert stats["requests"] == 16
+    # Requests wait for a pooled connection instead of opening more
+    assert stats["connections_opened"] == 2
+    assert stats["connections_reused"] == 14
+
+
+def test_catalog_is_fetched_once(stub_manager):
+    with CICDManagerAPIClient() as api_client:
+        testbeds = api_client.get_all_testbeds()
+        tests = api_client.get_tests_per_testbed("testbed_itav")
+
+    # Testbeds without tests are not listed
+    assert [t["id"] for t in testbeds] == ["testbed_itav", "testbed_ote"]
+    assert [t.id for t in tests] == ["bandwidth", "open_ports"]
+    assert stub_manager.hits[ALL_TESTS] == 1
+    assert stub_manager.hits[ALL_TESTBEDS] == 1
+
+
+def test_tests_per_testbed_without_catalog(stub_manager):
+    with CICDManagerAPIClient() as api_client:
+        for _ in range(3):
+            tests = api_client.get_tests_per_testbed("testbed_ote")
+
+    assert [t.id for t in tests] == ["packet_loss"]
+    assert stub_manager.hits[ALL_TESTS] == 1
+
+
+def test_in_flight_requests_are_coalesced(stub_manager):
+    stub_manager.latency = 0.2
+
+    with CICDManagerAPIClient() as api_client:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(
+                lambda _: api_client.get_all_testbeds(),
+                range(8)
+            ))
+        stats = api_client.connection_stats
+
+    assert all(r == results[0] for r in results)
+    assert stub_manager.hits[ALL_TESTS] == 1
+    assert stub_manager.hits[ALL_TESTBEDS] == 1
+    assert stats["requests_coalesced"] == 14
+
+
+def test_injected_errors(stub_manager):
+    stub_manager.error_rate = 1
+
+    with CICDManagerAPIClient(retries=0) as api_client:
+        with pytest.raises(CICDManagerHTTPError) as e:
+            api_client.get_all_tests()
+        assert e.value.status_code == 503
+        # Failed requests are not memoized
+        with pytest.raises(CICDManagerHTTPError):
+            api_client.get_all_tests()
+
+    assert stub_manager.errors[ALL_TESTS] == 2
+
+
+def test_client_errors_are_not_retried(stub_manager):
+    stub_manager.error_rate = 1
+    stub_manager.error_status = 404
+
+    with CICDManagerAPIClient(retries=3) as api_client:
+        with pytest.raises(CICDManagerHTTPError):
+            api_client.get_all_tests()
+        assert api_client.connection_stats["requests_retried"] == 0
+
+    assert stub_manager.errors[ALL_TESTS] == 1
+
+
+def test_unknown_errors_are_not_retried(monkeypatch):
+    # requests cannot send requests with this scheme
+    monkeypatch.setattr(Constants, "CI_CD_SERVICE_URL", "invalid://manager")
+
+    with CICDManagerAPIClient(retries=3) as api_client:
+        with pytest.raises(CICDManagerAPIError, match="Unknown Error"):
+            api_client.get_all_tests()
+        assert api_client.connection_stats["requests_retried"] == 0
+        assert api_client.connection_stats["requests"] == 1
+
+
+def test_retries_honor_retry_after(stub_manager):
+    stub_manager.error_rate = 1
+    stub_manager.retry_after = 0
+
+    with CICDManagerAPIClient(retries=2) as api_client:
+        start = time.monotonic()
+        with pytest.raises(CICDManagerHTTPError):
+            api_client.get_all_tests()
+        # Retry-After: 0 overrides the exponential backoff
+        assert time.monotonic() - start < 0.5
+        assert api_client.connection_stats["requests_retried"] == 2
+
+    assert stub_manager.errors[ALL_TESTS] == 3
+
+
+def test_retries_recover_from_transient_errors(stub_manager):
+    stub_manager.error_rate = 0.5
+    stub_manager.retry_after = 0
+    stub_manager._random.seed(1)
+
+    with CICDManagerAPIClient(retries=10) as api_client:
+        for _ in range(5):
+            api_client.clear_memo()
+            assert "testbed_itav" in api_client.get_all_tests()
+
+
+def test_explicit_zeros_are_kept():
+    with CICDManagerAPIClient(retries=0, hedge_after=0) as api_client:
+        assert api_client.retries == 0
+        assert api_client.hedge_after == 0
+        assert api_client.connect_timeout == \
+            Constants.CI_CD_SERVICE_CONNECT_TIMEOUT
+        assert api_client.read_timeout == Constants.CI_CD_SERVICE_READ_TIMEOUT
+
+    # Instead of being replaced by the defaults, zero timeouts are rejected
+    for timeouts in [{"connect_timeout": 0}, {"read_timeout": 0.0}]:
+        with pytest.raises(ValueError, match="must be positive"):
+            CICDManagerAPIClient(**timeouts)
+
+
+def test_read_timeout(stub_manager):
+    stub_manager.latency = 0.5
+
+    with CICDManagerAPIClient(read_timeout=0.05, retries=0) as api_client:
+        with pytest.raises(CICDManagerTimeoutError):
+            api_client.get_all_tests()
+
+
+def test_deadline(stub_manager):
+    stub_manager.error_rate = 1
+    stub_manager.retry_after = 5
+
+    with CICDManagerAPIClient(deadline=1, retries=3) as api_client:
+        start = time.monotonic()
+        # Waiting for Retry-After would exceed the deadline
+        with pytest.raises(DeadlineExceededError):
+            api_client.get_all_tests()
+        assert time.monotonic() - start < 1
+
+
+def test_long_retry_after_is_not_waited(stub_manager):
+    stub_manager.error_rate = 1
+    stub_manager.retry_after = Constants.CI_CD_SERVICE_BACKOFF_MAX + 3600
+
+    with CICDManagerAPIClient(retries=3) as api_client:
+        start = time.monotonic()
+        with pytest.raises(CICDManagerHTTPError):
+            api_client.get_all_tests()
+        # Failed right away, instead of waiting for an hour
+        assert time.monotonic() - start < 1
+        assert api_client.connection_stats["requests_retried"] == 0
+
+
+def test_deadline_starts_with_the_first_request(stub_manager):
+    with CICDManagerAPIClient(deadline=0.2) as api_client:
+        # E.g., the user answering prompts before the first request
+        time.sleep(0.3)
+        assert "testbed_itav" in api_client.get_all_tests()
+
+        time.sleep(0.3)
+        api_client.clear_memo()
+        with pytest.raises(DeadlineExceededError):
+            api_client.get_all_tests()
+
+
+def test_hedged_requests(stub_manager):
+    stub_manager.latency = 0.2
+    stub_manager.jitter = 0
+
+    with CICDManagerAPIClient(hedge_after=0.05) as api_client:
+        assert "testbed_itav" in api_client.get_all_tests()
+        assert api_client.connection_stats["requests_hedged"] == 1
+        assert api_client.connection_stats["requests"] == 2
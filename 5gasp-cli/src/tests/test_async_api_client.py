@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 12:41:06
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 12:41:06
+
+import asyncio
+import time
+
+from CICDManagerAPIClient.async_apli_client import AsyncCICDManagerAPIClient
+from helpers import constants as Constants
+
+ALL_TESTS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+ALL_TESTBEDS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTBEDS.value
+
+
+def test_catalog_requests_are_concurrent(stub_manager):
+    stub_manager.latency = 0.3
+
+    with AsyncCICDManagerAPIClient() as api_client:
+        start = time.perf_counter()
+        testbeds = asyncio.run(api_client.get_all_testbeds())
+        elapsed = time.perf_counter() - start
+        tests = asyncio.run(api_client.get_tests_per_testbed("testbed_ote"))
+
+    assert [t["id"] for t in testbeds] == ["testbed_itav", "testbed_ote"]
+    assert [t.id for t in tests] == ["packet_loss"]
+    # Both round trips overlap
+    assert elapsed < 0.55
+    assert stub_manager.hits[ALL_TESTS] == 1
+    assert stub_manager.hits[ALL_TESTBEDS] == 1
+
+
+def test_concurrency_is_bounded(stub_manager):
+    stub_manager.latency = 0.1
+    testbeds = ["testbed_itav", "testbed_ote"]
+
+    async def list_tests(api_client):
+        return await asyncio.gather(*[
+            api_client.get_tests_per_testbed(t)
+            for t
+            in testbeds
+        ])
+
+    with AsyncCICDManagerAPIClient(max_concurrency=1) as api_client:
+        start = time.perf_counter()
+        results = asyncio.run(list_tests(api_client))
+        elapsed = time.perf_counter() - start
+
+    assert [[t.id for t in r] for r in results] == \
+        [["bandwidth", "open_ports"], ["packet_loss"]]
+    # Only one request in-flight at a time
+    assert elapsed >= 0.2
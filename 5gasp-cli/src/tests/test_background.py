@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 13:02:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 13:02:12
+
+import threading
+import time
+
+import pytest
+
+from DescriptorParser.parser import ConnectionPointsParser
+from helpers.background import BackgroundTasks
+
+
+def test_result():
+    with BackgroundTasks() as background_tasks:
+        background_tasks.submit("sum", sum, [1, 2, 3])
+
+        assert "sum" in background_tasks
+        assert "other" not in background_tasks
+        assert background_tasks.result("sum") == 6
+
+
+def test_exception_is_raised_by_result():
+    def fail():
+        raise ValueError("Invalid NSD")
+
+    with BackgroundTasks() as background_tasks:
+        background_tasks.submit("fail", fail)
+
+        with pytest.raises(ValueError, match="Invalid NSD"):
+            background_tasks.result("fail")
+        # The time spent waiting is recorded anyway
+        assert "fail" in background_tasks.wait_times
+
+
+def test_wait_times():
+    with BackgroundTasks() as background_tasks:
+        background_tasks.submit("slow", time.sleep, 0.2)
+        background_tasks.submit("fast", lambda: None)
+        time.sleep(0.05)
+
+        background_tasks.result("fast")
+        background_tasks.result("slow")
+
+        # Only the part of the task not hidden behind the caller's own work
+        assert background_tasks.wait_times["fast"] < 0.05
+        assert 0.1 < background_tasks.wait_times["slow"] < 0.2
+        assert background_tasks.elapsed() >= 0.2
+
+
+def test_shutdown_cancels_pending_tasks():
+    release = threading.Event()
+    background_tasks = BackgroundTasks(max_workers=1)
+    background_tasks.submit("blocking", release.wait)
+    background_tasks.submit("pending", lambda: "never run")
+
+    background_tasks.shutdown()
+    release.set()
+
+    assert background_tasks._futures["pending"].cancelled()
+
+
+def test_on_result_runs_on_the_calling_thread():
+    calls = []
+
+    with BackgroundTasks() as background_tasks:
+        background_tasks.submit(
+            "sum", sum, [1, 2],
+            on_result=lambda result: calls.append(
+                (result, threading.current_thread())
+            )
+        )
+        background_tasks.result("sum")
+        background_tasks.result("sum")
+
+    # Only once, by the thread gathering the result
+    assert calls == [(3, threading.current_thread())]
+
+
+def test_parser_errors_are_printed_when_gathered(capsys):
+    with BackgroundTasks() as background_tasks:
+        background_tasks.submit(
+            "tags_parser",
+            ConnectionPointsParser,
+            ["tests/resources/missing_nsd.yaml"],
+            report_errors=False,
+            on_result=ConnectionPointsParser.print_errors
+        )
+        background_tasks._futures["tags_parser"].result()
+        # Nothing printed by the background thread
+        assert capsys.readouterr().out == ""
+
+        tags_parser = background_tasks.result("tags_parser")
+
+    assert [error[0] for error in tags_parser.errors] == \
+        ["tests/resources/missing_nsd.yaml"]
+    assert "missing_nsd.yaml" in capsys.readouterr().out
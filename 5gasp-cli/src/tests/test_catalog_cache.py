@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 11:58:30
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 11:58:30
+
+import os
+
+from CICDManagerAPIClient.apli_client import CICDManagerAPIClient
+from CICDManagerAPIClient import catalog_cache
+from CICDManagerAPIClient.catalog_cache import CatalogCache
+from CICDManagerAPIClient.exceptions import CICDManagerOfflineError
+import pytest
+from helpers import constants as Constants
+
+ALL_TESTS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+ALL_TESTBEDS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTBEDS.value
+
+
+def _list_catalog(cache, offline=False):
+    with CICDManagerAPIClient(cache=cache, offline=offline) as api_client:
+        testbeds = api_client.get_all_testbeds()
+        tests = api_client.get_tests_per_testbed("testbed_itav")
+    return testbeds, tests
+
+
+def test_fresh_cache_is_served_without_requests(stub_manager, tmp_path):
+    cache = CatalogCache(cache_dir=str(tmp_path), ttl=3600)
+    cold = _list_catalog(cache)
+    warm = _list_catalog(cache)
+
+    assert cold[0] == warm[0]
+    assert [t.id for t in cold[1]] == [t.id for t in warm[1]]
+    assert stub_manager.hits[ALL_TESTS] == 1
+    assert stub_manager.hits[ALL_TESTBEDS] == 1
+
+    stats = cache.stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 2
+    assert len(stats["entries"]) == 2
+
+
+def test_stale_cache_is_revalidated(stub_manager, tmp_path):
+    cache = CatalogCache(cache_dir=str(tmp_path), ttl=0)
+    _list_catalog(cache)
+    testbeds, _ = _list_catalog(cache)
+
+    assert [t["id"] for t in testbeds] == ["testbed_itav", "testbed_ote"]
+    assert stub_manager.not_modified[ALL_TESTS] == 1
+    assert stub_manager.not_modified[ALL_TESTBEDS] == 1
+    assert cache.stats()["revalidated"] == 2
+
+
+def test_offline_mode_serves_stale_cache(stub_manager, tmp_path):
+    _list_catalog(CatalogCache(cache_dir=str(tmp_path)))
+    stub_manager.stop()
+
+    cache = CatalogCache(cache_dir=str(tmp_path), ttl=0)
+    testbeds, tests = _list_catalog(cache, offline=True)
+
+    assert [t["id"] for t in testbeds] == ["testbed_itav", "testbed_ote"]
+    assert [t.id for t in tests] == ["bandwidth", "open_ports"]
+
+
+def test_offline_mode_without_cache(tmp_path):
+    cache = CatalogCache(cache_dir=str(tmp_path))
+    with CICDManagerAPIClient(cache=cache, offline=True) as api_client:
+        with pytest.raises(CICDManagerOfflineError):
+            api_client.get_all_tests()
+        assert api_client.connection_stats["requests"] == 0
+
+
+def test_clear_cache(stub_manager, tmp_path):
+    cache = CatalogCache(cache_dir=str(tmp_path))
+    _list_catalog(cache)
+
+    assert cache.clear() == 2
+    stats = cache.stats()
+    assert stats["entries"] == []
+    assert stats["hits"] == 0
+
+
+def test_clear_cache_cleared_concurrently(stub_manager, tmp_path,
+                                          monkeypatch):
+    cache = CatalogCache(cache_dir=str(tmp_path))
+    _list_catalog(cache)
+    listdir = os.listdir
+
+    def listdir_then_clear(directory):
+        # Another process clears the cache right after it is listed
+        filenames = listdir(directory)
+        monkeypatch.undo()
+        CatalogCache(cache_dir=str(tmp_path)).clear()
+        return filenames
+
+    monkeypatch.setattr(catalog_cache.os, "listdir", listdir_then_clear)
+
+    assert cache.clear() == 0
+    assert cache.stats()["entries"] == []
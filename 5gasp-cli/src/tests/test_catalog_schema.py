@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 19:05:26
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 19:05:26
+
+import copy
+import json
+
+import pytest
+
+from CICDManagerAPIClient import apli_client
+from CICDManagerAPIClient.apli_client import CICDManagerAPIClient
+from CICDManagerAPIClient.catalog_cache import CatalogCache
+from CICDManagerAPIClient.catalog_schema import validate_tests_payload, \
+    validate_testbeds_payload
+from CICDManagerAPIClient.exceptions import CatalogValidationError
+from helpers import constants as Constants
+from tests.conftest import STUB_TESTS, STUB_TESTBEDS
+
+ALL_TESTS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+
+
+def _body(tests):
+    return json.dumps({"message": "Success", "data": {"tests": tests}})
+
+
+def _malformed_tests():
+    tests = copy.deepcopy(STUB_TESTS)
+    bandwidth = tests["testbed_itav"]["bandwidth"]
+    del bandwidth["mandatory"]
+    bandwidth["test_variables"][1]["possible_options"] = "more_than"
+    tests["testbed_ote"]["packet_loss"]["test_variables"][0]["type"] = None
+    return tests
+
+
+def test_valid_payloads_build_the_models():
+    catalog = validate_tests_payload(_body(STUB_TESTS))
+
+    assert list(catalog.keys()) == list(STUB_TESTS.keys())
+    for testbed, tests in catalog.items():
+        assert [t.id for t in tests] == list(STUB_TESTS[testbed].keys())
+        assert all(t.test_type == "predefined" for t in tests)
+
+    testbeds = validate_testbeds_payload(
+        json.dumps({"data": {"testbeds": STUB_TESTBEDS}})
+    )
+    assert testbeds == STUB_TESTBEDS
+
+
+def test_all_errors_are_reported():
+    with pytest.raises(CatalogValidationError) as e:
+        validate_tests_payload(_body(_malformed_tests()))
+
+    assert e.value.errors == [
+        "$.data.tests.testbed_itav.bandwidth: missing field 'mandatory'",
+        "$.data.tests.testbed_itav.bandwidth.test_variables[1]" +
+        ".possible_options: expected a list, got str 'more_than'",
+        "$.data.tests.testbed_ote.packet_loss.test_variables[0].type: " +
+        "expected a string, got null"
+    ]
+
+
+def test_invalid_json():
+    with pytest.raises(CatalogValidationError):
+        validate_testbeds_payload(b"<html>Bad Gateway</html>")
+
+
+def test_malformed_responses_are_not_cached(stub_manager, tmp_path):
+    stub_manager.tests = _malformed_tests()
+    cache = CatalogCache(cache_dir=str(tmp_path))
+
+    with CICDManagerAPIClient(cache=cache) as api_client:
+        with pytest.raises(CatalogValidationError) as e:
+            api_client.get_tests_per_testbed("testbed_itav")
+        assert len(e.value.errors) == 2
+
+    assert cache.stats()["entries"] == []
+
+
+def test_cached_responses_are_validated_once(stub_manager, tmp_path,
+                                             monkeypatch):
+    cache = CatalogCache(cache_dir=str(tmp_path))
+    with CICDManagerAPIClient(cache=cache) as api_client:
+        # The tests built while validating are reused
+        catalog = api_client.get_catalog()
+        assert api_client.get_catalog() == catalog
+    assert cache.get(stub_manager.url + ALL_TESTS).validated
+
+    def validate(*args, **kwargs):
+        raise AssertionError("Validated a cached response again")
+
+    monkeypatch.setattr(apli_client, "validate_tests_payload", validate)
+    with CICDManagerAPIClient(cache=cache) as api_client:
+        tests = api_client.get_tests_per_testbed("testbed_itav")
+    assert [t.id for t in tests] == ["bandwidth", "open_ports"]
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 17:08:55
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 17:08:55
+
+from CICDManagerAPIClient.apli_client import CICDManagerAPIClient
+from CICDManagerAPIClient.catalog_search import CatalogSearchIndex, tokenize
+
+
+def _index(stub_manager):
+    with CICDManagerAPIClient() as api_client:
+        return CatalogSearchIndex.from_catalog(api_client.get_catalog())
+
+
+def _results(index, query, **kwargs):
+    return [
+        (testbed, test.id)
+        for _, testbed, test
+        in index.search(query, **kwargs)
+    ]
+
+
+def test_tokenize():
+    assert tokenize("Host1_IP of the VNF") == \
+        ["host1_ip", "host1", "ip", "of", "the", "vnf"]
+
+
+def test_catalog_has_all_testbeds(stub_manager):
+    index = _index(stub_manager)
+    assert sorted(index.tests.keys()) == [
+        ("testbed_itav", "bandwidth"),
+        ("testbed_itav", "open_ports"),
+        ("testbed_ote", "packet_loss")
+    ]
+
+
+def test_search_ranks_name_matches_first(stub_manager):
+    index = _index(stub_manager)
+
+    # 'packet loss' is in the name of one test, 'two VNFs' in the
+    # descriptions of two tests
+    assert _results(index, "packet loss between two vnfs") == \
+        [("testbed_ote", "packet_loss"), ("testbed_itav", "bandwidth")]
+
+
+def test_search_variables_and_options(stub_manager):
+    index = _index(stub_manager)
+
+    assert _results(index, "host1_ip") == [("testbed_itav", "bandwidth")]
+    assert _results(index, "less_than") == [("testbed_itav", "bandwidth")]
+    assert _results(index, "threshold") == [("testbed_ote", "packet_loss")]
+
+
+def test_search_prefix_and_testbed_filter(stub_manager):
+    index = _index(stub_manager)
+
+    assert _results(index, "band") == [("testbed_itav", "bandwidth")]
+    assert _results(index, "two vnfs", testbeds=["testbed_ote"]) == \
+        [("testbed_ote", "packet_loss")]
+    assert _results(index, "nothing matches this") == []
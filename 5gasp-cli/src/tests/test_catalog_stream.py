@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 13:58:02
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 13:58:02
+
+import json
+import time
+
+import pytest
+
+from CICDManagerAPIClient import catalog_stream
+from CICDManagerAPIClient.catalog_stream import iter_testbeds_with_tests, \
+    iter_testbed_tests
+from tests.conftest import STUB_TESTS
+
+
+def _catalog_body(**dumps_kwargs):
+    tests = dict(STUB_TESTS)
+    # Values that could trip a naive scanner
+    tests["testbed_tricky"] = {
+        "t{1}": {
+            "id": "t{1}",
+            "name": "brackets ] } and \"quotes\" \\\\",
+            "description": "ünicode ✓",
+            "mandatory": True,
+            "test_variables": []
+        }
+    }
+    body = {"status": "ok", "data": {"extra": [1, {"a": "}"}], "tests": tests}}
+    return json.dumps(body, **dumps_kwargs).encode()
+
+
+@pytest.mark.parametrize("dumps_kwargs", [{}, {"indent": 4},
+                                          {"separators": (",", ":")},
+                                          {"ensure_ascii": False}])
+def test_stream_matches_full_parse(dumps_kwargs):
+    body = _catalog_body(**dumps_kwargs)
+    catalog = json.loads(body)["data"]["tests"]
+
+    assert list(iter_testbeds_with_tests(body)) == list(catalog.keys())
+    for testbed, tests in catalog.items():
+        streamed = list(iter_testbed_tests(body, testbed))
+        assert [t.id for t in streamed] == list(tests.keys())
+        assert [t.name for t in streamed] == \
+            [t["name"] for t in tests.values()]
+        assert [len(t.test_variables) for t in streamed] == \
+            [len(t["test_variables"]) for t in tests.values()]
+
+
+def test_stream_unknown_testbed():
+    with pytest.raises(KeyError):
+        list(iter_testbed_tests(_catalog_body(), "unknown"))
+
+
+def test_skip_deeply_nested_values():
+    value = {"a": [[[[[[{"b": "]\\\"}", "c": [1, 2.5, None]}]]]]]]}
+    text = json.dumps({"skipped": value, "kept": 1})
+
+    # The skipped value is nested deeper than a single match consumes
+    assert catalog_stream._find_member(text, 0, "kept") == len(text) - 2
+
+
+def test_skip_unterminated_value_fails_fast():
+    # Would backtrack exponentially with nested quantifiers over the same
+    # characters, such as (?:[^"]+)*
+    text = '{"skipped": [[[["' + "\\n" * 64 + '", 1' + "0" * 64
+
+    start = time.perf_counter()
+    with pytest.raises(ValueError, match="Unterminated value"):
+        catalog_stream._find_member(text, 0, "kept")
+    assert time.perf_counter() - start < 1
@@ -4,11 +4,15 @@
 # @Last Modified by:   Eduardo Santos
 # @Last Modified time: 2023-03-14 17:41:45
 
+import os
+
 import typer
 from typer.testing import CliRunner
 
 from main import app
-from main import infer_tags
+from main import infer_tags, _format_vdu_interfaces
+from DescriptorParser.parser import ConnectionPointsParser
+from helpers import yaml_io
 
 runner = CliRunner()
 
@@ -33,14 +37,60 @@ runner = CliRunner()
 #    for tag in tags:
 #        assert tag in result.stdout
 
-def test_infer_tags():
+def test_infer_tags(user_cache_dir):
     output = infer_tags(["tests/resources/hackfest_multivdu_nsd.yaml"])
 
-    tags = set(["{{hackfest_multivdu-ns|hackfest_multivdu-vnf|vnf-mgmt-ext}}", 
-            "{{hackfest_multivdu-ns|hackfest_multivdu-vnf|vnf-data-ext}}",
-            "{{hackfest_multivdu-ns|hackfest_multivdu-vnf|vnf-mgmt-ext}}",
-            "{{hackfest_multivdu-ns|hackfest_multivdu-vnf|vnf-data-ext}}"])
-            
-    #assert result.exit_code == 0
-    for tag in tags:
-        assert tag in output
\ No newline at end of file
+    tags = ["{{deployment_info|hackfest_multivdu-ns|vnf1|vnf-mgmt-ext}}",
+            "{{deployment_info|hackfest_multivdu-ns|vnf1|vnf-data-ext}}",
+            "{{deployment_info|hackfest_multivdu-ns|vnf2|vnf-mgmt-ext}}",
+            "{{deployment_info|hackfest_multivdu-ns|vnf2|vnf-data-ext}}"]
+
+    # Each tag only once, in the NSD's order
+    assert output == tags
+    # Cached in the test's own cache directory
+    assert os.listdir(user_cache_dir)
+
+
+def test_format_vdu_interfaces(tmp_path):
+    with open("tests/resources/hackfest_multivdu_vnfd.yaml") as vnfd_file:
+        vnfd = yaml_io.load(vnfd_file)
+    # An external connection point not bound to any VDU
+    del vnfd["vnfd"]["ext-cpd"][1]["int-cpd"]
+    (tmp_path / "hackfest_vnfd.yaml").write_text(yaml_io.dump(vnfd))
+    tags_parser = ConnectionPointsParser([
+        "tests/resources/hackfest_multivdu_nsd.yaml",
+        str(tmp_path / "hackfest_vnfd.yaml")
+    ])
+
+    resolution = tags_parser.resolve(
+        "hackfest_multivdu-ns", "vnf1", "vnf-data-ext"
+    )
+    assert resolution["vdu_id"] is None
+    assert _format_vdu_interfaces(resolution) == "-"
+    assert _format_vdu_interfaces(tags_parser.resolve(
+        "hackfest_multivdu-ns", "vnf1", "vnf-mgmt-ext"
+    )) == "mgmtVM: mgmtVM-eth0"
+    assert _format_vdu_interfaces(None) == "-"
+    assert _format_vdu_interfaces(
+        {"vdu_id": "dataVM", "int_cpd": "dataVM-int", "interfaces": []}
+    ) == "dataVM"
+
+
+def test_create_testing_descriptor_without_nsds(stub_manager, tmp_path):
+    result = runner.invoke(app, [
+        "create-testing-descriptor",
+        "--infer-tags-from-nsd", str(tmp_path)
+    ], input="n\n")
+
+    assert result.exit_code == 0, result.output
+    assert f"No NSDs found in '{tmp_path}'" in result.output
+    assert "No connection points could be inferred" in result.output
+
+
+def test_non_positive_durations_are_rejected():
+    for option in ["--connect-timeout", "--read-timeout", "--deadline",
+                   "--hedge-after"]:
+        result = runner.invoke(app, [option, "0", "list-testbeds"])
+
+        assert result.exit_code == 2
+        assert "must be positive" in result.output
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:16:32
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:16:32
+
+import json
+
+from DescriptorParser.connection_points_index import ConnectionPointsIndex
+from DescriptorParser.parser import ConnectionPointsParser
+
+DUPLICATED_CPS_NSD = """
+nsd:
+  nsd:
+  - id: ns1
+    df:
+    - vnf-profile:
+      - id: vnf1
+        virtual-link-connectivity:
+        - constituent-cpd-id:
+          - constituent-cpd-id: mgmt
+        - constituent-cpd-id:
+          - constituent-cpd-id: mgmt
+          - constituent-cpd-id: data
+    - vnf-profile:
+      - id: vnf1
+        virtual-link-connectivity:
+        - constituent-cpd-id:
+          - constituent-cpd-id: data
+      - id: 2
+        virtual-link-connectivity:
+        - constituent-cpd-id:
+          - constituent-cpd-id: mgmt
+"""
+
+
+def test_index():
+    index = ConnectionPointsIndex()
+    index.add("ns1", "vnf1", "mgmt")
+    index.add("ns1", "vnf1", "data")
+    index.add("ns1", "vnf1", "mgmt")
+    index.add("ns1", 2, "mgmt")
+
+    assert len(index) == 3
+    assert ("ns1", "vnf1", "data") in index
+    assert ("ns1", "2", "mgmt") in index
+    assert ("ns1", "vnf2", "mgmt") not in index
+    assert index.vnfs("ns1") == ["vnf1", "2"]
+    assert index.connection_points("ns1", "vnf1") == ["mgmt", "data"]
+    assert list(index.tags()) == [
+        "{{deployment_info|ns1|vnf1|mgmt}}",
+        "{{deployment_info|ns1|vnf1|data}}",
+        "{{deployment_info|ns1|2|mgmt}}"
+    ]
+    # The index is the same after being cached
+    assert ConnectionPointsIndex(
+        json.loads(json.dumps(index.to_dict()))
+    ) == index
+
+
+def test_parser_deduplicates_connection_points(tmp_path):
+    nsd_filepaths = []
+    for name in ("a_nsd.yaml", "b_nsd.yaml"):
+        nsd_filepath = tmp_path / name
+        nsd_filepath.write_text(DUPLICATED_CPS_NSD)
+        nsd_filepaths.append(str(nsd_filepath))
+
+    tags_parser = ConnectionPointsParser(nsd_filepaths)
+    expected = [
+        "{{deployment_info|ns1|vnf1|mgmt}}",
+        "{{deployment_info|ns1|vnf1|data}}",
+        "{{deployment_info|ns1|2|mgmt}}"
+    ]
+    for nsd_info in tags_parser.connection_points.values():
+        assert list(nsd_info["connection_points"].tags()) == expected
+    # Across all the descriptors, as well
+    assert list(tags_parser.tags()) == expected
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:58:12
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:58:12
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from TestingDescriptorGenerator import descriptor_builder
+from TestingDescriptorGenerator import descriptor_generator
+from helpers import yaml_io
+from helpers.base_testing_descriptor import BASE_TESTING_DESCRIPTOR, \
+    new_testing_descriptor
+from tests.test_generate import TESTS, answers
+
+TAG = "{{deployment_info|ns|vnf1|vnf-mgmt-ext}}"
+
+
+def build(netapp_id, n_testcases=1):
+    builder = descriptor_builder.TestingDescriptorBuilder(
+        netapp_id, f"{netapp_id}-ns", "testbed_itav"
+    )
+    for i in range(1, n_testcases + 1):
+        builder.add_testcase(
+            i, "predefined", "bandwidth", f"Test case {i}",
+            {"host1_ip": TAG, "comparator": "more_than"}
+        )
+    return builder.build()
+
+
+def test_build():
+    testing_descriptor = build("netapp", n_testcases=2)
+
+    assert testing_descriptor["test_info"] == {
+        "netapp_id": "netapp",
+        "network_service_id": "netapp-ns",
+        "testbed_id": "testbed_itav",
+        "description": "Testing Descriptor for the netapp Network Application"
+    }
+    assert testing_descriptor["test_phases"]["setup"]["testcases"][1] == {
+        "testcase_id": 2,
+        "type": "predefined",
+        "scope": "predefined",
+        "name": "bandwidth",
+        "description": "Test case 2",
+        "parameters": [
+            {"key": "host1_ip", "value": TAG},
+            {"key": "comparator", "value": "more_than"}
+        ]
+    }
+    # By default, in the order in which the test cases were added
+    assert testing_descriptor["test_phases"]["execution"][0]["executions"]\
+        [0]["testcase_ids"] == [1, 2]
+
+
+def test_template_is_read_only():
+    with pytest.raises(TypeError):
+        BASE_TESTING_DESCRIPTOR["test_info"]["netapp_id"] = "netapp"
+
+    testing_descriptor = new_testing_descriptor()
+    testing_descriptor["test_phases"]["setup"]["deployments"].append({})
+
+    assert new_testing_descriptor()["test_phases"]["setup"]\
+        ["deployments"] == []
+
+
+def test_descriptors_are_independent():
+    first = build("first", n_testcases=3)
+    second = build("second")
+
+    assert first["test_info"]["netapp_id"] == "first"
+    assert len(first["test_phases"]["setup"]["testcases"]) == 3
+    assert first["test_phases"]["execution"] is not \
+        second["test_phases"]["execution"]
+    assert first["test_phases"]["execution"][0]["executions"][0]\
+        ["testcase_ids"] == [1, 2, 3]
+
+
+def test_generators_do_not_leak_state():
+    generators = [
+        descriptor_generator.TestingDescriptorGenerator.from_answers(
+            answers(
+                [{"test": "open_ports", "parameters": {}}] * n_test_cases,
+                execution_order=list(range(n_test_cases, 0, -1))
+            ),
+            TESTS["testbed_itav"],
+            "testing-descriptor.yaml"
+        )
+        for n_test_cases
+        in [3, 1]
+    ]
+
+    first = generators[0].build_testing_descriptor()
+    first_yaml = generators[0].render_testing_descriptor()
+    second = generators[1].build_testing_descriptor()
+
+    # Building the second descriptor does not change the first one
+    assert first is not second
+    assert yaml_io.dump(first) == first_yaml
+    assert first["test_phases"]["execution"][0]["executions"][0]\
+        ["testcase_ids"] == [3, 2, 1]
+
+
+def test_concurrent_builds():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        testing_descriptors = list(executor.map(
+            lambda i: build(f"netapp_{i}", n_testcases=i % 5 + 1),
+            range(200)
+        ))
+
+    for i, testing_descriptor in enumerate(testing_descriptors):
+        assert testing_descriptor["test_info"]["netapp_id"] == f"netapp_{i}"
+        assert len(testing_descriptor["test_phases"]["setup"]
+                   ["testcases"]) == i % 5 + 1
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 22:41:19
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 22:41:19
+
+import shutil
+import threading
+import time
+
+import pytest
+
+from CICDManagerAPIClient import test_classes
+from DescriptorParser import parser
+from TestingDescriptorGenerator.descriptor_watcher import DescriptorWatcher
+from helpers import yaml_io
+from tests.conftest import STUB_TESTS
+
+NSD_FILEPATH = "tests/resources/hackfest_multivdu_nsd.yaml"
+
+ANSWERS = """
+netapp_name: hackfest
+ns_name: hackfest_multivdu-ns
+testbed_id: testbed_itav
+test_cases:
+  - test: bandwidth
+    description: Bandwidth between both VNFs
+    parameters:
+      host1_ip: >-
+        {{deployment_info|hackfest_multivdu-ns|vnf1|vnf-mgmt-ext|ip-address}}
+      comparator: more_than
+  - test: open_ports
+    description: Open ports of the VNFs
+execution_order: [2, 1]
+"""
+
+
+def get_tests(testbed_id):
+    return test_classes.Test.from_testbed_payload(STUB_TESTS[testbed_id])
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    nsds_dir = tmp_path / "nsds"
+    nsds_dir.mkdir()
+    shutil.copy(NSD_FILEPATH, nsds_dir / "a_nsd.yaml")
+    shutil.copy(NSD_FILEPATH, nsds_dir / "b_nsd.yaml")
+    (tmp_path / "answers.yaml").write_text(ANSWERS)
+    return tmp_path
+
+
+@pytest.fixture
+def watcher(workspace):
+    watcher = DescriptorWatcher(
+        nsd_locations=[str(workspace / "nsds")],
+        answers_filepath=str(workspace / "answers.yaml"),
+        output_filepath=str(workspace / "testing-descriptor.yaml"),
+        get_tests=get_tests,
+        debounce=0.05
+    )
+    assert watcher.start()
+    return watcher
+
+
+def load_output(workspace):
+    with open(workspace / "testing-descriptor.yaml") as output_file:
+        return yaml_io.load(output_file)
+
+
+def test_start(watcher, workspace):
+    testing_descriptor = load_output(workspace)
+
+    assert testing_descriptor["test_info"]["netapp_id"] == "hackfest"
+    testcases = testing_descriptor["test_phases"]["setup"]["testcases"]
+    assert [tc["name"] for tc in testcases] == ["bandwidth", "open_ports"]
+    assert testcases[0]["parameters"][1] == \
+        {"key": "comparator", "value": "more_than"}
+    assert testing_descriptor["test_phases"]["execution"][0]["executions"]\
+        [0]["testcase_ids"] == [2, 1]
+
+
+def test_only_changed_nsds_are_parsed(watcher, workspace, monkeypatch,
+                                      capsys):
+    parsed = []
+    extract = parser._try_extract_connection_points
+
+    def tracked_extract(nsd_filepath, content=None):
+        parsed.append(nsd_filepath)
+        return extract(nsd_filepath, content)
+
+    monkeypatch.setattr(parser, "_try_extract_connection_points",
+                        tracked_extract)
+    nsd_filepath = workspace / "nsds" / "a_nsd.yaml"
+    nsd_filepath.write_text(
+        nsd_filepath.read_text().replace("vnf1", "vnf3")
+    )
+
+    # The NSDs are not part of the descriptor, which is not rewritten
+    assert not watcher.handle_changes({str(nsd_filepath)})
+    assert parsed == [str(nsd_filepath)]
+    assert ("hackfest_multivdu-ns", "vnf3", "vnf-mgmt-ext") in \
+        watcher.tags_parser.index
+
+    # Once the connection point is in no NSD, its tags are reported
+    (workspace / "nsds" / "b_nsd.yaml").unlink()
+    capsys.readouterr()
+    watcher.handle_changes({str(workspace / "nsds" / "b_nsd.yaml")})
+    assert "unknown connection point" in capsys.readouterr().out
+    assert parsed == [str(nsd_filepath)]
+
+
+def test_glob_locations_match_as_in_discovery(workspace):
+    (workspace / "nsds" / "nested").mkdir()
+    watcher = DescriptorWatcher(
+        nsd_locations=[str(workspace / "nsds" / "*.yaml")],
+        answers_filepath=str(workspace / "answers.yaml"),
+        output_filepath=str(workspace / "testing-descriptor.yaml"),
+        get_tests=get_tests
+    )
+
+    nsd_filepath = str(workspace / "nsds" / "a_nsd.yaml")
+    assert watcher._nsd_location(nsd_filepath) == nsd_filepath
+    # Neither files in subdirectories, nor files not named as descriptors
+    for filepath in ["nested/c_nsd.yaml", "answers.yaml", "notes.yaml"]:
+        assert watcher._nsd_location(
+            str(workspace / "nsds" / filepath)
+        ) is None
+
+
+def test_answers_changes(watcher, workspace, capsys):
+    answers_filepath = workspace / "answers.yaml"
+    answers_filepath.write_text(ANSWERS.replace("more_than", "less_than"))
+    assert watcher.handle_changes({str(answers_filepath)})
+    testcases = load_output(workspace)["test_phases"]["setup"]["testcases"]
+    assert testcases[0]["parameters"][1]["value"] == "less_than"
+
+    # The last valid answers are kept
+    answers_filepath.write_text(ANSWERS.replace("bandwidth", "latency"))
+    assert not watcher.handle_changes({str(answers_filepath)})
+    assert "test 'latency' does not exist" in capsys.readouterr().out
+    assert watcher.regenerations == 2
+
+
+@pytest.mark.parametrize("polling", [False, True])
+def test_run(watcher, workspace, polling):
+    watcher.polling = polling
+    answers_filepath = workspace / "answers.yaml"
+
+    def edit():
+        time.sleep(0.2)
+        # Written twice in a row, which is debounced
+        answers_filepath.write_text(ANSWERS.replace("hackfest\n", "v1\n"))
+        answers_filepath.write_text(ANSWERS.replace("hackfest\n", "v2\n"))
+
+    editor = threading.Thread(target=edit)
+    editor.start()
+    watcher.run(timeout=3, max_updates=1)
+    editor.join()
+
+    assert load_output(workspace)["test_info"]["netapp_id"] == "v2"
+    assert watcher.regenerations == 2
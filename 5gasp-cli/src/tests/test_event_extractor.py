@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 21:24:50
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 21:24:50
+
+import pytest
+import yaml
+
+from DescriptorParser import parser
+from DescriptorParser.event_extractor import UnsupportedDocument, \
+    extract_connection_points_from_events
+from benchmarks.synthetic_nsd import synthetic_nsd
+from helpers import yaml_io
+
+NSD_FILEPATH = "tests/resources/hackfest_multivdu_nsd.yaml"
+
+TYPED_IDS_NSD = """
+nsd:
+  nsd:
+  - df:
+    - vnf-profile:
+      - id: 1
+        virtual-link-connectivity:
+        - constituent-cpd-id:
+          - constituent-cpd-id: 1.50
+          - constituent-cpd-id: yes
+          - constituent-cpd-id: !!str 2
+          - constituent-cpd-id: 2026-10-18
+    id: 0x1f
+"""
+
+ANCHORED_NSD = """
+nsd:
+  nsd:
+  - id: ns1
+    df:
+    - vnf-profile: &profiles
+      - id: vnf1
+        virtual-link-connectivity:
+        - constituent-cpd-id:
+          - constituent-cpd-id: cp1
+  - id: ns2
+    df:
+    - vnf-profile: *profiles
+"""
+
+
+def extract_from_tree(nsd_filepath):
+    try:
+        return parser._extract_connection_points_from_tree(nsd_filepath)
+    except Exception as e:
+        return repr(e)
+
+
+def extract(nsd_filepath):
+    try:
+        return parser.extract_connection_points(nsd_filepath)
+    except Exception as e:
+        return repr(e)
+
+
+@pytest.mark.parametrize("nsd", [
+    open(NSD_FILEPATH).read(),
+    yaml.safe_dump(synthetic_nsd("synthetic-ns", 5, 3, 10)),
+    TYPED_IDS_NSD,
+    # The ID after the values that use it, and a duplicated key
+    "nsd:\n  nsd:\n  - df: []\n    id: ns1\n    id: ns2\n",
+])
+def test_events_match_tree(nsd, tmp_path):
+    nsd_filepath = tmp_path / "nsd.yaml"
+    nsd_filepath.write_text(nsd)
+
+    nsd_info = extract_connection_points_from_events(yaml_io.parse(nsd))
+    assert nsd_info == extract_from_tree(nsd_filepath)
+    assert parser.extract_connection_points(nsd_filepath) == nsd_info
+
+
+def test_anchored_documents_are_loaded_as_a_whole(tmp_path):
+    with pytest.raises(UnsupportedDocument):
+        extract_connection_points_from_events(yaml_io.parse(ANCHORED_NSD))
+
+    nsd_filepath = tmp_path / "nsd.yaml"
+    nsd_filepath.write_text(ANCHORED_NSD)
+    nsd_info = parser.extract_connection_points(nsd_filepath)
+    assert nsd_info == extract_from_tree(nsd_filepath)
+    assert nsd_info["connection_points"] == {
+        "ns1": {"vnf1": ["cp1"]},
+        "ns2": {"vnf1": ["cp1"]}
+    }
+
+
+@pytest.mark.parametrize("nsd", [
+    "",
+    "nsd:\n  nsd:\n  - df: []\n",
+    "nsd:\n  nsd: []\n",
+    "nsd:\n  nsd:\n  - id: ns1\n    df: [1]\n",
+    "nsd: {nsd: []}\n---\nnsd: {nsd: []}\n",
+    "nsd: [unclosed",
+])
+def test_invalid_descriptors_raise_the_same_errors(nsd, tmp_path):
+    nsd_filepath = tmp_path / "nsd.yaml"
+    nsd_filepath.write_text(nsd)
+    error = extract(nsd_filepath)
+    assert isinstance(error, str)
+    # Marks are compared by identity
+    assert error.split(" <")[0] == extract_from_tree(nsd_filepath).split(
+        " <"
+    )[0]
@@ -0,0 +1,289 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 23:32:10
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 23:32:10
+
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from main import app
+from CICDManagerAPIClient import test_classes
+from TestingDescriptorGenerator.answers import AnswersError
+from TestingDescriptorGenerator import batch_generator, descriptor_generator
+from helpers import beatiful_prints
+from helpers import constants as Constants
+from helpers import yaml_io
+from tests.conftest import STUB_TESTS
+from tests.test_descriptor_watcher import ANSWERS
+
+runner = CliRunner()
+
+from_answers = descriptor_generator.TestingDescriptorGenerator.from_answers
+
+NSD_FILEPATH = "tests/resources/hackfest_multivdu_nsd.yaml"
+
+ALL_TESTS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+
+TESTS = {
+    testbed_id: test_classes.Test.from_testbed_payload(tests)
+    for testbed_id, tests
+    in STUB_TESTS.items()
+}
+
+
+def answers(test_cases, execution_order=None, testbed_id="testbed_itav"):
+    answers = {
+        "netapp_name": "hackfest",
+        "ns_name": "hackfest_multivdu-ns",
+        "testbed_id": testbed_id,
+        "test_cases": test_cases
+    }
+    if execution_order is not None:
+        answers["execution_order"] = execution_order
+    return answers
+
+
+def errors_of(answers):
+    with pytest.raises(AnswersError) as e:
+        from_answers(
+            answers,
+            TESTS[answers["testbed_id"]],
+            "testing-descriptor.yaml"
+        )
+    return e.value.errors
+
+
+def test_valid_answers():
+    generator = from_answers(
+        answers(
+            [{"test": "packet_loss", "parameters": {"threshold": 1}}],
+            testbed_id="testbed_ote"
+        ),
+        TESTS["testbed_ote"],
+        "testing-descriptor.yaml"
+    )
+
+    # Integers are valid floats
+    assert generator.test_cases[0].test_variables == {"threshold": 1}
+    assert generator.tests_cases_ids_ordered_by_user == [1]
+
+
+def test_invalid_parameters():
+    errors = errors_of(answers([
+        {
+            "test": "bandwidth",
+            "parameters": {"comparator": "equal", "port": 80}
+        },
+        {"test": "open_ports", "parameters": {}}
+    ]))
+
+    assert errors == [
+        "test_cases[0]: parameter 'comparator' must be one of " +
+        "['more_than', 'less_than'], not 'equal'",
+        "test_cases[0]: unknown parameter 'port' (test 'bandwidth' " +
+        "takes: host1_ip, comparator)",
+        "test_cases[0]: missing mandatory parameter 'host1_ip'",
+    ]
+
+
+def test_invalid_types():
+    errors = errors_of(answers(
+        [
+            {"test": "packet_loss", "parameters": {"threshold": "high"}},
+            {"test": "packet_loss", "parameters": {"threshold": True}}
+        ],
+        testbed_id="testbed_ote"
+    ))
+
+    assert errors == [
+        "test_cases[0]: parameter 'threshold' must be of type float, not " +
+        "'high'",
+        "test_cases[1]: parameter 'threshold' must be of type float, not " +
+        "True",
+    ]
+
+
+def test_invalid_execution_order():
+    errors = errors_of(answers(
+        [
+            {"test": "ping"},
+            {"test": "open_ports", "parameters": {}},
+            {"test": "open_ports", "parameters": {}}
+        ],
+        execution_order=[2, 2, 4]
+    ))
+
+    # Test case IDs are positions, even after an unknown test
+    assert errors == [
+        "test_cases[0]: test 'ping' does not exist in testbed " +
+        "'testbed_itav'",
+        "execution_order: test case 4 does not exist",
+        "execution_order: test cases must appear once",
+        "execution_order: missing test cases [1, 3]",
+    ]
+
+
+def _invoke(stub_manager, tmp_path, *args):
+    answers_filepath = tmp_path / "answers.yaml"
+    if not answers_filepath.exists():
+        answers_filepath.write_text(ANSWERS)
+    return runner.invoke(
+        app,
+        ["--no-cache", "--ci-cd-manager-url", stub_manager.url, "generate",
+         "--answers", str(answers_filepath),
+         "--output-filepath", str(tmp_path / "testing-descriptor.yaml"),
+         *args]
+    )
+
+
+def test_redraws_reuse_the_panel_columns(monkeypatch, capsys):
+    built = []
+    columns = beatiful_prints.Columns
+    monkeypatch.setattr(
+        beatiful_prints, "Columns",
+        lambda renderables: built.append(renderables) or columns(renderables)
+    )
+    generator = from_answers(
+        answers([{"test": "open_ports", "parameters": {}}] * 2),
+        TESTS["testbed_itav"],
+        "testing-descriptor.yaml"
+    )
+
+    generator._show_test_cases()
+    generator._show_test_cases()
+    assert len(built) == 1
+
+    # Built again once the test cases change
+    generator.test_cases[0].add_test_variable("ports", "22")
+    generator._show_test_cases()
+    del generator.test_cases[1]
+    generator._show_test_cases()
+    generator._show_test_cases()
+    assert [len(renderables) for renderables in built] == [2, 2, 1]
+    assert "22" in capsys.readouterr().out
+
+
+def test_generate(stub_manager, tmp_path):
+    result = _invoke(stub_manager, tmp_path,
+                     "--infer-tags-from-nsd", NSD_FILEPATH)
+
+    assert result.exit_code == 0
+    assert "Warning" not in result.stdout
+    with open(tmp_path / "testing-descriptor.yaml") as output_file:
+        testing_descriptor = yaml_io.load(output_file)
+    testcases = testing_descriptor["test_phases"]["setup"]["testcases"]
+    assert [tc["name"] for tc in testcases] == ["bandwidth", "open_ports"]
+    assert testing_descriptor["test_phases"]["execution"][0]["executions"]\
+        [0]["testcase_ids"] == [2, 1]
+
+
+def test_generate_with_invalid_answers(stub_manager, tmp_path):
+    (tmp_path / "answers.yaml").write_text(
+        ANSWERS.replace("more_than", "equal")
+    )
+
+    result = _invoke(stub_manager, tmp_path)
+
+    assert result.exit_code == 1
+    assert "parameter 'comparator' must be one of" in result.stdout
+    assert not (tmp_path / "testing-descriptor.yaml").exists()
+
+
+def test_generate_for_unknown_testbed(stub_manager, tmp_path):
+    (tmp_path / "answers.yaml").write_text(
+        ANSWERS.replace("testbed_itav", "testbed_unknown")
+    )
+
+    result = _invoke(stub_manager, tmp_path)
+
+    assert result.exit_code == 1
+    assert "testbed 'testbed_unknown' does not exist" in result.stdout
+
+
+@pytest.fixture
+def answers_directory(tmp_path):
+    answers_directory = tmp_path / "answers"
+    answers_directory.mkdir()
+    for netapp in ["a", "b", "c"]:
+        (answers_directory / f"{netapp}.yaml").write_text(
+            ANSWERS.replace("hackfest", f"netapp_{netapp}")
+        )
+    (answers_directory / "invalid.yml").write_text(
+        ANSWERS.replace("bandwidth", "ping")
+    )
+    (answers_directory / "README.md").write_text("Not an answers file")
+    return answers_directory
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_many(answers_directory, tmp_path, workers):
+    output_directory = tmp_path / "output"
+
+    results = batch_generator.generate_many(
+        batch_generator.find_answers_files(str(answers_directory)),
+        str(output_directory),
+        TESTS,
+        workers=workers
+    )
+
+    assert [os.path.basename(r["answers_filepath"]) for r in results] == \
+        ["a.yaml", "b.yaml", "c.yaml", "invalid.yml"]
+    assert results[3]["errors"] == [
+        "test_cases[0]: test 'ping' does not exist in testbed " +
+        "'testbed_itav'"
+    ]
+    assert sorted(os.listdir(output_directory)) == \
+        ["a.yaml", "b.yaml", "c.yaml"]
+    for netapp, result in zip(["a", "b", "c"], results):
+        assert not result["errors"] and result["seconds"] > 0
+        with open(result["output_filepath"]) as output_file:
+            testing_descriptor = yaml_io.load(output_file)
+        assert testing_descriptor["test_info"]["netapp_id"] == \
+            f"netapp_{netapp}"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_many_with_unexpected_errors(answers_directory, tmp_path,
+                                              monkeypatch, workers):
+    load_answers = batch_generator.load_answers
+
+    def malformed_b(answers_filepath):
+        answers = load_answers(answers_filepath)
+        if answers_filepath.endswith("b.yaml"):
+            del answers["test_cases"][0]["parameters"]
+        return answers
+
+    # Worker processes are forked, so they load the answers the same way
+    monkeypatch.setattr(batch_generator, "load_answers", malformed_b)
+
+    results = batch_generator.generate_many(
+        batch_generator.find_answers_files(str(answers_directory)),
+        str(tmp_path / "output"),
+        TESTS,
+        workers=workers
+    )
+
+    assert results[1]["errors"] == ["KeyError: 'parameters'"]
+    # The other descriptors are still generated
+    assert not results[0]["errors"] and not results[2]["errors"]
+    assert sorted(os.listdir(tmp_path / "output")) == ["a.yaml", "c.yaml"]
+
+
+def test_generate_many_command(stub_manager, answers_directory, tmp_path):
+    result = runner.invoke(
+        app,
+        ["--no-cache", "--ci-cd-manager-url", stub_manager.url,
+         "generate-many", str(answers_directory),
+         "--output-directory", str(tmp_path / "output"),
+         "--workers", "2"],
+        terminal_width=200
+    )
+
+    assert result.exit_code == 1
+    assert "Generated 3 of 4 testing descriptors" in result.stdout
+    assert "'ping'" in result.stdout
+    # The catalog is only downloaded once
+    assert stub_manager.hits[ALL_TESTS] == 1
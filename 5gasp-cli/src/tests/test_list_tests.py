@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 16:24:39
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 16:24:39
+
+from typer.testing import CliRunner
+
+from main import app
+from helpers import constants as Constants
+
+runner = CliRunner()
+
+ALL_TESTS = Constants.CI_CD_SERVICE_URL_ENDPOINTS.ALL_TESTS.value
+
+
+def _invoke(stub_manager, *args):
+    return runner.invoke(
+        app,
+        ["--no-cache", "--ci-cd-manager-url", stub_manager.url,
+         "list-tests", *args],
+        terminal_width=200
+    )
+
+
+def test_list_tests_of_all_testbeds(stub_manager):
+    result = _invoke(stub_manager, "--all")
+
+    assert result.exit_code == 0
+    for test_id in ["bandwidth", "open_ports", "packet_loss"]:
+        assert test_id in result.stdout
+    assert "Tests availability across testbeds" in result.stdout
+    # All testbeds are served from a single catalog download
+    assert stub_manager.hits[ALL_TESTS] == 1
+
+
+def test_list_tests_of_some_testbeds(stub_manager):
+    result = _invoke(stub_manager, "--testbed", "testbed_ote", "--no-matrix")
+
+    assert result.exit_code == 0
+    assert "packet_loss" in result.stdout
+    assert "bandwidth" not in result.stdout
+    assert "Tests availability across testbeds" not in result.stdout
+
+
+def test_list_tests_of_unknown_testbed(stub_manager):
+    result = _invoke(stub_manager, "--testbed", "testbed_unknown")
+
+    assert result.exit_code == 1
+    assert "testbed_unknown" in result.stdout
+
+
+def test_list_tests_requires_testbeds(stub_manager):
+    assert _invoke(stub_manager).exit_code == 1
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 21:51:07
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 21:51:07
+
+import shutil
+import tarfile
+
+import pytest
+
+from DescriptorParser import parser
+from DescriptorParser.connection_points_cache import ConnectionPointsCache
+from DescriptorParser.nsd_discovery import NSDSource, discover_nsds, \
+    location_filepath
+from DescriptorParser.parser import ConnectionPointsParser
+
+NSD_FILEPATH = "tests/resources/hackfest_multivdu_nsd.yaml"
+
+
+@pytest.fixture
+def nsd_tree(tmp_path):
+    # nsds/
+    #   a_nsd.yaml
+    #   other.yaml (not an NSD)
+    #   nested/b_nsd.yml
+    #   hackfest_ns.tar.gz (hackfest_ns/hackfest_nsd.yaml, README)
+    root = tmp_path / "nsds"
+    (root / "nested").mkdir(parents=True)
+    shutil.copy(NSD_FILEPATH, root / "a_nsd.yaml")
+    shutil.copy(NSD_FILEPATH, root / "nested" / "b_nsd.yml")
+    (root / "other.yaml").write_text("not: an nsd\n")
+
+    package_dir = tmp_path / "hackfest_ns"
+    package_dir.mkdir()
+    shutil.copy(NSD_FILEPATH, package_dir / "hackfest_nsd.yaml")
+    (package_dir / "README").write_text("Hackfest NS\n")
+    with tarfile.open(root / "hackfest_ns.tar.gz", "w:gz") as package:
+        package.add(package_dir, arcname="hackfest_ns")
+    return root
+
+
+def test_discover_directory(nsd_tree):
+    sources = list(discover_nsds([str(nsd_tree)]))
+
+    assert [source.nsd_filepath for source in sources] == [
+        str(nsd_tree / "a_nsd.yaml"),
+        str(nsd_tree / "hackfest_ns.tar.gz") +
+        ":hackfest_ns/hackfest_nsd.yaml",
+        str(nsd_tree / "nested" / "b_nsd.yml")
+    ]
+    # Only the packaged NSD carries its content
+    with open(NSD_FILEPATH, "rb") as nsd_file:
+        assert sources[1].content == nsd_file.read()
+    assert sources[0].content is None and sources[2].content is None
+
+
+def test_discover_glob_and_explicit_files(nsd_tree):
+    other_filepath = str(nsd_tree / "other.yaml")
+    sources = list(discover_nsds([
+        str(nsd_tree / "**" / "*.yml"),
+        other_filepath,
+        str(nsd_tree / "*.json")
+    ]))
+
+    assert [source.nsd_filepath for source in sources] == [
+        str(nsd_tree / "nested" / "b_nsd.yml"),
+        other_filepath,
+        str(nsd_tree / "*.json")
+    ]
+    assert sources[1].error is None
+    assert isinstance(sources[2].error, FileNotFoundError)
+
+
+def test_parse_discovered_nsds(nsd_tree, capsys):
+    broken_package = nsd_tree / "broken.tar.gz"
+    broken_package.write_bytes(b"not a package")
+
+    serial = ConnectionPointsParser([str(nsd_tree)])
+    serial_output = capsys.readouterr().out
+    parallel = ConnectionPointsParser([str(nsd_tree)], workers=2)
+    parallel_output = capsys.readouterr().out
+
+    assert len(serial.connection_points) == 3
+    assert parallel.connection_points == serial.connection_points
+    expected = ConnectionPointsParser([NSD_FILEPATH]).connection_points
+    for nsd_info in serial.connection_points.values():
+        assert nsd_info == expected[NSD_FILEPATH]
+    assert "broken.tar.gz" in serial_output
+    assert parallel_output == serial_output
+
+
+def test_packaged_nsds_are_cached(nsd_tree, tmp_path):
+    package_filepath = str(nsd_tree / "hackfest_ns.tar.gz")
+    cache_dir = str(tmp_path / "cache")
+    parsed = ConnectionPointsParser(
+        [package_filepath],
+        cache=ConnectionPointsCache(cache_dir)
+    )
+
+    cache = ConnectionPointsCache(cache_dir)
+    cached = ConnectionPointsParser([package_filepath], cache=cache)
+    assert cache.hits == 1 and cache.misses == 0
+    assert cached.connection_points == parsed.connection_points
+
+
+def test_parsing_starts_during_discovery(monkeypatch):
+    parsed = []
+
+    def discover(locations):
+        for location in locations:
+            yield NSDSource(location)
+            # The previous NSD was parsed before the next one is found
+            assert parsed[-1] == location
+
+    def extract(nsd_filepath, content=None):
+        parsed.append(nsd_filepath)
+        return {"ns_id": "ns", "connection_points": []}, None
+
+    monkeypatch.setattr(parser, "discover_nsds", discover)
+    monkeypatch.setattr(parser, "_try_extract_connection_points", extract)
+    tags_parser = ConnectionPointsParser(["a_nsd.yaml", "b_nsd.yaml"])
+    assert list(tags_parser.connection_points) == ["a_nsd.yaml",
+                                                   "b_nsd.yaml"]
+
+
+def test_duplicated_nsds_are_parsed_once(nsd_tree):
+    nsd_filepath = str(nsd_tree / "a_nsd.yaml")
+    tags_parser = ConnectionPointsParser(
+        [nsd_filepath, str(nsd_tree / "*_nsd.yaml"), nsd_filepath]
+    )
+    assert tags_parser.base_nsd_filepaths == [nsd_filepath]
+
+
+def test_locations_without_nsds_are_reported(nsd_tree, tmp_path, capsys):
+    empty_dir = tmp_path / "empty"
+    empty_dir.mkdir()
+    vnfds_package = tmp_path / "vnfds.tar.gz"
+    with tarfile.open(vnfds_package, "w:gz") as package:
+        package.add(nsd_tree / "other.yaml", arcname="vnfds/other.yaml")
+    locations = [str(empty_dir), str(vnfds_package),
+                 str(nsd_tree / "*.yaml"), str(nsd_tree)]
+
+    sources = list(discover_nsds(locations))
+
+    assert [source.nsd_filepath for source in sources[:2]] == locations[:2]
+    assert all(isinstance(source.error, FileNotFoundError)
+               for source in sources[:2])
+    # Locations with NSDs are not reported
+    assert all(source.error is None for source in sources[2:])
+
+    tags_parser = ConnectionPointsParser(locations[:2])
+    assert tags_parser.connection_points == {}
+    assert [error[0] for error in tags_parser.errors] == locations[:2]
+    assert "No NSDs found in" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("pattern", ["*", "*.yaml", "*/*", "**", "**/*.yml",
+                                     "**/*_nsd.*", "n*/*", ".*/*",
+                                     "nested/*", "*/b_*"])
+def test_location_filepaths_match_discovery(nsd_tree, pattern, monkeypatch):
+    (nsd_tree / "nested" / "c_vnfd.yaml").write_text("vnfd: {}\n")
+    (nsd_tree / ".hidden").mkdir()
+    shutil.copy(NSD_FILEPATH, nsd_tree / ".hidden" / "d_nsd.yaml")
+    monkeypatch.chdir(nsd_tree)
+    filepaths = [
+        str(filepath)
+        for filepath
+        in nsd_tree.rglob("*")
+        if filepath.is_file()
+    ]
+
+    for location in [pattern, str(nsd_tree / pattern)]:
+        discovered = {
+            # Packaged descriptors are found through their package
+            source.nsd_filepath.split(":")[0]
+            for source
+            in discover_nsds([location])
+            if source.error is None
+        }
+        located = {
+            location_filepath(location, filepath)
+            for filepath
+            in filepaths
+        } - {None}
+
+        assert located == discovered, location
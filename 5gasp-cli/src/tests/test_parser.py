@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 20:06:17
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 20:06:17
+
+import os
+import shutil
+
+import pytest
+
+from DescriptorParser import parser
+from DescriptorParser.connection_points_cache import ConnectionPointsCache
+from DescriptorParser.parser import ConnectionPointsParser
+
+NSD_FILEPATH = "tests/resources/hackfest_multivdu_nsd.yaml"
+VNFD_FILEPATH = "tests/resources/hackfest_multivdu_vnfd.yaml"
+
+
+@pytest.fixture
+def nsd_filepaths(tmp_path):
+    filepaths = []
+    for i in range(4):
+        filepath = str(tmp_path / f"nsd_{i}.yaml")
+        shutil.copy(NSD_FILEPATH, filepath)
+        filepaths.append(filepath)
+
+    broken_filepath = str(tmp_path / "broken_nsd.yaml")
+    with open(broken_filepath, "w") as broken_file:
+        broken_file.write("nsd: [unclosed")
+    filepaths.insert(2, broken_filepath)
+    filepaths.insert(3, str(tmp_path / "missing_nsd.yaml"))
+    return filepaths
+
+
+def test_parser():
+    tags_parser = ConnectionPointsParser([NSD_FILEPATH])
+
+    nsd_info = tags_parser.connection_points[NSD_FILEPATH]
+    assert nsd_info["ns_id"] == "hackfest_multivdu-ns"
+    assert next(nsd_info["connection_points"].tags()) == \
+        "{{deployment_info|hackfest_multivdu-ns|vnf1|vnf-mgmt-ext}}"
+    assert ("hackfest_multivdu-ns", "vnf2", "vnf-data-ext") in \
+        tags_parser.index
+
+
+def test_parallel_parser_matches_serial_parser(nsd_filepaths, capsys):
+    serial = ConnectionPointsParser(nsd_filepaths)
+    serial_output = capsys.readouterr().out
+    parallel = ConnectionPointsParser(nsd_filepaths, workers=3)
+    parallel_output = capsys.readouterr().out
+
+    assert parallel.connection_points == serial.connection_points
+    # Only the valid NSDs, in the given order
+    assert list(parallel.connection_points) == \
+        nsd_filepaths[:2] + nsd_filepaths[4:]
+    # The errors are reported in the same way, and in the same order
+    assert parallel_output == serial_output
+    assert serial_output.index("broken_nsd.yaml") < \
+        serial_output.index("missing_nsd.yaml")
+
+
+def test_cached_connection_points(nsd_filepaths, tmp_path, monkeypatch):
+    cache = ConnectionPointsCache(cache_dir=str(tmp_path / "cache"))
+    parsed = ConnectionPointsParser(nsd_filepaths, cache=cache)
+    # The broken descriptor is never cached
+    assert cache.misses == 5 and cache.hits == 0
+
+    # Unchanged descriptors are not parsed again
+    def load(*args, **kwargs):
+        raise AssertionError("Parsed an unchanged descriptor")
+
+    monkeypatch.setattr(parser.yaml_io, "load", load)
+    monkeypatch.setattr(parser.yaml_io, "parse", load)
+    cache = ConnectionPointsCache(cache_dir=str(tmp_path / "cache"))
+    cached = ConnectionPointsParser(nsd_filepaths, cache=cache)
+    assert cached.cache_hits == 4
+    assert cached.connection_points == parsed.connection_points
+
+
+def test_changed_descriptors_are_parsed_again(nsd_filepaths, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    ConnectionPointsParser(
+        nsd_filepaths,
+        cache=ConnectionPointsCache(cache_dir)
+    )
+
+    # Same size and modification time, but a different NS ID
+    nsd_filepath = nsd_filepaths[0]
+    stat = os.stat(nsd_filepath)
+    with open(nsd_filepath, "r") as nsd_file:
+        nsd = nsd_file.read()
+    with open(nsd_filepath, "w") as nsd_file:
+        nsd_file.write(
+            nsd.replace("hackfest_multivdu-ns", "hackfest_multivdu-xx")
+        )
+    os.utime(nsd_filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    cache = ConnectionPointsCache(cache_dir)
+    tags_parser = ConnectionPointsParser(nsd_filepaths, cache=cache)
+    assert cache.misses == 2 and cache.hits == 3
+    assert tags_parser.connection_points[nsd_filepath]["ns_id"] == \
+        "hackfest_multivdu-xx"
+
+
+def test_unmodified_descriptors_are_not_read(nsd_filepaths, tmp_path):
+    # Descriptors modified long before being indexed are trusted by their
+    # modification time and size
+    for nsd_filepath in nsd_filepaths[:2]:
+        os.utime(nsd_filepath, (0, 0))
+    cache_dir = str(tmp_path / "cache")
+    ConnectionPointsParser(
+        nsd_filepaths,
+        cache=ConnectionPointsCache(cache_dir)
+    )
+
+    cache = ConnectionPointsCache(cache_dir)
+    assert cache.lookup(nsd_filepaths[0]).content is None
+    assert cache.lookup(nsd_filepaths[-1]).content is not None
+    assert cache.hits == 2
+
+
+def test_resolve_connection_points_with_vnfds(tmp_path, capsys):
+    # The VNFD is parsed in the same pass as the NSD, by the same workers
+    shutil.copy(NSD_FILEPATH, tmp_path / "hackfest_nsd.yaml")
+    shutil.copy(VNFD_FILEPATH, tmp_path / "hackfest_vnfd.yaml")
+    serial = ConnectionPointsParser([str(tmp_path)])
+    parallel = ConnectionPointsParser([str(tmp_path)], workers=2)
+    assert capsys.readouterr().out == ""
+
+    for tags_parser in (serial, parallel):
+        assert list(tags_parser.connection_points) == \
+            [str(tmp_path / "hackfest_nsd.yaml")]
+        assert tags_parser.resolve(
+            "hackfest_multivdu-ns", "vnf2", "vnf-data-ext"
+        ) == {
+            "vnfd_id": "hackfest_multivdu-vnf",
+            "vdu_id": "dataVM",
+            "int_cpd": "dataVM-xe0-int",
+            "interfaces": ["dataVM-xe0"]
+        }
+        resolved = dict(tags_parser.resolved_connection_points())
+        assert len(resolved) == 4
+        assert all(resolved.values())
+
+    # Without the VNFD, the connection points are not resolved
+    tags_parser = ConnectionPointsParser([NSD_FILEPATH])
+    assert tags_parser.resolve(
+        "hackfest_multivdu-ns", "vnf2", "vnf-data-ext"
+    ) is None
+
+
+def test_vnfds_are_cached(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    parsed = ConnectionPointsParser(
+        [NSD_FILEPATH, VNFD_FILEPATH],
+        cache=ConnectionPointsCache(cache_dir)
+    )
+
+    cache = ConnectionPointsCache(cache_dir)
+    cached = ConnectionPointsParser([NSD_FILEPATH, VNFD_FILEPATH],
+                                    cache=cache)
+    assert cache.hits == 2
+    assert cached.vnfds == parsed.vnfds
+    assert cached.vnfd_ids == parsed.vnfd_ids
+
+
+def test_cached_vnfds_are_not_served_as_nsds(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    ConnectionPointsParser([VNFD_FILEPATH],
+                           cache=ConnectionPointsCache(cache_dir))
+    # The same content, but named, and so parsed, as an NSD
+    nsd_filepath = tmp_path / "hackfest_multivdu_nsd.yaml"
+    shutil.copy(VNFD_FILEPATH, nsd_filepath)
+
+    cache = ConnectionPointsCache(cache_dir)
+    tags_parser = ConnectionPointsParser([str(nsd_filepath)], cache=cache,
+                                         report_errors=False)
+
+    assert cache.hits == 0
+    assert [error[0] for error in tags_parser.errors] == [str(nsd_filepath)]
+    assert tags_parser.connection_points == {}
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 18:14:51
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 18:14:51
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from CICDManagerAPIClient import test_classes
+from helpers.beatiful_prints import PrintAsPanelColumns
+from tests.conftest import STUB_TESTS
+
+
+def _build_tests(payload):
+    return test_classes.Test.from_testbed_payload(payload)
+
+
+def _decoded_tests(testbed):
+    # Decode the payload, so its strings are fresh copies
+    return json.loads(json.dumps(STUB_TESTS[testbed]))
+
+
+def test_bulk_constructor_matches_load_from_dict():
+    payload = _decoded_tests("testbed_itav")
+    tests = _build_tests(payload)
+
+    for test, test_dict in zip(tests, payload.values()):
+        loaded = test_classes.Test()
+        loaded.load_from_dict(test_dict)
+        assert test.to_dict().keys() == loaded.to_dict().keys()
+        for attribute in test_classes.Test._FIELDS:
+            if attribute != "test_variables":
+                assert getattr(test, attribute) == getattr(loaded, attribute)
+        assert [v.name for v in test.test_variables] == \
+            [v.name for v in loaded.test_variables]
+        assert test.test_type == "predefined"
+
+
+def test_models_are_slotted():
+    test = _build_tests(_decoded_tests("testbed_itav"))[0]
+    assert not hasattr(test, "__dict__")
+    assert not hasattr(test.test_variables[0], "__dict__")
+
+
+def test_repeated_strings_are_interned():
+    first = _build_tests(_decoded_tests("testbed_itav"))[0]
+    second = _build_tests(_decoded_tests("testbed_itav"))[0]
+
+    for v1, v2 in zip(first.test_variables, second.test_variables):
+        assert v1.name is v2.name
+        assert v1.type is v2.type
+        for o1, o2 in zip(v1.possible_options, v2.possible_options):
+            assert o1 is o2
+
+
+def test_panels_are_memoized():
+    test = _build_tests(_decoded_tests("testbed_itav"))[0]
+
+    assert test.to_panel() is test.to_panel()
+    assert test.to_panel(expand=True) is not test.to_panel()
+    variable = test.test_variables[0]
+    assert variable.to_panel(test.name) is variable.to_panel(test.name)
+
+
+def test_test_case_panel_is_invalidated_on_change():
+    test = _build_tests(_decoded_tests("testbed_itav"))[0]
+    test_case = test_classes.TestCase(test=test, test_case_id=1)
+    test_case.add_test_variable("host1_ip", "10.0.0.1")
+
+    panel = test_case.to_panel()
+    assert test_case.to_panel() is panel
+
+    test_case.add_test_variable("host1_ip", "10.0.0.2")
+    edited_panel = test_case.to_panel()
+    assert edited_panel is not panel
+    assert "10.0.0.2" in edited_panel.renderable
+    assert "10.0.0.1" not in edited_panel.renderable
+
+
+def test_test_panels_are_invalidated_on_change():
+    test = _build_tests(_decoded_tests("testbed_itav"))[0]
+    variable = test.test_variables[1]
+    panel = test.to_panel()
+    variable_panel = variable.to_panel(test.name)
+
+    test.description = "Edited description"
+    variable.possible_options.append("equal")
+
+    edited_panel = test.to_panel()
+    assert edited_panel is not panel
+    assert "Edited description" in edited_panel.renderable
+    edited_variable_panel = variable.to_panel(test.name)
+    assert edited_variable_panel is not variable_panel
+    assert "equal" in edited_variable_panel.renderable
+    assert test.to_panel() is edited_panel
+
+
+def test_panel_columns_are_not_shared():
+    tests = _build_tests(_decoded_tests("testbed_itav"))
+    first = PrintAsPanelColumns([tests[0].to_panel()])
+    second = PrintAsPanelColumns([tests[1].to_panel()])
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        columns = list(executor.map(
+            lambda panels: panels._PrintAsPanelColumns__columns(),
+            [first, second]
+        ))
+
+    assert columns[0].renderables == [tests[0].to_panel()]
+    assert columns[1].renderables == [tests[1].to_panel()]
+    # Sorted once per instance
+    assert first._PrintAsPanelColumns__columns() is columns[0]
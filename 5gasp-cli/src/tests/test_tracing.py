@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 15:10:44
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 15:10:44
+
+import json
+
+from helpers.tracing import Tracer
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+    with tracer.span("noop", "test"):
+        pass
+    assert tracer.events == []
+
+
+def test_chrome_trace_export(tmp_path):
+    tracer = Tracer()
+    tracer.enable()
+
+    @tracer.traced("decorated", "test")
+    def decorated():
+        with tracer.span("nested", "test", size=3):
+            pass
+
+    decorated()
+    trace_filepath = tmp_path / "trace.json"
+    tracer.export(str(trace_filepath))
+
+    with open(trace_filepath) as trace_file:
+        events = json.load(trace_file)["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    metadata = [e for e in events if e["ph"] == "M"]
+
+    assert [s["name"] for s in spans] == ["nested", "decorated"]
+    assert spans[0]["args"] == {"size": "3"}
+    # The nested span is contained in the decorated one
+    assert spans[1]["ts"] <= spans[0]["ts"]
+    assert spans[0]["ts"] + spans[0]["dur"] <= \
+        spans[1]["ts"] + spans[1]["dur"]
+    assert metadata[0]["name"] == "thread_name"
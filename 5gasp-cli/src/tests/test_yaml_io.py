@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+# @Author: Rafael Direito
+# @Date:   2026-10-18 20:38:09
+# @Last Modified by:   Rafael Direito
+# @Last Modified time: 2026-10-18 20:38:09
+
+import importlib
+
+import pytest
+import yaml
+
+from helpers import yaml_io
+from helpers.base_testing_descriptor import new_testing_descriptor
+
+NSD_FILEPATH = "tests/resources/hackfest_multivdu_nsd.yaml"
+
+
+def _testing_descriptor(description):
+    testing_descriptor = new_testing_descriptor()
+    testing_descriptor["test_phases"]["setup"]["testcases"] = [
+        {
+            "testcase_id": 1,
+            "type": "predefined",
+            "name": "bandwidth",
+            "description": description,
+            "parameters": [
+                {"key": "host1_ip",
+                 "value": "{{deployment_info|ns|vnf1|vnf-mgmt-ext}}"},
+                {"key": "threshold", "value": 1.5}
+            ]
+        }
+    ]
+    return testing_descriptor
+
+
+@pytest.mark.parametrize("description", [
+    "Bandwidth between both VNFs",
+    "A long description, " * 10,
+    # Long non-ASCII strings are folded differently by libyaml
+    "Descrição longa, com acentuação: ✓ " * 10,
+    "Multi\nline\n",
+])
+def test_dump_matches_pyyaml(description):
+    testing_descriptor = _testing_descriptor(description)
+    expected = yaml.dump(
+        testing_descriptor,
+        default_flow_style=False,
+        sort_keys=False
+    )
+    assert yaml_io.dump(testing_descriptor) == expected
+
+
+def test_load_matches_pyyaml():
+    with open(NSD_FILEPATH, "r") as nsd_file:
+        nsd = nsd_file.read()
+    assert yaml_io.load(nsd) == yaml.safe_load(nsd)
+
+
+def test_fallback_without_libyaml(monkeypatch):
+    monkeypatch.delattr(yaml, "CSafeLoader")
+    try:
+        importlib.reload(yaml_io)
+        assert not yaml_io.LIBYAML
+        assert yaml_io.SafeLoader is yaml.SafeLoader
+        test_load_matches_pyyaml()
+        test_dump_matches_pyyaml("A long description, " * 10)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(yaml_io)